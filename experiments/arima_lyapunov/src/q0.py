@@ -0,0 +1,60 @@
+import time
+
+import fire
+import numpy as np
+import pandas as pd
+from statsforecast.arima import getQ0, getQ0_lyapunov
+
+
+def seasonal_arma(period: int):
+    """Expanded AR and MA polynomials of an ARIMA(1, 0, 1)(1, 0, 1) with the given period."""
+    phi = np.zeros(period + 1)
+    phi[0] = 0.5
+    phi[period - 1] += 0.4
+    phi[period] = -0.5 * 0.4
+    theta = np.zeros(period + 1)
+    theta[0] = 0.3
+    theta[period - 1] += -0.3
+    theta[period] = 0.3 * -0.3
+    return phi, theta
+
+
+def residual(Q0, phi, theta):
+    """Relative residual of the Lyapunov equation Q0 = T Q0 T' + R R'."""
+    r = Q0.shape[0]
+    T = np.zeros((r, r))
+    T[:len(phi), 0] = phi
+    T[np.arange(r - 1), np.arange(1, r)] = 1
+    R = np.append(1, theta)[:, None]
+    return np.abs(Q0 - T @ Q0 @ T.T - R @ R.T).max() / np.abs(Q0).max()
+
+
+def best_time(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        res = fn()
+        times.append(time.perf_counter() - start)
+    return res, min(times)
+
+
+def main(periods: str = '4,12,24,52,168', repeats: int = 5):
+    rows = []
+    for period in map(int, str(periods).split(',')):
+        phi, theta = seasonal_arma(period)
+        reps = 1 if period > 100 else repeats
+        gardner, gardner_time = best_time(lambda: getQ0(phi, theta), reps)
+        lyapunov, lyapunov_time = best_time(lambda: getQ0_lyapunov(phi, theta), reps)
+        rows.append({
+            'period': period,
+            'r': gardner.shape[0],
+            'Gardner1980 (ms)': 1e3 * gardner_time,
+            'Lyapunov (ms)': 1e3 * lyapunov_time,
+            'Gardner1980 residual': residual(gardner, phi, theta),
+            'Lyapunov residual': residual(lyapunov, phi, theta),
+        })
+    print(pd.DataFrame(rows).to_markdown(index=False, floatfmt='.2g'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,51 @@
+import time
+
+import fire
+import numpy as np
+import pandas as pd
+import statsforecast.arima
+from statsforecast.arima import arima
+
+
+def count_evaluations():
+    """Wraps the scipy optimizer used by `arima` to count the objective evaluations."""
+    minimize = statsforecast.arima.minimize
+    nfev = []
+
+    def counted(*args, **kwargs):
+        res = minimize(*args, **kwargs)
+        nfev.append(res.nfev)
+        return res
+
+    statsforecast.arima.minimize = counted
+    return nfev
+
+
+def main(length: int = 500, n_regressors: str = '10,50,100', repeats: int = 5, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    nfev = count_evaluations()
+    rows = []
+    for k in map(int, str(n_regressors).split(',')):
+        X = rng.normal(size=(length, k))
+        noise = np.zeros(length)
+        eps = rng.normal(size=length)
+        for t in range(1, length):
+            noise[t] = 0.5 * noise[t - 1] + eps[t] + 0.3 * eps[t - 1]
+        y = X @ rng.normal(size=k) + noise
+        times = []
+        for _ in range(repeats):
+            nfev.clear()
+            start = time.perf_counter()
+            arima(y, order=(1, 0, 1), xreg=X, method='CSS-ML')
+            times.append(time.perf_counter() - start)
+        rows.append({
+            'regressors': k,
+            'fit time (ms)': 1e3 * np.min(times),
+            'evaluations': sum(nfev),
+            'us per evaluation': 1e6 * np.min(times) / sum(nfev),
+        })
+    print(pd.DataFrame(rows).to_markdown(index=False, floatfmt='.1f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
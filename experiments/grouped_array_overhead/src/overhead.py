@@ -0,0 +1,73 @@
+import time
+
+import fire
+import numpy as np
+import pandas as pd
+from statsforecast.core import GroupedArray
+
+
+class Constant:
+    """Model that does no work, so that the measured time is
+    the bookkeeping done by GroupedArray for each serie."""
+
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __repr__(self):
+        return self.alias
+
+    def new(self):
+        return Constant(self.alias)
+
+    def _output(self, h, level, y=None, fitted=False):
+        res = {'mean': np.zeros(h)}
+        if fitted:
+            res['fitted'] = y
+        for lv in level or []:
+            res[f'lo-{lv}'] = np.zeros(h)
+            res[f'hi-{lv}'] = np.zeros(h)
+        return res
+
+    def fit(self, y, X=None):
+        return self
+
+    def predict(self, h, X=None, level=None):
+        return self._output(h, level)
+
+    def forecast(self, y, h, X=None, X_future=None, fitted=False, level=None):
+        return self._output(h, level, y, fitted)
+
+
+def main(n_series: int = 10_000, n_models: int = 3, length: int = 50, h: int = 7, repeats: int = 5):
+    ga = GroupedArray(
+        np.random.rand(n_series * length),
+        np.arange(0, (n_series + 1) * length, length, dtype=np.int64),
+    )
+    models = [Constant(f'Constant{i}') for i in range(n_models)]
+    fm = ga.fit(models)
+    level = [80, 95]
+    methods = {
+        'forecast': lambda: ga.forecast(models=models, h=h),
+        'forecast (level, fitted)': lambda: ga.forecast(models=models, h=h, level=level, fitted=True),
+        'predict (level)': lambda: ga.predict(fm=fm, h=h, level=level),
+        'cross_validation (3 windows)': lambda: ga.cross_validation(
+            models=models, h=h, test_size=3 * h, step_size=h
+        ),
+    }
+    rows = []
+    for name, fn in methods.items():
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        rows.append({
+            'method': name,
+            'time (s)': np.min(times),
+            'us per serie and model': 1e6 * np.min(times) / (n_series * n_models),
+        })
+    print(pd.DataFrame(rows).to_markdown(index=False, floatfmt='.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
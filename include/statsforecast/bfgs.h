@@ -0,0 +1,168 @@
+#pragma once
+
+#include <cmath>
+#include <limits>
+#include <tuple>
+
+#include <Eigen/Dense>
+
+namespace bfgs {
+using Eigen::MatrixXd;
+using Eigen::VectorXd;
+
+// Central finite differences, as used by R's optim when no gradient is given.
+template <typename Func>
+VectorXd Gradient(Func &F, const VectorXd &x, double ndeps) {
+  VectorXd g(x.size());
+  VectorXd xe = x;
+  for (Eigen::Index i = 0; i < x.size(); ++i) {
+    xe(i) = x(i) + ndeps;
+    double f1 = F(xe);
+    xe(i) = x(i) - ndeps;
+    double f2 = F(xe);
+    xe(i) = x(i);
+    g(i) = (f1 - f2) / (2 * ndeps);
+  }
+  return g;
+}
+
+// Second order central differences of the function values.
+template <typename Func>
+MatrixXd Hessian(Func &F, const VectorXd &x, double ndeps) {
+  auto n = x.size();
+  MatrixXd H(n, n);
+  VectorXd xe = x;
+  double f0 = F(x);
+  double h2 = ndeps * ndeps;
+  for (Eigen::Index i = 0; i < n; ++i) {
+    xe(i) = x(i) + ndeps;
+    double fp = F(xe);
+    xe(i) = x(i) - ndeps;
+    double fm = F(xe);
+    H(i, i) = (fp - 2 * f0 + fm) / h2;
+    for (Eigen::Index j = 0; j < i; ++j) {
+      xe(i) = x(i) + ndeps;
+      xe(j) = x(j) + ndeps;
+      double fpp = F(xe);
+      xe(j) = x(j) - ndeps;
+      double fpm = F(xe);
+      xe(i) = x(i) - ndeps;
+      double fmm = F(xe);
+      xe(j) = x(j) + ndeps;
+      double fmp = F(xe);
+      xe(j) = x(j);
+      H(i, j) = H(j, i) = (fpp - fpm - fmp + fmm) / (4 * h2);
+    }
+    xe(i) = x(i);
+  }
+  return H;
+}
+
+// Variable metric minimizer, a port of R's vmmin.
+// Returns the minimizer, the minimum, a status code (0: converged,
+// 1: max_iter reached, 2: non-finite gradient, 3: non-finite initial value)
+// and the approximation to the inverse Hessian.
+template <typename Func>
+std::tuple<VectorXd, double, int, MatrixXd>
+Minimize(Func &F, const VectorXd &x0, int max_iter, double reltol,
+         double ndeps) {
+  constexpr double stepredn = 0.2;
+  constexpr double acctol = 0.0001;
+  constexpr double reltest = 10.0;
+  auto n = x0.size();
+  VectorXd b = x0;
+  MatrixXd B = MatrixXd::Identity(n, n);
+  double f = F(b);
+  if (!std::isfinite(f)) {
+    return {b, f, 3, B};
+  }
+  if (max_iter <= 0) {
+    return {b, f, 0, B};
+  }
+  double fmin = f;
+  VectorXd g = Gradient(F, b, ndeps);
+  if (!g.allFinite()) {
+    return {b, fmin, 2, B};
+  }
+  int iter = 1;
+  int gradcount = 1;
+  int ilast = gradcount;
+  Eigen::Index count;
+  VectorXd X(n), c(n), t(n);
+  do {
+    if (ilast == gradcount) {
+      B.setIdentity();
+    }
+    X = b;
+    c = g;
+    t = -B * g;
+    double gradproj = t.dot(g);
+    if (gradproj < 0.0) {
+      double steplength = 1.0;
+      bool accpoint = false;
+      do {
+        count = 0;
+        for (Eigen::Index i = 0; i < n; ++i) {
+          b(i) = X(i) + steplength * t(i);
+          if (reltest + X(i) == reltest + b(i)) {
+            count++;
+          }
+        }
+        if (count < n) {
+          f = F(b);
+          accpoint =
+              std::isfinite(f) && (f <= fmin + gradproj * steplength * acctol);
+          if (!accpoint) {
+            steplength *= stepredn;
+          }
+        }
+      } while (!(count == n || accpoint));
+      bool enough = std::fabs(f - fmin) > reltol * (std::fabs(fmin) + reltol);
+      if (!enough) {
+        count = n;
+        fmin = f;
+      }
+      if (count < n) {
+        fmin = f;
+        g = Gradient(F, b, ndeps);
+        if (!g.allFinite()) {
+          return {b, fmin, 2, B};
+        }
+        gradcount++;
+        iter++;
+        t *= steplength;
+        c = g - c;
+        double D1 = t.dot(c);
+        if (D1 > 0) {
+          X = B * c;
+          double D2 = 1.0 + X.dot(c) / D1;
+          B += (D2 * t * t.transpose() - X * t.transpose() -
+                t * X.transpose()) /
+               D1;
+        } else {
+          ilast = gradcount;
+        }
+      } else {
+        if (ilast < gradcount) {
+          count = 0;
+          ilast = gradcount;
+        }
+      }
+    } else {
+      count = 0;
+      if (ilast == gradcount) {
+        count = n;
+      } else {
+        ilast = gradcount;
+      }
+    }
+    if (iter >= max_iter) {
+      break;
+    }
+    if (gradcount - ilast > 2 * n) {
+      ilast = gradcount;
+    }
+  } while (count != n || ilast != gradcount);
+  return {b, fmin, iter < max_iter ? 0 : 1, B};
+}
+} // namespace bfgs
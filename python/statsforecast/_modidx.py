@@ -32,6 +32,11 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/arima.py'),
                                      'statsforecast.arima.AutoARIMA.summary': ( 'src/arima.html#autoarima.summary',
                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._cache_diff_tests': ( 'src/arima.html#_cache_diff_tests',
+                                                                                'statsforecast/arima.py'),
+                                     'statsforecast.arima._fit_models': ('src/arima.html#_fit_models', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._init_from_coef': ('src/arima.html#_init_from_coef', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._search_executor': ('src/arima.html#_search_executor', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima': ('src/arima.html#arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima2': ('src/arima.html#arima2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_css': ('src/arima.html#arima_css', 'statsforecast/arima.py'),
@@ -51,10 +56,14 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.fixed_params_from_dict': ( 'src/arima.html#fixed_params_from_dict',
                                                                                      'statsforecast/arima.py'),
                                      'statsforecast.arima.forecast_arima': ('src/arima.html#forecast_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.forecast_arima_batch': ( 'src/arima.html#forecast_arima_batch',
+                                                                                   'statsforecast/arima.py'),
                                      'statsforecast.arima.forward_arima': ('src/arima.html#forward_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.getQ0': ('src/arima.html#getq0', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.getQ0_lyapunov': ('src/arima.html#getq0_lyapunov', 'statsforecast/arima.py'),
                                      'statsforecast.arima.is_constant': ('src/arima.html#is_constant', 'statsforecast/arima.py'),
                                      'statsforecast.arima.kalman_forecast': ('src/arima.html#kalman_forecast', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.kpss': ('src/arima.html#kpss', 'statsforecast/arima.py'),
                                      'statsforecast.arima.make_arima': ('src/arima.html#make_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.myarima': ('src/arima.html#myarima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.ndiffs': ('src/arima.html#ndiffs', 'statsforecast/arima.py'),
@@ -64,7 +73,9 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.print_statsforecast_ARIMA': ( 'src/arima.html#print_statsforecast_arima',
                                                                                         'statsforecast/arima.py'),
                                      'statsforecast.arima.search_arima': ('src/arima.html#search_arima', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py')},
+                                     'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl': ('src/arima.html#stl', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.update_arima': ('src/arima.html#update_arima', 'statsforecast/arima.py')},
             'statsforecast.ces': { 'statsforecast.ces._simulate_pred_intervals': ( 'src/ces.html#_simulate_pred_intervals',
                                                                                    'statsforecast/ces.py'),
                                    'statsforecast.ces.auto_ces': ('src/ces.html#auto_ces', 'statsforecast/ces.py'),
@@ -87,6 +98,8 @@ d = { 'settings': { 'branch': 'main',
             'statsforecast.core': { 'statsforecast.core.GroupedArray': ('src/core/core.html#groupedarray', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__eq__': ( 'src/core/core.html#groupedarray.__eq__',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._forecast_batch': ( 'src/core/core.html#groupedarray._forecast_batch',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._get_cols': ( 'src/core/core.html#groupedarray._get_cols',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._output_fcst': ( 'src/core/core.html#groupedarray._output_fcst',
@@ -101,6 +114,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._single_threaded_predict': ( 'src/core/core.html#groupedarray._single_threaded_predict',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._slice': ( 'src/core/core.html#groupedarray._slice',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.cross_validation': ( 'src/core/core.html#groupedarray.cross_validation',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.fit': ('src/core/core.html#groupedarray.fit', 'statsforecast/core.py'),
@@ -130,41 +145,126 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast.forecast_fitted_values': ( 'src/core/core.html#statsforecast.forecast_fitted_values',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk': ( 'src/core/core.html#_groupedarraychunk',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.__init__': ( 'src/core/core.html#_groupedarraychunk.__init__',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._call': ( 'src/core/core.html#_groupedarraychunk._call',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._single_threaded_cross_validation': ( 'src/core/core.html#_groupedarraychunk._single_threaded_cross_validation',
+                                                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._single_threaded_fit': ( 'src/core/core.html#_groupedarraychunk._single_threaded_fit',
+                                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._single_threaded_fit_predict': ( 'src/core/core.html#_groupedarraychunk._single_threaded_fit_predict',
+                                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._single_threaded_forecast': ( 'src/core/core.html#_groupedarraychunk._single_threaded_forecast',
+                                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._single_threaded_predict': ( 'src/core/core.html#_groupedarraychunk._single_threaded_predict',
+                                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.load': ( 'src/core/core.html#_groupedarraychunk.load',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray': ('src/core/core.html#_sharedarray', 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.__getstate__': ( 'src/core/core.html#_sharedarray.__getstate__',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.__init__': ( 'src/core/core.html#_sharedarray.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.__setstate__': ( 'src/core/core.html#_sharedarray.__setstate__',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray._apply': ( 'src/core/core.html#_sharedarray._apply',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.from_array': ( 'src/core/core.html#_sharedarray.from_array',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.read': ( 'src/core/core.html#_sharedarray.read',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.unlink': ( 'src/core/core.html#_sharedarray.unlink',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArray.write': ( 'src/core/core.html#_sharedarray.write',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._SharedGroupedArray': ( 'src/core/core.html#_sharedgroupedarray',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._SharedGroupedArray.__init__': ( 'src/core/core.html#_sharedgroupedarray.__init__',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._SharedGroupedArray.split': ( 'src/core/core.html#_sharedgroupedarray.split',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._SharedGroupedArray.unlink': ( 'src/core/core.html#_sharedgroupedarray.unlink',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager': ( 'src/core/core.html#_sharedmemorymanager',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager.__enter__': ( 'src/core/core.html#_sharedmemorymanager.__enter__',
+                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager.__exit__': ( 'src/core/core.html#_sharedmemorymanager.__exit__',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager.__init__': ( 'src/core/core.html#_sharedmemorymanager.__init__',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager.empty': ( 'src/core/core.html#_sharedmemorymanager.empty',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._SharedMemoryManager.grouped_array': ( 'src/core/core.html#_sharedmemorymanager.grouped_array',
+                                                                                               'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast': ('src/core/core.html#_statsforecast', 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__enter__': ( 'src/core/core.html#_statsforecast.__enter__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__exit__': ( 'src/core/core.html#_statsforecast.__exit__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__getstate__': ( 'src/core/core.html#_statsforecast.__getstate__',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__init__': ( 'src/core/core.html#_statsforecast.__init__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__repr__': ( 'src/core/core.html#_statsforecast.__repr__',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__setstate__': ( 'src/core/core.html#_statsforecast.__setstate__',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._chunk_idxs': ( 'src/core/core.html#_statsforecast._chunk_idxs',
+                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._cross_validation_parallel': ( 'src/core/core.html#_statsforecast._cross_validation_parallel',
                                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_parallel': ( 'src/core/core.html#_statsforecast._fit_parallel',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_predict_parallel': ( 'src/core/core.html#_statsforecast._fit_predict_parallel',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_chunks': ( 'src/core/core.html#_statsforecast._forecast_chunks',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_iter': ( 'src/core/core.html#_statsforecast._forecast_iter',
+                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_parallel': ( 'src/core/core.html#_statsforecast._forecast_parallel',
                                                                                               'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_cap_size': ( 'src/core/core.html#_statsforecast._get_cap_size',
                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_executor': ( 'src/core/core.html#_statsforecast._get_executor',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_gas_Xs': ( 'src/core/core.html#_statsforecast._get_gas_xs',
                                                                                        'statsforecast/core.py'),
-                                    'statsforecast.core._StatsForecast._get_pool': ( 'src/core/core.html#_statsforecast._get_pool',
-                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._make_future_df': ( 'src/core/core.html#_statsforecast._make_future_df',
                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._n_chunks': ( 'src/core/core.html#_statsforecast._n_chunks',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._parse_X_level': ( 'src/core/core.html#_statsforecast._parse_x_level',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._predict_parallel': ( 'src/core/core.html#_statsforecast._predict_parallel',
                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._prepare_fit': ( 'src/core/core.html#_statsforecast._prepare_fit',
                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._series_costs': ( 'src/core/core.html#_statsforecast._series_costs',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._set_prediction_intervals': ( 'src/core/core.html#_statsforecast._set_prediction_intervals',
                                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._shared_memory': ( 'src/core/core.html#_statsforecast._shared_memory',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._split': ( 'src/core/core.html#_statsforecast._split',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._submit_forecast': ( 'src/core/core.html#_statsforecast._submit_forecast',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._threaded': ( 'src/core/core.html#_statsforecast._threaded',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_exog': ( 'src/core/core.html#_statsforecast._validate_exog',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_model_names': ( 'src/core/core.html#_statsforecast._validate_model_names',
                                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_sizes_for_prediction_intervals': ( 'src/core/core.html#_statsforecast._validate_sizes_for_prediction_intervals',
                                                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._warm_start_fm': ( 'src/core/core.html#_statsforecast._warm_start_fm',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.close': ( 'src/core/core.html#_statsforecast.close',
+                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation': ( 'src/core/core.html#_statsforecast.cross_validation',
                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation_fitted_values': ( 'src/core/core.html#_statsforecast.cross_validation_fitted_values',
@@ -177,6 +277,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast_fitted_values': ( 'src/core/core.html#_statsforecast.forecast_fitted_values',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_iter': ( 'src/core/core.html#_statsforecast.forecast_iter',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_parquet': ( 'src/core/core.html#_statsforecast.forecast_parquet',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.load': ( 'src/core/core.html#_statsforecast.load',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.plot': ( 'src/core/core.html#_statsforecast.plot',
@@ -186,12 +290,20 @@ d = { 'settings': { 'branch': 'main',
                                     'statsforecast.core._StatsForecast.save': ( 'src/core/core.html#_statsforecast.save',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._get_n_jobs': ('src/core/core.html#_get_n_jobs', 'statsforecast/core.py'),
+                                    'statsforecast.core._has_level': ('src/core/core.html#_has_level', 'statsforecast/core.py'),
                                     'statsforecast.core._id_as_idx': ('src/core/core.html#_id_as_idx', 'statsforecast/core.py'),
+                                    'statsforecast.core._maybe_load': ('src/core/core.html#_maybe_load', 'statsforecast/core.py'),
                                     'statsforecast.core._maybe_warn_sort_df': ( 'src/core/core.html#_maybe_warn_sort_df',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._output_layout': ('src/core/core.html#_output_layout', 'statsforecast/core.py'),
+                                    'statsforecast.core._series_batches': ('src/core/core.html#_series_batches', 'statsforecast/core.py'),
+                                    'statsforecast.core._split_idxs': ('src/core/core.html#_split_idxs', 'statsforecast/core.py'),
+                                    'statsforecast.core._supports_forecast_batch': ( 'src/core/core.html#_supports_forecast_batch',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._warn_df_constructor': ( 'src/core/core.html#_warn_df_constructor',
                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._warn_id_as_idx': ('src/core/core.html#_warn_id_as_idx', 'statsforecast/core.py'),
+                                    'statsforecast.core._write_output': ('src/core/core.html#_write_output', 'statsforecast/core.py'),
                                     'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py')},
             'statsforecast.distributed.fugue': { 'statsforecast.distributed.fugue.FugueBackend': ( 'src/core/distributed.fugue.html#fuguebackend',
                                                                                                    'statsforecast/distributed/fugue.py'),
@@ -239,6 +351,15 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets._compute_pred_intervals': ( 'src/ets.html#_compute_pred_intervals',
                                                                                   'statsforecast/ets.py'),
                                    'statsforecast.ets._compute_sigmah': ('src/ets.html#_compute_sigmah', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._compute_sigmah_batch': ( 'src/ets.html#_compute_sigmah_batch',
+                                                                                'statsforecast/ets.py'),
+                                   'statsforecast.ets._compute_sigmah_rows': ('src/ets.html#_compute_sigmah_rows', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._ets_class': ('src/ets.html#_ets_class', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._ets_method': ('src/ets.html#_ets_method', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._fitted_etsmodel': ('src/ets.html#_fitted_etsmodel', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._init_etsmodel': ('src/ets.html#_init_etsmodel', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._last_state': ('src/ets.html#_last_state', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._optimize_args': ('src/ets.html#_optimize_args', 'statsforecast/ets.py'),
                                    'statsforecast.ets.admissible': ('src/ets.html#admissible', 'statsforecast/ets.py'),
                                    'statsforecast.ets.check_param': ('src/ets.html#check_param', 'statsforecast/ets.py'),
                                    'statsforecast.ets.ets_f': ('src/ets.html#ets_f', 'statsforecast/ets.py'),
@@ -246,17 +367,23 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.etsmodel': ('src/ets.html#etsmodel', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etssimulate': ('src/ets.html#etssimulate', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forecast_ets': ('src/ets.html#forecast_ets', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.forecast_ets_batch': ('src/ets.html#forecast_ets_batch', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forward_ets': ('src/ets.html#forward_ets', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.forward_windows_ets': ('src/ets.html#forward_windows_ets', 'statsforecast/ets.py'),
                                    'statsforecast.ets.fourier': ('src/ets.html#fourier', 'statsforecast/ets.py'),
                                    'statsforecast.ets.initparam': ('src/ets.html#initparam', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.initseason': ('src/ets.html#initseason', 'statsforecast/ets.py'),
                                    'statsforecast.ets.initstate': ('src/ets.html#initstate', 'statsforecast/ets.py'),
                                    'statsforecast.ets.is_constant': ('src/ets.html#is_constant', 'statsforecast/ets.py'),
                                    'statsforecast.ets.optimize_ets_target_fn': ( 'src/ets.html#optimize_ets_target_fn',
                                                                                  'statsforecast/ets.py'),
                                    'statsforecast.ets.pegelsfcast_C': ('src/ets.html#pegelsfcast_c', 'statsforecast/ets.py'),
                                    'statsforecast.ets.pegelsresid_C': ('src/ets.html#pegelsresid_c', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.select_etsmodel': ('src/ets.html#select_etsmodel', 'statsforecast/ets.py'),
                                    'statsforecast.ets.switch': ('src/ets.html#switch', 'statsforecast/ets.py'),
-                                   'statsforecast.ets.switch_criterion': ('src/ets.html#switch_criterion', 'statsforecast/ets.py')},
+                                   'statsforecast.ets.switch_criterion': ('src/ets.html#switch_criterion', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.switch_ic': ('src/ets.html#switch_ic', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.update_ets': ('src/ets.html#update_ets', 'statsforecast/ets.py')},
             'statsforecast.feature_engineering': { 'statsforecast.feature_engineering.mstl_decomposition': ( 'src/feature_engineering.html#mstl_decomposition',
                                                                                                              'statsforecast/feature_engineering.py')},
             'statsforecast.garch': { 'statsforecast.garch.garch_cons': ('src/garch.html#garch_cons', 'statsforecast/garch.py'),
@@ -325,18 +452,25 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.ARIMA': ('src/core/models.html#arima', 'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.__init__': ( 'src/core/models.html#arima.__init__',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.batchable': ( 'src/core/models.html#arima.batchable',
+                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.fit': ('src/core/models.html#arima.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.forecast': ( 'src/core/models.html#arima.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.forecast_batch': ( 'src/core/models.html#arima.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.forward': ( 'src/core/models.html#arima.forward',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.predict': ( 'src/core/models.html#arima.predict',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.predict_in_sample': ( 'src/core/models.html#arima.predict_in_sample',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.update': ('src/core/models.html#arima.update', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA': ('src/core/models.html#autoarima', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__init__': ( 'src/core/models.html#autoarima.__init__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA._init_model': ( 'src/core/models.html#autoarima._init_model',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.fit': ( 'src/core/models.html#autoarima.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.forecast': ( 'src/core/models.html#autoarima.forecast',
@@ -347,6 +481,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.predict_in_sample': ( 'src/core/models.html#autoarima.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.update': ( 'src/core/models.html#autoarima.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES': ('src/core/models.html#autoces', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__init__': ( 'src/core/models.html#autoces.__init__',
                                                                                  'statsforecast/models.py'),
@@ -365,12 +501,18 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.AutoETS.fit': ('src/core/models.html#autoets.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.forecast': ( 'src/core/models.html#autoets.forecast',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.forecast_batch': ( 'src/core/models.html#autoets.forecast_batch',
+                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.forward': ( 'src/core/models.html#autoets.forward',
                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.forward_windows': ( 'src/core/models.html#autoets.forward_windows',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.predict': ( 'src/core/models.html#autoets.predict',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.predict_in_sample': ( 'src/core/models.html#autoets.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.update': ( 'src/core/models.html#autoets.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoMFLES': ('src/core/models.html#automfles', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoMFLES.__init__': ( 'src/core/models.html#automfles.__init__',
                                                                                    'statsforecast/models.py'),
@@ -481,6 +623,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.forecast': ( 'src/core/models.html#historicaverage.forecast',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage.forecast_batch': ( 'src/core/models.html#historicaverage.forecast_batch',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict': ( 'src/core/models.html#historicaverage.predict',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict_in_sample': ( 'src/core/models.html#historicaverage.predict_in_sample',
@@ -531,6 +675,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.Naive.fit': ('src/core/models.html#naive.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forecast': ( 'src/core/models.html#naive.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.Naive.forecast_batch': ( 'src/core/models.html#naive.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forward': ( 'src/core/models.html#naive.forward',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.Naive.predict': ( 'src/core/models.html#naive.predict',
@@ -549,6 +695,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.forecast': ( 'src/core/models.html#randomwalkwithdrift.forecast',
                                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift.forecast_batch': ( 'src/core/models.html#randomwalkwithdrift.forecast_batch',
+                                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict': ( 'src/core/models.html#randomwalkwithdrift.predict',
                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict_in_sample': ( 'src/core/models.html#randomwalkwithdrift.predict_in_sample',
@@ -585,6 +733,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.forecast': ( 'src/core/models.html#seasonalnaive.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive.forecast_batch': ( 'src/core/models.html#seasonalnaive.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict': ( 'src/core/models.html#seasonalnaive.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict_in_sample': ( 'src/core/models.html#seasonalnaive.predict_in_sample',
@@ -597,6 +747,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.forecast': ( 'src/core/models.html#seasonalwindowaverage.forecast',
                                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalWindowAverage.forecast_batch': ( 'src/core/models.html#seasonalwindowaverage.forecast_batch',
+                                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict': ( 'src/core/models.html#seasonalwindowaverage.predict',
                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict_in_sample': ( 'src/core/models.html#seasonalwindowaverage.predict_in_sample',
@@ -666,6 +818,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.forecast': ( 'src/core/models.html#windowaverage.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage.forecast_batch': ( 'src/core/models.html#windowaverage.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict': ( 'src/core/models.html#windowaverage.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict_in_sample': ( 'src/core/models.html#windowaverage.predict_in_sample',
@@ -690,7 +844,11 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._add_fitted_pi': ( 'src/core/models.html#_add_fitted_pi',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._add_grouped_intervals': ( 'src/core/models.html#_add_grouped_intervals',
+                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._adida': ('src/core/models.html#_adida', 'statsforecast/models.py'),
+                                      'statsforecast.models._check_batch_intervals': ( 'src/core/models.html#_check_batch_intervals',
+                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._chunk_forecast': ( 'src/core/models.html#_chunk_forecast',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models._chunk_sums': ('src/core/models.html#_chunk_sums', 'statsforecast/models.py'),
@@ -706,6 +864,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models._get_conformal_method': ( 'src/core/models.html#_get_conformal_method',
                                                                                       'statsforecast/models.py'),
+                                      'statsforecast.models._grouped_sigma': ( 'src/core/models.html#_grouped_sigma',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._historic_average': ( 'src/core/models.html#_historic_average',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models._imapa': ('src/core/models.html#_imapa', 'statsforecast/models.py'),
@@ -719,6 +879,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._probability': ('src/core/models.html#_probability', 'statsforecast/models.py'),
                                       'statsforecast.models._random_walk_with_drift': ( 'src/core/models.html#_random_walk_with_drift',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._reduce_by_size': ( 'src/core/models.html#_reduce_by_size',
+                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_exponential_smoothing': ( 'src/core/models.html#_seasonal_exponential_smoothing',
                                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_ses_optimized': ( 'src/core/models.html#_seasonal_ses_optimized',
@@ -5,10 +5,15 @@ __all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'a
            'ARIMASummary', 'AutoARIMA']
 
 # %% ../../nbs/src/arima.ipynb 5
+import hashlib
 import math
+import os
+import threading
 import warnings
-from collections import namedtuple
-from functools import partial
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial, wraps
 from typing import Optional, Dict, Union, Tuple
 
 import numpy as np
@@ -19,7 +24,6 @@ from scipy.signal import convolve
 from scipy.stats import norm
 
 from ._lib import arima as _arima
-from .mstl import mstl
 
 # %% ../../nbs/src/arima.ipynb 7
 OptimResult = namedtuple("OptimResult", "success status x fun hess_inv")
@@ -52,17 +56,32 @@ def getQ0(phi, theta):
     _arima.getQ0(phi, theta, res)
     return res.reshape(r, r)
 
-# %% ../../nbs/src/arima.ipynb 16
+
+def getQ0_lyapunov(phi, theta):
+    """Same as `getQ0` solving the discrete Lyapunov equation with the doubling algorithm.
+
+    Each step costs O(r^3) instead of the O(r^4) time and memory of Gardner's method,
+    which makes it much faster for long seasonal periods."""
+    p = len(phi)
+    q = len(theta)
+    r = max(p, q + 1)
+    res = np.zeros(r * r, dtype=np.float64)
+    _arima.getQ0_lyapunov(phi, theta, res)
+    return res.reshape(r, r)
+
+# %% ../../nbs/src/arima.ipynb 17
 def arima_transpar(params_in, arma, trans):
     # TODO check trans=True results
     return _arima.arima_transpar(params_in, arma, trans)
 
-# %% ../../nbs/src/arima.ipynb 19
+# %% ../../nbs/src/arima.ipynb 20
 def arima_css(y, arma, phi, theta):
     return _arima.arima_css(y, arma, phi, theta)
 
-# %% ../../nbs/src/arima.ipynb 21
-def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
+# %% ../../nbs/src/arima.ipynb 22
+def make_arima(
+    phi, theta, delta, kappa=1e6, SSinit="Gardner1980", tol=np.finfo(float).eps
+):
     # check nas phi
     # check nas theta
     p = len(phi)
@@ -97,7 +116,9 @@ def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     P = np.zeros((rd, rd))
 
     if r > 1:
-        Pn[:r, :r] = getQ0(phi, theta)
+        Pn[:r, :r] = (
+            getQ0_lyapunov(phi, theta) if SSinit == "Lyapunov" else getQ0(phi, theta)
+        )
     else:
         Pn[0, 0] = 1 / (1 - phi[0] ** 2) if p > 0 else 1.0
 
@@ -118,7 +139,7 @@ def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
         "Pn": Pn,
     }
 
-# %% ../../nbs/src/arima.ipynb 23
+# %% ../../nbs/src/arima.ipynb 24
 def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
     if use_resid:
         rsResid = np.empty_like(y)
@@ -140,7 +161,7 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
         rsResid = None
     return ssq, sumlog, nu, rsResid
 
-# %% ../../nbs/src/arima.ipynb 25
+# %% ../../nbs/src/arima.ipynb 26
 def diff(x, lag, differences):
     x = np.asarray(x, dtype=np.float64)
     y = x.copy()
@@ -151,7 +172,7 @@ def diff(x, lag, differences):
     nans = lag * differences
     return y[nans:]
 
-# %% ../../nbs/src/arima.ipynb 26
+# %% ../../nbs/src/arima.ipynb 27
 def fixed_params_from_dict(
     fixed_dict: dict, order: tuple, seasonal: dict, intercept: bool, n_ex: int
 ):
@@ -175,7 +196,7 @@ def fixed_params_from_dict(
     )  # prevent adding non-existing keys
     return list(full_dict.values())
 
-# %% ../../nbs/src/arima.ipynb 28
+# %% ../../nbs/src/arima.ipynb 29
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -192,28 +213,10 @@ def arima(
     tol=1e-8,
     optim_control={"maxiter": 100},
 ):
-    SSG = SSinit == "Gardner1980"
+    if SSinit not in ("Gardner1980", "Lyapunov") and method != "CSS":
+        raise NotImplementedError(f"SSinit={SSinit!r}")
     x = x.astype(np.float64, copy=True)
 
-    def upARIMA(mod, phi, theta):
-        p = len(phi)
-        q = len(theta)
-        mod["phi"] = phi
-        mod["theta"] = theta
-        r = max(p, q + 1)
-        if p > 0:
-            mod["T"][:p, 0] = phi
-        if r > 1:
-            if SSG:
-                mod["Pn"][:r, :r] = getQ0(phi, theta)
-            else:
-                raise NotImplementedError('SSinit != "Gardner1980"')
-                # mod['Pn'][:r, :r] = getQ0bis(phi, theta, tol=0)
-        else:
-            mod["Pn"][0, 0] = 1 / (1 - phi[0] ** 2) if p > 0 else 1
-        mod["a"][:] = 0  # a es vector?
-        return mod
-
     def arimaSS(y, mod):
         # arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid)
         return arima_like(
@@ -228,35 +231,6 @@ def arima(
             True,
         )
 
-    def armafn(p, x, trans):
-        x = x.copy()
-        par = coef.copy()
-        par[mask] = p
-        trarma = arima_transpar(par, arma, trans)
-        Z = upARIMA(mod, trarma[0], trarma[1])
-        if Z is None:
-            return np.finfo(np.float64).max
-        if ncxreg > 0:
-            x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
-        res = arima_like(
-            x,
-            Z["phi"],
-            Z["theta"],
-            Z["delta"],
-            Z["a"],
-            Z["P"],
-            Z["Pn"],
-            0,
-            False,
-        )
-        if res[2] == 0.0:
-            return math.inf
-
-        s2 = res[0] / res[2]
-        if s2 <= 0:
-            return math.nan
-        return 0.5 * (math.log(s2) + res[1] / res[2])
-
     def arCheck(ar):
         p = np.argmax(np.append(1, -ar) != 0)
         if not p:
@@ -442,38 +416,59 @@ def arima(
     else:
         init = init0
 
-    def arma_css_op(p, x):
-        x = x.copy()
-        par = coef.copy()
-        par[mask] = p
-        phi, theta = arima_transpar(par, arma, False)
-
-        if ncxreg > 0:
-            x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
-
-        res, _ = arima_css(x, arma, phi, theta)
-        if math.isinf(res):
-            import sys
+    def arma_objective(use_css):
+        # the regression residuals, the filter and the objective are computed in the extension.
+        # The state of the filter is kept between evaluations, as the scipy path always did
+        return _arima.ArimaObjective(
+            coef,
+            mask,
+            x,
+            xreg if ncxreg > 0 else np.empty((x.size, 0)),
+            arma,
+            Delta,
+            kappa,
+            transform_pars and not use_css,
+            use_css,
+            False,
+            SSinit == "Lyapunov",
+        )
 
-            return sys.float_info.max
-        if res <= 0.0:
-            return -math.inf
-        return 0.5 * math.log(res)
+    def arma_optim(p, use_css, hessian=True):
+        if optim_method == "native":
+            # the whole optimization runs in the extension with R's BFGS
+            sol, fun, status, hess_inv = _arima.optimize(
+                p,
+                parscale[mask],
+                coef,
+                mask,
+                x,
+                xreg if ncxreg > 0 else np.empty((x.size, 0)),
+                arma,
+                Delta,
+                kappa,
+                transform_pars and not use_css,
+                use_css,
+                optim_control.get("maxiter", 100),
+                tol,
+                hessian,
+                SSinit == "Lyapunov",
+            )
+            return OptimResult(status == 0, status, sol, fun, hess_inv)
+        return minimize(
+            arma_objective(use_css),
+            p,
+            method=optim_method,
+            tol=tol,
+            options=optim_control,
+        )
 
     coef = np.array(fixed)
-    # parscale definition, think about it, scipy doesn't use it
+    # parscale definition, think about it, scipy doesn't use it (the native optimizer does)
     if method == "CSS":
         if no_optim:
             res = OptimResult(True, 0, np.array([]), 0.0, np.array([]))
         else:
-            res = minimize(
-                arma_css_op,
-                init[mask],
-                args=(x,),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = arma_optim(init[mask], use_css=True)
 
         if res.status > 0:
             warnings.warn(
@@ -481,7 +476,7 @@ def arima(
             )
         coef[mask] = res.x
         phi, theta = arima_transpar(coef, arma, False)
-        mod = make_arima(phi, theta, Delta, kappa)
+        mod = make_arima(phi, theta, Delta, kappa, SSinit)
         if ncxreg > 0:
             x -= np.dot(xreg, coef[narma + np.arange(ncxreg)])
         val = arima_css(x, arma, phi, theta)
@@ -490,14 +485,7 @@ def arima(
     else:
         if method == "CSS-ML":
             if not no_optim:
-                res = minimize(
-                    arma_css_op,
-                    init[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = arma_optim(init[mask], use_css=True, hessian=False)
                 # only update the initial parameters if they're valid
                 candidate = init.copy()
                 candidate[mask] = res.x
@@ -522,28 +510,16 @@ def arima(
                 if arma[3] > 0:
                     ind = np.sum(arma[:3]) + np.arange(arma[3])
                     init[ind] = maInvert(init[ind])
-        trarma = arima_transpar(init, arma, transform_pars)
-        mod = make_arima(trarma[0], trarma[1], Delta, kappa, SSinit)
         if no_optim:
             res = OptimResult(
                 True,
                 0,
                 np.array([]),
-                armafn(np.array([]), x, transform_pars),
+                arma_objective(use_css=False)(np.array([])),
                 np.array([]),
             )
         else:
-            res = minimize(
-                armafn,
-                init[mask],
-                args=(
-                    x,
-                    transform_pars,
-                ),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = arma_optim(init[mask], use_css=False)
         coef[mask] = res.x
         if transform_pars:
             if arma[1] > 0:
@@ -556,14 +532,7 @@ def arima(
                     coef[ind] = maInvert(coef[ind])
             if any(coef[mask] != res.x):
                 oldcode = res.status
-                res = minimize(
-                    arma_css_op,
-                    coef[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = arma_optim(coef[mask], use_css=True)
                 res = OptimResult(res.success, oldcode, res.x, res.fun, res.hess_inv)
                 coef[mask] = res.x
             A = arima_gradtrans(coef, arma)
@@ -620,31 +589,23 @@ def arima(
         "n_cond": ncond,
         "nobs": n_used,
         "model": mod,
+        "method": method,
     }
     return ans
 
-# %% ../../nbs/src/arima.ipynb 36
-def kalman_forecast(n, Z, a, P, T, V, h):
-    a = a.copy()
-    P = P.copy()
-    forecasts = np.empty(n)
-    se = np.empty(n)
-    z = Z.reshape(-1, 1) * Z.reshape(1, -1)
-    for l in range(n):
-        a = T @ a
-        forecasts[l] = a @ Z
-        mm = T @ P
-        P = V + mm @ T.T
-        se[l] = h + np.sum(z * P)
-    return forecasts, se
-
 # %% ../../nbs/src/arima.ipynb 39
+def kalman_forecast(n, mod):
+    return _arima.kalman_forecast(
+        n, mod["phi"], mod["theta"], mod["delta"], mod["a"], mod["P"], mod["h"]
+    )
+
+# %% ../../nbs/src/arima.ipynb 42
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../../nbs/src/arima.ipynb 40
+# %% ../../nbs/src/arima.ipynb 43
 def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     myNCOL = lambda x: x.shape[1] if x is not None else 0
@@ -693,9 +654,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
     #        warning("seasonal MA part of model is not invertible")
     # }
 
-    pred, se = kalman_forecast(
-        n_ahead, *(model["model"][var] for var in ["Z", "a", "P", "T", "V", "h"])
-    )
+    pred, se = kalman_forecast(n_ahead, model["model"])
     pred += xm
     if se_fit:
         se = np.sqrt(se * model["sigma2"])
@@ -703,7 +662,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../../nbs/src/arima.ipynb 44
+# %% ../../nbs/src/arima.ipynb 47
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -725,13 +684,38 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../../nbs/src/arima.ipynb 45
+# %% ../../nbs/src/arima.ipynb 48
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../../nbs/src/arima.ipynb 46
+# %% ../../nbs/src/arima.ipynb 49
+def _init_from_coef(coef, order, seas_order, n_xreg, xreg_name):
+    """Starting values for `arima` from the coefficients of a previous fit.
+
+    The ARMA coefficients are matched by name and the ones the previous model
+    didn't have are left as NaN, which `arima` replaces with its default starting
+    values. Several regressors are estimated in a rotated basis, so the previous
+    coefficient is only reused when there's a single one."""
+    if coef is None:
+        return None
+    names = [
+        f"{prefix}{i + 1}"
+        for prefix, n in zip(
+            ("ar", "ma", "sar", "sma"),
+            (order[0], order[2], seas_order[0], seas_order[2]),
+        )
+        for i in range(n)
+    ]
+    init = [coef.get(name, np.nan) for name in names]
+    if n_xreg == 1:
+        init.append(coef.get(xreg_name, np.nan))
+    else:
+        init.extend([np.nan] * n_xreg)
+    return np.array(init, dtype=np.float64)
+
+
 def myarima(
     x,
     order=(0, 0, 0),
@@ -743,6 +727,9 @@ def myarima(
     offset=0,
     xreg=None,
     method=None,
+    optim_method="BFGS",
+    SSinit="Gardner1980",
+    init_coef=None,
     **kwargs,
 ):
     missing = np.isnan(x)
@@ -766,18 +753,62 @@ def myarima(
                 xreg = np.concatenate([drift, xreg], axis=1)
             else:
                 xreg = drift
+            init = _init_from_coef(init_coef, order, seas_order, xreg.shape[1], "drift")
             if use_season:
-                fit = arima(x, order, seasonal, xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    seasonal,
+                    xreg,
+                    method=method,
+                    optim_method=optim_method,
+                    SSinit=SSinit,
+                    init=init,
+                )
             else:
-                fit = arima(x, order, xreg=xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    xreg=xreg,
+                    method=method,
+                    optim_method=optim_method,
+                    SSinit=SSinit,
+                    init=init,
+                )
             fit["coef"] = change_drift_name(fit["coef"])
         else:
+            intercept = constant and diffs == 0
+            n_xreg = int(intercept) + (0 if xreg is None else xreg.shape[1])
+            init = _init_from_coef(
+                init_coef,
+                order,
+                seas_order,
+                n_xreg,
+                "intercept" if intercept else "ex_1",
+            )
             if use_season:
                 fit = arima(
-                    x, order, seasonal, include_mean=constant, method=method, xreg=xreg
+                    x,
+                    order,
+                    seasonal,
+                    include_mean=constant,
+                    method=method,
+                    optim_method=optim_method,
+                    SSinit=SSinit,
+                    xreg=xreg,
+                    init=init,
                 )
             else:
-                fit = arima(x, order, include_mean=constant, method=method, xreg=xreg)
+                fit = arima(
+                    x,
+                    order,
+                    include_mean=constant,
+                    method=method,
+                    optim_method=optim_method,
+                    SSinit=SSinit,
+                    xreg=xreg,
+                    init=init,
+                )
         # nxreg = 0 if xreg is None else xreg.shape[1]
         nstar = n - order[1] - seas_order[1] * m
         if diffs == 1 and constant:
@@ -830,7 +861,34 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../../nbs/src/arima.ipynb 49
+# %% ../../nbs/src/arima.ipynb 52
+def _search_executor(n_jobs, optim_method):
+    if n_jobs == 1:
+        return nullcontext()
+    if n_jobs == -1 or n_jobs is None:
+        n_jobs = os.cpu_count()
+    # the native optimizer releases the GIL
+    if optim_method == "native":
+        return ThreadPoolExecutor(n_jobs)
+    return ProcessPoolExecutor(n_jobs)
+
+
+def _fit_models(fit_fn, models_kwargs, executor=None):
+    """Yields the fitted models in order, computing them concurrently if an executor is provided."""
+    if executor is None:
+        for kwargs in models_kwargs:
+            yield fit_fn(**kwargs)
+        return
+    futures = [executor.submit(fit_fn, **kwargs) for kwargs in models_kwargs]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # the caller may stop early, e.g. at the first improvement of the stepwise search
+        for future in futures:
+            future.cancel()
+
+# %% ../../nbs/src/arima.ipynb 53
 def search_arima(
     x,
     d=0,
@@ -849,6 +907,7 @@ def search_arima(
     allow_drift=True,
     allow_mean=True,
     period=1,
+    executor=None,
     **kwargs
 ):
     m = period
@@ -858,29 +917,35 @@ def search_arima(
 
     best_ic = np.inf
     best_fit = None
-    for i in range(max_p + 1):
-        for j in range(max_q + 1):
-            for I in range(max_P + 1):
-                for J in range(max_Q + 1):
-                    if i + j + I + J > max_order:
-                        continue
-                    for K in range(max_K + 1):
-                        fit = myarima(
-                            x,
-                            order=(i, d, j),
-                            seasonal={"order": (I, D, J), "period": m},
-                            constant=K == 1,
-                            trace=trace,
-                            ic=ic,
-                            approximation=approximation,
-                            offset=offset,
-                            xreg=xreg,
-                            **kwargs,
-                        )
-                        if fit["ic"] < best_ic:
-                            best_ic = fit["ic"]
-                            best_fit = fit
-                            constant = K == 1
+    p_myarima = partial(
+        myarima,
+        x,
+        trace=trace,
+        ic=ic,
+        approximation=approximation,
+        offset=offset,
+        xreg=xreg,
+        **kwargs,
+    )
+    models_kwargs = [
+        {
+            "order": (i, d, j),
+            "seasonal": {"order": (I, D, J), "period": m},
+            "constant": K == 1,
+        }
+        for i in range(max_p + 1)
+        for j in range(max_q + 1)
+        for I in range(max_P + 1)
+        for J in range(max_Q + 1)
+        if i + j + I + J <= max_order
+        for K in range(max_K + 1)
+    ]
+    fits = _fit_models(p_myarima, models_kwargs, executor)
+    for model_kwargs, fit in zip(models_kwargs, fits):
+        if fit["ic"] < best_ic:
+            best_ic = fit["ic"]
+            best_fit = fit
+            constant = model_kwargs["constant"]
     if best_fit is None:
         raise RuntimeError("No ARIMA model able to be estimated")
     if approximation:
@@ -920,12 +985,13 @@ def search_arima(
                 offset=offset,
                 allow_drift=allow_drift,
                 allow_mean=allow_mean,
+                executor=executor,
                 **kwargs,
             )
     return best_fit
 
-# %% ../../nbs/src/arima.ipynb 51
-def arima2(x, model, xreg, method):
+# %% ../../nbs/src/arima.ipynb 55
+def arima2(x, model, xreg, method, SSinit="Gardner1980"):
     m = model["arma"][4]  # 5
     use_drift = "drift" in model["coef"].keys()
     use_intercept = "intercept" in model["coef"].keys()
@@ -963,6 +1029,7 @@ def arima2(x, model, xreg, method):
             seasonal=seasonal,
             include_mean=use_intercept,
             method=method,
+            SSinit=SSinit,
             fixed=coefs,
             xreg=xreg if use_xreg else None,
         )
@@ -972,6 +1039,7 @@ def arima2(x, model, xreg, method):
             order=order,
             include_mean=use_intercept,
             method=method,
+            SSinit=SSinit,
             fixed=coefs,
             xreg=xreg if use_xreg else None,
         )
@@ -981,6 +1049,7 @@ def arima2(x, model, xreg, method):
             order=order,
             include_mean=False,
             method=method,
+            SSinit=SSinit,
         )
     n_coef = len(refit["coef"])
     refit["var_coef"] = np.zeros((n_coef, n_coef), dtype=np.float32)
@@ -991,7 +1060,7 @@ def arima2(x, model, xreg, method):
         refit["coef"] = change_drift_name(refit["coef"])
     return refit
 
-# %% ../../nbs/src/arima.ipynb 52
+# %% ../../nbs/src/arima.ipynb 56
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1032,7 +1101,13 @@ def Arima(
         warnings.warn("No drift term fitted as the order of difference is 2 or more.")
         include_drift = False
     if model is not None:
-        tmp = arima2(x=x, model=model, xreg=xreg, method=method)
+        tmp = arima2(
+            x=x,
+            model=model,
+            xreg=xreg,
+            method=method,
+            SSinit=kwargs.get("SSinit", "Gardner1980"),
+        )
         xreg = tmp["xreg"]
         tmp["lambda"] = model["lambda"]
     else:
@@ -1085,7 +1160,7 @@ def Arima(
         tmp["sigma2"] = np.nansum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../../nbs/src/arima.ipynb 60
+# %% ../../nbs/src/arima.ipynb 65
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1115,11 +1190,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../../nbs/src/arima.ipynb 63
+# %% ../../nbs/src/arima.ipynb 68
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../../nbs/src/arima.ipynb 64
+# %% ../../nbs/src/arima.ipynb 69
 def forecast_arima(
     model,
     h=None,
@@ -1214,7 +1289,7 @@ def forecast_arima(
 
     return ans
 
-# %% ../../nbs/src/arima.ipynb 71
+# %% ../../nbs/src/arima.ipynb 76
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1230,19 +1305,171 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../../nbs/src/arima.ipynb 76
+# %% ../../nbs/src/arima.ipynb 80
+def forecast_arima_batch(
+    y,
+    indptr,
+    h,
+    order=(0, 0, 0),
+    seasonal={"order": (0, 0, 0), "period": 1},
+    include_mean=True,
+    include_drift=False,
+    include_constant=None,
+    method="CSS-ML",
+    kappa=1e6,
+    tol=1e-8,
+    optim_control={"maxiter": 100},
+    SSinit="Gardner1980",
+):
+    """Fits the same ARIMA to every serie of `y` (delimited by `indptr`) and forecasts them.
+
+    Equivalent up to the optimizer's tolerance to `Arima` with `optim_method='native'` followed by
+    `forecast_arima` for each serie, with all the series fitted in a single call to the extension
+    that shares the model structure and the working buffers. Returns the forecasts and their
+    standard errors of shape (n_series, h), the insample fitted values and sigma2 of each serie.
+    """
+    if method not in ("CSS-ML", "ML"):
+        raise NotImplementedError(f"method={method!r}")
+    y = np.asarray(y, dtype=np.float64)
+    if np.isnan(y).any():
+        raise NotImplementedError("missing values")
+    seas_order = seasonal["order"]
+    period = seasonal["period"] or 1
+    nd = order[1] + seas_order[1]
+    if include_constant is not None:
+        include_mean = include_constant
+        include_drift = include_constant and nd == 1
+    include_mean = include_mean and nd == 0
+    include_drift = include_drift and nd <= 1
+    if include_mean and include_drift:
+        raise NotImplementedError("intercept and drift")
+    arma = [*order[::2], *seas_order[::2], period, order[1], seas_order[1]]
+    Delta = np.array([1.0])
+    for _ in range(order[1]):
+        Delta = convolve(Delta, np.array([1.0, -1.0]))
+    for _ in range(seas_order[1]):
+        Delta = convolve(Delta, np.array([1] + [0] * (period - 1) + [-1]))
+    mean, se, fitted, sigma2 = _arima.fit_forecast_batch(
+        y,
+        np.asarray(indptr, dtype=np.int32),
+        arma,
+        -Delta[1:],
+        1 if include_mean else 2 if include_drift else 0,
+        method == "CSS-ML",
+        h,
+        kappa,
+        optim_control.get("maxiter", 100),
+        tol,
+        SSinit == "Lyapunov",
+    )
+    return {"mean": mean, "se": se, "fitted": fitted, "sigma2": sigma2}
+
+# %% ../../nbs/src/arima.ipynb 82
+def kpss(x, nlags):
+    """KPSS test for level stationarity, returns the statistic and its p-value."""
+    if nlags >= x.size:
+        raise ValueError(f"lags ({nlags}) must be < number of observations ({x.size})")
+    stat = _arima.kpss(x, nlags)
+    pvalue = np.interp(stat, [0.347, 0.463, 0.574, 0.739], [0.10, 0.05, 0.025, 0.01])
+    return stat, pvalue
+
+
+def stl(x, period, seasonal=11, seasonal_deg=0, inner_iter=5):
+    """Non robust STL decomposition, returns the seasonal and trend components."""
+    if np.isnan(x).any():
+        raise ValueError("`stl` cannot handle missing values.")
+    if period != int(period) or period < 2:
+        raise ValueError("period must be a positive integer >= 2")
+    period = int(period)
+    trend = math.ceil(1.5 * period / (1 - 1.5 / seasonal))
+    trend += trend % 2 == 0
+    low_pass = period + 1
+    low_pass += low_pass % 2 == 0
+    return _arima.stl(
+        x, period, seasonal, trend, low_pass, seasonal_deg, 1, 1, inner_iter
+    )
+
+# %% ../../nbs/src/arima.ipynb 84
 def seas_heuristic(x, period):
-    # nperiods = period > 1
-    season = math.nan
-    stlfit = mstl(x, period)
-    remainder = stlfit["remainder"]
-    seasonal = stlfit.get("seasonal", None)
+    seasonal, trend = stl(x, period)
+    remainder = x - seasonal - trend
     vare = np.var(remainder, ddof=1)
-    if seasonal is not None:
-        season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
-    return season
+    return max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
 
-# %% ../../nbs/src/arima.ipynb 78
+# %% ../../nbs/src/arima.ipynb 86
+_DiffsCacheInfo = namedtuple(
+    "_DiffsCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+def _cache_diff_tests(maxsize=128):
+    """Memoize a differencing test on the contents of the series.
+
+    The key is a digest of the series bytes together with the remaining
+    arguments, so repeated fits on the same data (e.g. several AutoARIMA
+    models or refits on the same window) skip the unit root tests.
+    Setting `maxsize=0` disables the cache. The wrapped function exposes
+    `cache_info()` and `cache_clear()` like `functools.lru_cache`."""
+
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        hits = misses = 0
+
+        @wraps(fn)
+        def wrapper(x, *args, **kwargs):
+            nonlocal hits, misses
+            try:
+                x_arr = np.ascontiguousarray(x)
+                digest = hashlib.blake2b(x_arr.tobytes(), digest_size=16).digest()
+                key = (
+                    digest,
+                    x_arr.dtype.str,
+                    x_arr.shape,
+                    args,
+                    tuple(sorted(kwargs.items())),
+                )
+                hash(key)
+            except TypeError:
+                key = None
+            if key is not None and maxsize > 0:
+                with lock:
+                    if key in cache:
+                        cache.move_to_end(key)
+                        hits += 1
+                        return cache[key]
+            with lock:
+                misses += 1
+            res = fn(x, *args, **kwargs)
+            if key is not None and maxsize > 0:
+                with lock:
+                    cache[key] = res
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return res
+
+        def cache_info():
+            with lock:
+                return _DiffsCacheInfo(hits, misses, maxsize, len(cache))
+
+        def cache_clear():
+            nonlocal hits, misses
+            with lock:
+                cache.clear()
+                hits = misses = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+_DIFFS_CACHE_SIZE = int(os.getenv("NIXTLA_ARIMA_DIFFS_CACHE_SIZE", "128"))
+
+# %% ../../nbs/src/arima.ipynb 87
+@_cache_diff_tests(_DIFFS_CACHE_SIZE)
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1305,7 +1532,8 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../../nbs/src/arima.ipynb 80
+# %% ../../nbs/src/arima.ipynb 89
+@_cache_diff_tests(_DIFFS_CACHE_SIZE)
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
     x = x[~np.isnan(x)]
     d = 0
@@ -1327,7 +1555,7 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 nlags = math.floor(3 * math.sqrt(len(x)) / 13)
-                diff = sm.tsa.kpss(x, "c", nlags=nlags)[1] < alpha
+                diff = kpss(x, nlags=nlags)[1] < alpha
         except Exception as e:
             warnings.warn(
                 f"The chosen unit root test encountered an error when testing for the {d} difference.\n"
@@ -1350,13 +1578,13 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../../nbs/src/arima.ipynb 82
+# %% ../../nbs/src/arima.ipynb 92
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../../nbs/src/arima.ipynb 84
+# %% ../../nbs/src/arima.ipynb 94
 def auto_arima_f(
     x,
     d=None,
@@ -1380,6 +1608,8 @@ def auto_arima_f(
     trace=False,
     approximation=None,
     method=None,
+    optim_method="BFGS",
+    SSinit="Gardner1980",
     truncate=None,
     xreg=None,
     test="kpss",
@@ -1391,6 +1621,9 @@ def auto_arima_f(
     blambda=None,
     biasadj=False,
     period=1,
+    n_jobs=1,
+    init_model=None,
+    restrict_search=False,
 ):
     if approximation is None:
         approximation = len(x) > 150 or period > 12
@@ -1427,6 +1660,14 @@ def auto_arima_f(
         m = 1
     else:
         m = round(m)
+    init_coef = None
+    if init_model is not None:
+        # warm start from a previous fit, e.g. on the same series with fewer observations
+        init_coef = init_model["coef"]
+        start_p, start_q, start_P, start_Q, _, prev_d, prev_D = init_model["arma"]
+        if restrict_search:
+            d = prev_d if d is None else d
+            D = prev_D if D is None else D
     max_p = min(max_p, series_len // 3)
     max_q = min(max_q, series_len // 3)
     max_P = min(max_P, math.floor(series_len / 3 / m))
@@ -1577,29 +1818,37 @@ def auto_arima_f(
     allowdrift = allowdrift and (d + D) == 1
     allowmean = allowmean and (d + D) == 0
     constant = allowdrift or allowmean
+    restrict_search = restrict_search and init_coef is not None
+    if restrict_search:
+        constant = constant and ("intercept" in init_coef or "drift" in init_coef)
     if approximation and trace:
         print("Fitting models using approximations to speed things up")
     if not stepwise:
-        bestfit = search_arima(
-            x,
-            d,
-            D,
-            max_p,
-            max_q,
-            max_P,
-            max_Q,
-            max_order,
-            stationary,
-            ic,
-            trace,
-            approximation,
-            method=method,
-            xreg=xreg,
-            offset=offset,
-            allow_drift=allowdrift,
-            allow_mean=allowmean,
-            period=m,
-        )
+        with _search_executor(n_jobs, optim_method) as executor:
+            bestfit = search_arima(
+                x,
+                d,
+                D,
+                max_p,
+                max_q,
+                max_P,
+                max_Q,
+                max_order,
+                stationary,
+                ic,
+                trace,
+                approximation,
+                method=method,
+                optim_method=optim_method,
+                SSinit=SSinit,
+                xreg=xreg,
+                offset=offset,
+                allow_drift=allowdrift,
+                allow_mean=allowmean,
+                period=m,
+                executor=executor,
+                init_coef=init_coef,
+            )
         bestfit["lambda"] = blambda
         bestfit["x"] = origx
         if trace:
@@ -1625,241 +1874,88 @@ def auto_arima_f(
         offset=offset,
         xreg=xreg,
         method=method,
+        optim_method=optim_method,
+        SSinit=SSinit,
+        init_coef=init_coef,
     )
-    bestfit = p_myarima(
-        order=(p, d, q),
-        seasonal={"order": (P, D, Q), "period": m},
-    )
-    results[0] = (p, d, q, P, D, Q, constant, bestfit["ic"])
-    fit = p_myarima(
-        order=(0, d, 0),
-        seasonal={"order": (0, D, 0), "period": m},
-    )
-    results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
-    if fit["ic"] < bestfit["ic"]:
-        bestfit = fit
-        p = q = P = Q = 0
-    k = 2
-    if max_p > 0 or max_P > 0:
-        p_ = int(max_p > 0)
-        P_ = int(m > 1 and max_P > 0)
-        fit = p_myarima(
-            order=(p_, d, 0),
-            seasonal={"order": (P_, D, 0), "period": m},
-        )
-        results[k] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = p_
-            P = P_
-            q = Q = 0
-        k += 1
-    if max_q > 0 or max_Q > 0:
-        q_ = int(max_q > 0)
-        Q_ = int(m > 1 and max_Q > 0)
-        fit = p_myarima(
-            order=(0, d, q_),
-            seasonal={"order": (0, D, Q_), "period": m},
-        )
-        results[k] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = P = 0
-            Q = Q_
-            q = q_
-        k += 1
-    if constant:
-        fit = p_myarima(
-            order=(0, d, 0),
-            seasonal={"order": (0, D, 0), "period": m},
-            constant=False,
-        )
-        results[k] = (0, d, 0, 0, D, 0, 0, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = q = P = Q = 0
-        k += 1
-
-    def try_params(p, d, q, P, D, Q, constant, k, bestfit):
-        improved = False
-        if k >= results.shape[0]:
-            return k, bestfit, improved
-        fit = p_myarima(
-            order=(p, d, q),
-            seasonal={"order": (P, D, Q), "period": m},
-            constant=constant,
-        )
-        results[k] = (p, d, q, P, D, Q, constant, fit["ic"])
-        k += 1
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            improved = True
-        return k, bestfit, improved
-
-    startk = 0
-    while startk < k and k < nmodels:
-        startk = k
-        if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                continue
-        if Q > 0 and newmodel(p, d, q, P, D, Q - 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                Q -= 1
-                continue
-        if P < max_P and newmodel(p, d, q, P + 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                continue
-        if Q < max_Q and newmodel(p, d, q, P, D, Q + 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q += 1
-                continue
-        if p > 0 and newmodel(p - 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p - 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                continue
-        if q > 0 and newmodel(p, d, q - 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q -= 1
-                continue
-        if p < max_p and newmodel(p + 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p + 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                continue
-        if q < max_q and newmodel(p, d, q + 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q += 1
-                continue
-        if (
-            q > 0
-            and p > 0
-            and newmodel(p - 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p > 0
-            and newmodel(p - 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q += 1
-                continue
-        if (
-            q > 0
-            and p < max_p
-            and newmodel(p + 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p < max_p
-            and newmodel(p + 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q += 1
-                continue
-        if (allowdrift or allowmean) and newmodel(
-            p, d, q, P, D, Q, not constant, results[:k]
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q, not constant, k, bestfit
-            )
-            if improved:
-                constant = not constant
-                continue
+    # starting models, as (p, q, P, Q) and constant
+    if restrict_search:
+        # only the previous model and its neighbours are considered
+        initial = [((p, q, P, Q), constant)]
+    else:
+        initial = [((p, q, P, Q), constant), ((0, 0, 0, 0), constant)]
+        if max_p > 0 or max_P > 0:
+            initial.append(((int(max_p > 0), 0, int(m > 1 and max_P > 0), 0), constant))
+        if max_q > 0 or max_Q > 0:
+            initial.append(((0, int(max_q > 0), 0, int(m > 1 and max_Q > 0)), constant))
+        if constant:
+            # the search continues from the best model but keeps the constant
+            initial.append(((0, 0, 0, 0), False))
+
+    def neighbours(p, q, P, Q, constant):
+        candidates = [
+            (P > 0, (p, q, P - 1, Q, constant)),
+            (Q > 0, (p, q, P, Q - 1, constant)),
+            (P < max_P, (p, q, P + 1, Q, constant)),
+            (Q < max_Q, (p, q, P, Q + 1, constant)),
+            (Q > 0 and P > 0, (p, q, P - 1, Q - 1, constant)),
+            (Q < max_Q and P > 0, (p, q, P - 1, Q + 1, constant)),
+            (Q > 0 and P < max_P, (p, q, P + 1, Q - 1, constant)),
+            (Q < max_Q and P < max_P, (p, q, P + 1, Q + 1, constant)),
+            (p > 0, (p - 1, q, P, Q, constant)),
+            (q > 0, (p, q - 1, P, Q, constant)),
+            (p < max_p, (p + 1, q, P, Q, constant)),
+            (q < max_q, (p, q + 1, P, Q, constant)),
+            (q > 0 and p > 0, (p - 1, q - 1, P, Q, constant)),
+            (q < max_q and p > 0, (p - 1, q + 1, P, Q, constant)),
+            (q > 0 and p < max_p, (p + 1, q - 1, P, Q, constant)),
+            (q < max_q and p < max_p, (p + 1, q + 1, P, Q, constant)),
+            (allowdrift or allowmean, (p, q, P, Q, not constant)),
+        ]
+        return [
+            (p, q, P, Q, constant)
+            for valid, (p, q, P, Q, constant) in candidates
+            if valid and newmodel(p, d, q, P, D, Q, constant, results[:k])
+        ]
+
+    def models_kwargs(candidates):
+        return [
+            {
+                "order": (p, d, q),
+                "seasonal": {"order": (P, D, Q), "period": m},
+                "constant": constant,
+            }
+            for p, q, P, Q, constant in candidates
+        ]
+
+    with _search_executor(n_jobs, optim_method) as executor:
+        candidates = [(*orders, constant_) for orders, constant_ in initial]
+        fits = _fit_models(p_myarima, models_kwargs(candidates), executor)
+        for k, ((p_, q_, P_, Q_, constant_), fit) in enumerate(zip(candidates, fits)):
+            results[k] = (p_, d, q_, P_, D, Q_, constant_, fit["ic"])
+            if k == 0 or fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p, q, P, Q = p_, q_, P_, Q_
+        k = len(candidates)
+
+        startk = 0
+        while startk < k and k < nmodels:
+            startk = k
+            # the first neighbour that improves the ic is taken. When the neighbourhood
+            # is fitted concurrently the fits after it are discarded, as in the serial search
+            candidates = neighbours(p, q, P, Q, constant)[: nmodels - k]
+            fits = _fit_models(p_myarima, models_kwargs(candidates), executor)
+            for (p_, q_, P_, Q_, constant_), fit in zip(candidates, fits):
+                results[k] = (p_, d, q_, P_, D, Q_, constant_, fit["ic"])
+                k += 1
+                if fit["ic"] < bestfit["ic"]:
+                    bestfit = fit
+                    p, q, P, Q, constant = p_, q_, P_, Q_, constant_
+                    if not restrict_search:
+                        break
+            fits.close()
+            if restrict_search:
+                break
     if k >= nmodels:
         warnings.warn(
             f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
@@ -1881,7 +1977,10 @@ def auto_arima_f(
                 trace=trace,
                 approximation=False,
                 method=method,
+                optim_method=optim_method,
+                SSinit=SSinit,
                 xreg=xreg,
+                init_coef=init_coef,
             )
             if fit["ic"] < math.inf:
                 bestfit = fit
@@ -1895,11 +1994,74 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../../nbs/src/arima.ipynb 86
-def forward_arima(fitted_model, y, xreg=None, method="CSS-ML"):
-    return Arima(x=y, model=fitted_model, xreg=xreg, method=method)
+# %% ../../nbs/src/arima.ipynb 96
+def forward_arima(fitted_model, y, xreg=None, method="CSS-ML", SSinit="Gardner1980"):
+    return Arima(x=y, model=fitted_model, xreg=xreg, method=method, SSinit=SSinit)
 
-# %% ../../nbs/src/arima.ipynb 95
+# %% ../../nbs/src/arima.ipynb 97
+def update_arima(model, y, xreg=None):
+    """Filters new observations through a fitted model.
+
+    The coefficients and sigma2 are kept and only the state of the Kalman filter
+    is advanced, so the cost is linear in the number of new observations."""
+    y = np.asarray(y, dtype=np.float64)
+    h = y.size
+    coefs = np.array(list(model["coef"].values()))
+    narma = sum(model["arma"][:4])
+    regs = []
+    if "drift" in model["coef"]:
+        n = len(model["x"])
+        regs.append(np.arange(n + 1, n + h + 1, dtype=np.float64).reshape(-1, 1))
+    if xreg is not None:
+        if xreg.dtype not in (np.float32, np.float64):
+            raise ValueError("xreg should be a float array")
+        regs.append(xreg)
+    newxreg = regs[:]
+    if "intercept" in model["coef"]:
+        newxreg.insert(0, np.ones((h, 1)))
+    newxreg = np.hstack(newxreg) if newxreg else np.empty((h, 0))
+    if newxreg.shape[1] != coefs.size - narma:
+        raise Exception("Number of regressors does not match fitted model")
+    x = y - newxreg @ coefs[narma:]
+    mod = {
+        **model["model"],
+        "a": model["model"]["a"].copy(),
+        "P": model["model"]["P"].copy(),
+        "Pn": model["model"]["Pn"].copy(),
+        "filtered": True,
+    }
+    # the covariance is predicted at every step since the state comes from the last observation
+    up = -1
+    if model.get("method") == "CSS" and not model["model"].get("filtered", False):
+        # CSS fits keep the initial state, so the training data is filtered first like in forward_arima
+        oldxreg = [] if model.get("xreg") is None else [model["xreg"]]
+        if "intercept" in model["coef"]:
+            oldxreg.insert(0, np.ones((len(model["x"]), 1)))
+        oldxreg = np.hstack(oldxreg) if oldxreg else np.empty((len(model["x"]), 0))
+        x = np.append(model["x"] - oldxreg @ coefs[narma:], x)
+        up = 0
+    resid = arima_like(
+        x,
+        mod["phi"],
+        mod["theta"],
+        mod["delta"],
+        mod["a"],
+        mod["P"],
+        mod["Pn"],
+        up,
+        True,
+    )[3][-h:]
+    updated = {
+        **model,
+        "model": mod,
+        "x": np.append(model["x"], y),
+        "residuals": np.append(model["residuals"], resid),
+    }
+    if model.get("xreg") is not None:
+        updated["xreg"] = np.vstack([model["xreg"], np.hstack(regs)])
+    return updated
+
+# %% ../../nbs/src/arima.ipynb 110
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -1929,7 +2091,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../../nbs/src/arima.ipynb 97
+# %% ../../nbs/src/arima.ipynb 112
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -1942,7 +2104,7 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../../nbs/src/arima.ipynb 98
+# %% ../../nbs/src/arima.ipynb 113
 class AutoARIMA:
     """An AutoARIMA estimator.
 
@@ -6,6 +6,7 @@ __all__ = ['StatsForecast']
 # %% ../../nbs/src/core/core.ipynb 6
 import datetime as dt
 import errno
+import functools
 import inspect
 import logging
 import os
@@ -14,9 +15,16 @@ import re
 import reprlib
 import time
 import warnings
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager, nullcontext
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -44,6 +52,51 @@ logger = logging.getLogger(__name__)
 _controller = ThreadpoolController()
 
 # %% ../../nbs/src/core/core.ipynb 10
+def _supports_forecast_batch(model, exog=False) -> bool:
+    # conformal intervals are computed by refitting the model on each serie,
+    # `forecast_batch` doesn't take exogenous features and some models only
+    # batch some of their configurations
+    return (
+        hasattr(model, "forecast_batch")
+        and getattr(model, "prediction_intervals", None) is None
+        and not (exog and model.uses_exog)
+        and getattr(model, "batchable", True)
+    )
+
+
+def _split_idxs(n_groups, n_chunks, costs=None):
+    # contiguous chunks of series. if the cost of each serie is provided
+    # the chunks have (approximately) the same total cost instead of the same size
+    n_chunks = min(n_chunks, n_groups)
+    if costs is None:
+        return np.array_split(np.arange(n_groups), n_chunks)
+    cum_costs = np.cumsum(costs, dtype=np.float64)
+    targets = cum_costs[-1] * np.arange(1, n_chunks) / n_chunks
+    cuts = np.searchsorted(cum_costs, targets) + 1
+    cuts = np.unique(np.clip(cuts, 1, n_groups - 1))
+    return np.split(np.arange(n_groups), cuts)
+
+
+@functools.lru_cache(maxsize=None)
+def _has_level(cls, attr) -> bool:
+    return "level" in inspect.signature(getattr(cls, attr)).parameters
+
+
+def _output_layout(res, matches, name, base):
+    # keys of the result of a model that go into the output and their column names
+    keys = [key for key in res.keys() if any(key.startswith(m) for m in matches)]
+    cols = [
+        name if key == base else f"{name}-{key.replace(f'{base}-', '')}" for key in keys
+    ]
+    return keys, cols
+
+
+def _write_output(out, res, keys):
+    # out is the slice of the output that corresponds to a single model
+    for j, key in enumerate(keys):
+        out[..., j] = res[key]
+
+
 class GroupedArray(BaseGroupedArray):
 
     def __eq__(self, other):
@@ -53,14 +106,22 @@ class GroupedArray(BaseGroupedArray):
             self.indptr, other.indptr
         )
 
-    def fit(self, models, fallback_model=None):
+    def fit(self, models, fallback_model=None, init_fm=None):
+        # init_fm holds the previously fitted models of the same series,
+        # the models that warm start continue from them
         fm = np.full((self.n_groups, len(models)), np.nan, dtype=object)
         for i, grp in enumerate(self):
             y = grp[:, 0] if grp.ndim == 2 else grp
             X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             for i_model, model in enumerate(models):
                 try:
-                    new_model = model.new()
+                    template = model
+                    if init_fm is not None and getattr(model, "warm_start", False):
+                        prev_model = init_fm[i, i_model]
+                        # series that used the fallback model start from scratch
+                        if type(prev_model) is type(model):
+                            template = prev_model
+                    new_model = template.new()
                     fm[i, i_model] = new_model.fit(y=y, X=X)
                 except Exception as error:
                     if fallback_model is not None:
@@ -78,10 +139,7 @@ class GroupedArray(BaseGroupedArray):
         cuts[0] = 0
         for i_model, model in enumerate(models):
             len_cols = 1  # mean
-            has_level = (
-                "level" in inspect.signature(getattr(model, attr)).parameters
-                and len(level) > 0
-            )
+            has_level = _has_level(type(model), attr) and len(level) > 0
             has_level_models[i_model] = has_level
             if has_level:
                 len_cols += 2 * len(level)  # levels
@@ -111,27 +169,24 @@ class GroupedArray(BaseGroupedArray):
             kwargs = {}
             if has_level:
                 kwargs["level"] = level
-            for i, _ in enumerate(self):
+            keys_m = None
+            for i in range(self.n_groups):
                 if X is not None:
                     X_ = X[i]
                 else:
                     X_ = None
                 res_i = fm[i, i_model].predict(h=h, X=X_, **kwargs)
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                model_name = repr(fm[i, i_model])
-                cols_m = [
-                    f"{model_name}" if col == "mean" else f"{model_name}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-            cols += cols_m
+                if keys_m is None:
+                    # the layout of the output is the same for all the series
+                    keys_m, cols_m = _output_layout(
+                        res_i, matches, repr(fm[i, i_model]), "mean"
+                    )
+                    cols += cols_m
+                _write_output(
+                    fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]],
+                    res_i,
+                    keys_m,
+                )
         return fcsts, cols
 
     def fit_predict(self, models, h, X=None, level=tuple()):
@@ -152,6 +207,26 @@ class GroupedArray(BaseGroupedArray):
         verbose=False,
         target_col="y",
     ):
+        exog = self.data.ndim == 2 and self.data.shape[1] > 1
+        if all(_supports_forecast_batch(m, exog) for m in models):
+            try:
+                return self._forecast_batch(
+                    models=models,
+                    h=h,
+                    fitted=fitted,
+                    level=level,
+                    target_col=target_col,
+                )
+            except NotImplementedError:
+                # configurations that the batch doesn't support run serie by serie below
+                pass
+            except Exception as error:
+                if fallback_model is None:
+                    raise
+                warnings.warn(
+                    f"The batched forecasts failed with {error!r}. "
+                    "Forecasting serie by serie to use the fallback model."
+                )
         fcsts, cuts, has_level_models = self._output_fcst(
             models=models, attr="forecast", h=h, X=X, level=level
         )
@@ -170,7 +245,10 @@ class GroupedArray(BaseGroupedArray):
         iterable = tqdm(
             enumerate(self), disable=(not verbose), total=len(self), desc="Forecast"
         )
-        times = {repr(m): 0.0 for m in models}
+        names = [repr(m) for m in models]
+        times = {name: 0.0 for name in names}
+        layouts = [None] * len(models)
+        fitted_layouts = [None] * len(models)
         for i, grp in iterable:
             y_train = grp[:, 0] if grp.ndim == 2 else grp
             X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
@@ -178,8 +256,6 @@ class GroupedArray(BaseGroupedArray):
                 X_f = X[i]
             else:
                 X_f = None
-            cols = []
-            cols_fitted = []
             for i_model, model in enumerate(models):
                 has_level = has_level_models[i_model]
                 kwargs = {}
@@ -202,41 +278,78 @@ class GroupedArray(BaseGroupedArray):
                         )
                     else:
                         raise error
-                times[repr(model)] += time.perf_counter() - start
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                cols_m = [
-                    f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-                cols += cols_m
+                times[names[i_model]] += time.perf_counter() - start
+                if layouts[i_model] is None:
+                    # the layout of the output is the same for all the series
+                    layouts[i_model] = _output_layout(
+                        res_i, matches, names[i_model], "mean"
+                    )
+                _write_output(
+                    fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]],
+                    res_i,
+                    layouts[i_model][0],
+                )
                 if fitted:
-                    cols_m_fitted = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches_fitted)
-                    ]
-                    fitted_i = np.vstack([res_i[key] for key in cols_m_fitted]).T
-                    cols_m_fitted = [
-                        (
-                            f"{repr(model)}"
-                            if col == "fitted"
-                            else f"{repr(model)}-{col.replace('fitted-', '')}"
+                    if fitted_layouts[i_model] is None:
+                        fitted_layouts[i_model] = _output_layout(
+                            res_i, matches_fitted, names[i_model], "fitted"
                         )
-                        for col in cols_m_fitted
-                    ]
-                    fitted_vals[
-                        self.indptr[i] : self.indptr[i + 1],
-                        (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
-                    ] = fitted_i
-                    cols_fitted += cols_m_fitted
+                    _write_output(
+                        fitted_vals[
+                            self.indptr[i] : self.indptr[i + 1],
+                            (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
+                        ],
+                        res_i,
+                        fitted_layouts[i_model][0],
+                    )
+        cols = [col for _, cols_m in layouts for col in cols_m]
+        result = {"forecasts": fcsts, "cols": cols, "times": times}
+        if fitted:
+            result["fitted"] = {"values": fitted_vals}
+            result["fitted"]["cols"] = [target_col] + [
+                col for _, cols_m in fitted_layouts for col in cols_m
+            ]
+        return result
+
+    def _forecast_batch(self, models, h, fitted=False, level=tuple(), target_col="y"):
+        # same output as `forecast`, each model produces the forecasts
+        # for all the series in a single call to its `forecast_batch` method
+        fcsts, cuts, has_level_models = self._output_fcst(
+            models=models, attr="forecast", h=h, X=None, level=level
+        )
+        matches = ["mean", "lo", "hi"]
+        matches_fitted = ["fitted", "fitted-lo", "fitted-hi"]
+        y = self.data[:, 0] if self.data.ndim == 2 else self.data
+        if fitted:
+            fitted_vals = np.full(
+                (self.data.shape[0], 1 + cuts[-1]), np.nan, dtype=self.data.dtype
+            )
+            fitted_vals[:, 0] = y
+        cols = []
+        cols_fitted = []
+        times = {}
+        for i_model, model in enumerate(models):
+            kwargs = {}
+            if has_level_models[i_model]:
+                kwargs["level"] = level
+            start = time.perf_counter()
+            res = model.forecast_batch(
+                data=y, indptr=self.indptr, h=h, fitted=fitted, **kwargs
+            )
+            times[repr(model)] = time.perf_counter() - start
+            keys_m, cols_m = _output_layout(res, matches, repr(model), "mean")
+            fcsts[:, cuts[i_model] : cuts[i_model + 1]] = np.stack(
+                [res[key].reshape(-1) for key in keys_m], axis=1
+            )
+            cols += cols_m
+            if fitted:
+                keys_m, cols_m = _output_layout(
+                    res, matches_fitted, repr(model), "fitted"
+                )
+                fitted_vals[:, (cuts[i_model] + 1) : (cuts[i_model + 1] + 1)] = (
+                    np.stack([res[key] for key in keys_m], axis=1)
+                )
+                cols_fitted += cols_m
         result = {"forecasts": fcsts, "cols": cols, "times": times}
         if fitted:
             result["fitted"] = {"values": fitted_vals}
@@ -278,7 +391,12 @@ class GroupedArray(BaseGroupedArray):
             fitted_idxs = np.full((self.data.shape[0], n_windows), False, dtype=bool)
             last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
         matches = ["mean", "lo", "hi"]
+        names = [repr(m) for m in models]
+        layouts = [None] * n_models
         steps = list(range(-test_size, -h + 1, step_size))
+        # without refitting, models with a `forward_windows` method compute
+        # the forecasts of all the windows from a single pass over the serie
+        vectorize_windows = refit is False and input_size is None and not fitted
         for i_ts, grp in enumerate(self):
             iterable = tqdm(
                 enumerate(steps, start=0),
@@ -287,6 +405,7 @@ class GroupedArray(BaseGroupedArray):
                 total=len(steps),
             )
             fitted_models = [None for _ in range(n_models)]
+            windowed = [False for _ in range(n_models)]
             for i_window, cutoff in iterable:
                 should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
                 end_cutoff = cutoff + h
@@ -311,8 +430,9 @@ class GroupedArray(BaseGroupedArray):
                     last_fitted_idxs[
                         self.indptr[i_ts] : self.indptr[i_ts + 1], i_window
                     ][cutoff - 1] = True
-                cols = [target_col]
                 for i_model, model in enumerate(models):
+                    if windowed[i_model]:
+                        continue
                     has_level = has_level_models[i_model]
                     kwargs = {}
                     if has_level:
@@ -337,13 +457,42 @@ class GroupedArray(BaseGroupedArray):
                     else:
                         if should_fit:
                             try:
-                                fitted_models[i_model] = model.fit(y=y_train, X=X_train)
+                                # the models are shared by the threads, each fit works on its own copy
+                                fitted_models[i_model] = model.new().fit(
+                                    y=y_train, X=X_train
+                                )
                             except Exception as error:
                                 if fallback_model is None:
                                     raise error
                                 fitted_models[i_model] = fallback_model.new().fit(
                                     y=y_train, X=X_train
                                 )
+                            if vectorize_windows and hasattr(
+                                fitted_models[i_model], "forward_windows"
+                            ):
+                                y_all = grp[: steps[-1]]
+                                res_w = fitted_models[i_model].forward_windows(
+                                    h=h,
+                                    y=y_all[:, 0] if y_all.ndim == 2 else y_all,
+                                    cutoffs=grp.shape[0] + np.array(steps),
+                                    **kwargs,
+                                )
+                                if layouts[i_model] is None:
+                                    layouts[i_model] = _output_layout(
+                                        res_w, matches, names[i_model], "mean"
+                                    )
+                                _write_output(
+                                    out[
+                                        i_ts,
+                                        :,
+                                        :,
+                                        (1 + cuts[i_model]) : (1 + cuts[i_model + 1]),
+                                    ],
+                                    res_w,
+                                    layouts[i_model][0],
+                                )
+                                windowed[i_model] = True
+                                continue
                         res_i = fitted_models[i_model].forward(
                             h=h,
                             y=y_train,
@@ -352,33 +501,35 @@ class GroupedArray(BaseGroupedArray):
                             fitted=fitted,
                             **kwargs,
                         )
-                    cols_m = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches)
-                    ]
-                    fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                    cols_m = [
-                        f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                        for col in cols_m
-                    ]
-                    out[
-                        i_ts, i_window, :, (1 + cuts[i_model]) : (1 + cuts[i_model + 1])
-                    ] = fcsts_i
+                    if layouts[i_model] is None:
+                        # the layout of the output is the same for all the series and windows
+                        layouts[i_model] = _output_layout(
+                            res_i, matches, names[i_model], "mean"
+                        )
+                    _write_output(
+                        out[
+                            i_ts,
+                            i_window,
+                            :,
+                            (1 + cuts[i_model]) : (1 + cuts[i_model + 1]),
+                        ],
+                        res_i,
+                        layouts[i_model][0],
+                    )
                     if fitted:
                         fitted_vals[
                             self.indptr[i_ts] : self.indptr[i_ts + 1],
                             i_window,
                             i_model + 1,
                         ][(cutoff - in_size_disp) : cutoff] = res_i["fitted"]
-                    cols += cols_m
+        cols = [target_col] + [col for _, cols_m in layouts for col in cols_m]
         result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": cols}
         if fitted:
             result["fitted"] = {
                 "values": fitted_vals,
                 "idxs": fitted_idxs,
                 "last_idxs": last_fitted_idxs,
-                "cols": [target_col] + [repr(model) for model in models],
+                "cols": [target_col] + names,
             }
         return result
 
@@ -386,22 +537,27 @@ class GroupedArray(BaseGroupedArray):
         data, indptr = super().take(idxs)
         return GroupedArray(data, indptr)
 
-    def split(self, n_chunks):
-        n_chunks = min(n_chunks, self.n_groups)
+    def _slice(self, start, end):
+        # series [start, end) sharing the data of this array
+        indptr = self.indptr[start : end + 1]
+        return GroupedArray(self.data[indptr[0] : indptr[-1]], indptr - indptr[0])
+
+    def split(self, n_chunks, costs=None):
         return [
-            self.take(idxs) for idxs in np.array_split(range(self.n_groups), n_chunks)
+            self._slice(idxs[0], idxs[-1] + 1)
+            for idxs in _split_idxs(self.n_groups, n_chunks, costs)
         ]
 
-    def split_fm(self, fm, n_chunks):
+    def split_fm(self, fm, n_chunks, costs=None):
         return [
             fm[idxs]
-            for idxs in np.array_split(range(self.n_groups), n_chunks)
+            for idxs in _split_idxs(self.n_groups, n_chunks, costs)
             if idxs.size
         ]
 
     @_controller.wrap(limits=1)
-    def _single_threaded_fit(self, models, fallback_model=None):
-        return self.fit(models=models, fallback_model=fallback_model)
+    def _single_threaded_fit(self, models, fallback_model=None, init_fm=None):
+        return self.fit(models=models, fallback_model=fallback_model, init_fm=init_fm)
 
     @_controller.wrap(limits=1)
     def _single_threaded_predict(self, fm, h, X=None, level=tuple()):
@@ -463,7 +619,153 @@ class GroupedArray(BaseGroupedArray):
             target_col=target_col,
         )
 
-# %% ../../nbs/src/core/core.ipynb 24
+# %% ../../nbs/src/core/core.ipynb 28
+class _SharedArray:
+    """Numpy array stored in shared memory.
+    Only its name, shape and dtype are pickled, so it can be sent to other processes without copying its data.
+    """
+
+    def __init__(self, shape, dtype):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = int(np.prod(self.shape)) * self.dtype.itemsize
+        # the process that creates the memory block is responsible for releasing it
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        self.name = self._shm.name
+
+    @classmethod
+    def from_array(cls, arr):
+        shared = cls(arr.shape, arr.dtype)
+        shared.write(0, arr)
+        return shared
+
+    def __getstate__(self):
+        return {"name": self.name, "shape": self.shape, "dtype": self.dtype}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = None
+
+    def _apply(self, fn):
+        # the array that uses the buffer must be released before closing the memory block
+        shm = self._shm if self._shm is not None else SharedMemory(name=self.name)
+        try:
+            return fn(np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf))
+        finally:
+            if shm is not self._shm:
+                shm.close()
+
+    def read(self, start=0, end=None):
+        return self._apply(lambda arr: arr[start:end].copy())
+
+    def write(self, start, values):
+        def _write(arr):
+            arr[start : start + values.shape[0]] = values
+
+        self._apply(_write)
+
+    def unlink(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class _SharedGroupedArray:
+    """GroupedArray stored in shared memory. The workers read only the series from their chunk."""
+
+    def __init__(self, ga):
+        self.data = _SharedArray.from_array(ga.data)
+        self.indptr = _SharedArray.from_array(ga.indptr)
+        self.n_groups = ga.n_groups
+
+    def split(self, n_chunks, costs=None):
+        return [
+            _GroupedArrayChunk(self, idxs[0], idxs[-1] + 1)
+            for idxs in _split_idxs(self.n_groups, n_chunks, costs)
+        ]
+
+    def unlink(self):
+        self.data.unlink()
+        self.indptr.unlink()
+
+
+def _maybe_load(x):
+    return x.load() if isinstance(x, _GroupedArrayChunk) else x
+
+
+class _GroupedArrayChunk:
+    """Series [start, end) of a `_SharedGroupedArray`.
+    Exposes the methods used by the parallel backend, the data is loaded by the worker that runs them.
+    """
+
+    def __init__(self, shared, start, end):
+        self.shared = shared
+        self.start = start
+        self.end = end
+
+    def load(self):
+        indptr = self.shared.indptr.read(self.start, self.end + 1)
+        data = self.shared.data.read(indptr[0], indptr[-1])
+        return GroupedArray(data, indptr - indptr[0])
+
+    def _call(self, method, *args, **kwargs):
+        args = [_maybe_load(arg) for arg in args]
+        kwargs = {k: _maybe_load(v) for k, v in kwargs.items()}
+        return getattr(self.load(), method)(*args, **kwargs)
+
+    def _single_threaded_fit(self, *args, **kwargs):
+        return self._call("_single_threaded_fit", *args, **kwargs)
+
+    def _single_threaded_predict(self, *args, **kwargs):
+        return self._call("_single_threaded_predict", *args, **kwargs)
+
+    def _single_threaded_fit_predict(self, *args, **kwargs):
+        return self._call("_single_threaded_fit_predict", *args, **kwargs)
+
+    def _single_threaded_cross_validation(self, *args, **kwargs):
+        return self._call("_single_threaded_cross_validation", *args, **kwargs)
+
+    def _single_threaded_forecast(self, *args, out=None, **kwargs):
+        res = self._call("_single_threaded_forecast", *args, **kwargs)
+        if out is None:
+            return res
+        # write the outputs in place and only send back the metadata
+        fcsts, fitted_vals = out
+        fcsts.write(self.start * kwargs["h"], res.pop("forecasts"))
+        if fitted_vals is not None:
+            fitted_vals.write(
+                self.shared.indptr.read(self.start, self.start + 1)[0],
+                res["fitted"].pop("values"),
+            )
+        return res
+
+
+class _SharedMemoryManager:
+    """Keeps track of the arrays placed in shared memory and releases them on exit."""
+
+    def __init__(self):
+        self.arrays = []
+
+    def empty(self, shape, dtype):
+        arr = _SharedArray(shape, dtype)
+        self.arrays.append(arr)
+        return arr
+
+    def grouped_array(self, ga):
+        shared = _SharedGroupedArray(ga)
+        self.arrays.append(shared)
+        return shared
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        for arr in self.arrays:
+            arr.unlink()
+        self.arrays = []
+
+# %% ../../nbs/src/core/core.ipynb 30
 def _get_n_jobs(n_groups, n_jobs):
     if n_jobs == -1 or (n_jobs is None):
         actual_n_jobs = os.cpu_count()
@@ -471,7 +773,7 @@ def _get_n_jobs(n_groups, n_jobs):
         actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../../nbs/src/core/core.ipynb 27
+# %% ../../nbs/src/core/core.ipynb 34
 def _warn_df_constructor():
     warnings.warn(
         "The `df` argument of the StatsForecast constructor as well as reusing stored "
@@ -502,7 +804,50 @@ def _warn_id_as_idx():
 def _id_as_idx() -> bool:
     return not bool(os.getenv("NIXTLA_ID_AS_COL", ""))
 
-# %% ../../nbs/src/core/core.ipynb 28
+# %% ../../nbs/src/core/core.ipynb 35
+def _series_batches(path, batch_size, id_col):
+    # yields pandas DataFrames with complete series from a parquet dataset
+    # in which the rows of each serie are contiguous
+    import pyarrow.dataset as pds
+
+    dataset = pds.dataset(path, format="parquet", partitioning="hive")
+    pending = []
+    n_pending = 0
+    seen_ids = set()
+
+    def check_ids(df):
+        ids = set(df[id_col].unique())
+        if not seen_ids.isdisjoint(ids):
+            raise ValueError(
+                f"The rows of each serie must be contiguous in the dataset, please sort it by `{id_col}` "
+                f"or partition it by `{id_col}`."
+            )
+        seen_ids.update(ids)
+
+    for record_batch in dataset.to_batches(batch_size=batch_size):
+        if not record_batch.num_rows:
+            continue
+        pending.append(record_batch.to_pandas())
+        n_pending += record_batch.num_rows
+        if n_pending < batch_size:
+            continue
+        df = pd.concat(pending, ignore_index=True)
+        ids = df[id_col].to_numpy()
+        # the last serie can continue in the next batch
+        other_ids = np.flatnonzero(ids != ids[-1])
+        if not other_ids.size:
+            continue
+        cut = other_ids[-1] + 1
+        check_ids(df.iloc[:cut])
+        yield df.iloc[:cut]
+        pending = [df.iloc[cut:]]
+        n_pending = len(pending[0])
+    if n_pending:
+        df = pd.concat(pending, ignore_index=True)
+        check_ids(df)
+        yield df
+
+# %% ../../nbs/src/core/core.ipynb 36
 _param_descriptions = {
     "freq": """freq : str or int
             Frequency of the data. Must be a valid pandas or polars offset alias, or an integer.""",
@@ -534,6 +879,18 @@ _param_descriptions = {
             Number of jobs used in the parallel processing, use -1 for all cores.""",
     "verbose": """verbose : bool (default=True)
             Prints TQDM progress bar when `n_jobs=1`.""",
+    "shared_memory": """shared_memory : bool (default=False)
+            When `n_jobs > 1`, place the series in shared memory so that each process only receives the location of its chunk.
+            The output of `forecast` is also written in place by the processes.""",
+    "persistent_pool": """persistent_pool : bool (default=False)
+            Keep the pool of processes created by the first parallel call and reuse it in the following ones.
+            Use `close` or a `with` statement to shut it down.""",
+    "executor": """executor : concurrent.futures.Executor, optional (default=None)
+            Executor used to run the parallel tasks when `n_jobs > 1`, e.g. a `ProcessPoolExecutor`.
+            Its lifecycle is managed by the caller.""",
+    "use_threads": """use_threads : bool, optional (default=None)
+            When `n_jobs > 1`, run the models in a pool of threads that share the series instead of a pool of processes.
+            If None, threads are used when all the models (and the fallback model) have `releases_gil=True`.""",
     "models": """models : List[Any]
             List of instantiated objects models.StatsForecast.""",
     "n_windows": """n_windows : int (default=1)
@@ -549,7 +906,7 @@ _param_descriptions = {
             If int, train the models every `refit` windows.""",
 }
 
-# %% ../../nbs/src/core/core.ipynb 29
+# %% ../../nbs/src/core/core.ipynb 37
 class _StatsForecast:
     """The `StatsForecast` class allows you to efficiently fit multiple `StatsForecast` models
     for large sets of time series. It operates on a DataFrame `df` with at least three columns
@@ -572,6 +929,10 @@ class _StatsForecast:
         sort_df: bool = True,
         fallback_model: Optional[Any] = None,
         verbose: bool = False,
+        shared_memory: bool = False,
+        persistent_pool: bool = False,
+        executor: Optional[Executor] = None,
+        use_threads: Optional[bool] = None,
     ):
         """Train statistical models.
 
@@ -584,6 +945,10 @@ class _StatsForecast:
         {sort_df}
         {fallback_model}
         {verbose}
+        {shared_memory}
+        {persistent_pool}
+        {executor}
+        {use_threads}
         """
         # TODO @fede: needed for residuals, think about it later
         self.models = models
@@ -592,6 +957,11 @@ class _StatsForecast:
         self.n_jobs = n_jobs
         self.fallback_model = fallback_model
         self.verbose = verbose
+        self.shared_memory = shared_memory
+        self.persistent_pool = persistent_pool
+        self.executor = executor
+        self.use_threads = use_threads
+        self._pool = None
         if df is not None:
             _warn_df_constructor()
             self._prepare_fit(df=df, sort_df=sort_df)
@@ -694,6 +1064,8 @@ class _StatsForecast:
 
         Fit `models` to a large set of time series from DataFrame `df`
         and store fitted models for later inspection.
+        Refitting the same series warm starts the models with `warm_start=True`
+        from their previously fitted model of each serie.
 
         Parameters
         ----------
@@ -710,6 +1082,7 @@ class _StatsForecast:
         self : StatsForecast
             Returns with stored `StatsForecast` fitted `models`.
         """
+        prev_uids = getattr(self, "uids", None)
         self._prepare_fit(
             df=df,
             sort_df=sort_df,
@@ -719,20 +1092,26 @@ class _StatsForecast:
         )
         self._validate_sizes_for_prediction_intervals(prediction_intervals)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        init_fm = self._warm_start_fm(prev_uids)
         if self.n_jobs == 1:
             self.fitted_ = self.ga.fit(
-                models=self.models, fallback_model=self.fallback_model
+                models=self.models, fallback_model=self.fallback_model, init_fm=init_fm
             )
         else:
-            self.fitted_ = self._fit_parallel()
+            self.fitted_ = self._fit_parallel(init_fm)
         return self
 
     fit.__doc__ = fit.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
-    def _make_future_df(self, h: int):
-        start_dates = ufp.offset_times(self.last_dates, freq=self.freq, n=1)
+    def _make_future_df(self, h: int, idxs: Optional[np.ndarray] = None):
+        uids = self.uids
+        last_dates = self.last_dates
+        if idxs is not None:
+            uids = ufp.take_rows(uids, idxs)
+            last_dates = ufp.take_rows(last_dates, idxs)
+        start_dates = ufp.offset_times(last_dates, freq=self.freq, n=1)
         dates = ufp.time_ranges(start_dates, freq=self.freq, periods=h)
-        uids = ufp.repeat(self.uids, n=h)
+        uids = ufp.repeat(uids, n=h)
         df = self.df_constructor({self.id_col: uids, self.time_col: dates})
         if isinstance(df, pd.DataFrame):
             if _id_as_idx():
@@ -965,6 +1344,154 @@ class _StatsForecast:
 
     forecast.__doc__ = forecast.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
+    def forecast_iter(
+        self,
+        h: int,
+        df: Optional[DataFrame] = None,
+        X_df: Optional[DataFrame] = None,
+        level: Optional[List[int]] = None,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> Iterator[DataFrame]:
+        """Memory Efficient predictions by chunks of series.
+
+        Analogous to `StatsForecast.forecast`, but the predictions of each chunk of series
+        are yielded as soon as they're computed, so they can be written to a file or a database
+        without holding the predictions of all the series in memory.
+        When `n_jobs > 1` the chunks are yielded in the order they finish.
+
+        Parameters
+        ----------
+        {h}
+        {df}
+        {X_df}
+        {level}
+        {sort_df}
+        {prediction_intervals}
+        {id_col}
+        {time_col}
+        {target_col}
+
+        Returns
+        -------
+        fcsts_dfs : iterator of pandas or polars DataFrame
+            DataFrames with `models` columns for point predictions and probabilistic
+            predictions for the series of each chunk.
+        """
+        self.__dict__.pop("fcst_fitted_values_", None)
+        self._prepare_fit(
+            df=df,
+            sort_df=sort_df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        self._validate_exog(X_df)
+        self._validate_sizes_for_prediction_intervals(prediction_intervals)
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        return self._forecast_iter(h=h, X=X, level=level, target_col=target_col)
+
+    forecast_iter.__doc__ = forecast_iter.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
+    def _forecast_iter(self, h, X, level, target_col):
+        self.forecast_times_ = {repr(m): 0.0 for m in self.models}
+        chunks = tqdm(
+            self._forecast_chunks(h=h, X=X, level=level, target_col=target_col),
+            disable=not self.verbose,
+            total=len(self._chunk_idxs(100)),
+            desc="Forecast",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [Elapsed: {elapsed}{postfix}]",
+        )
+        for idxs, res in chunks:
+            fcsts_df = self._make_future_df(h=h, idxs=idxs)
+            fcsts_df[res["cols"]] = res["forecasts"]
+            for model, elapsed in res["times"].items():
+                self.forecast_times_[model] += elapsed
+            yield fcsts_df
+
+    def forecast_parquet(
+        self,
+        h: int,
+        path: Union[str, Path],
+        output_path: Union[str, Path],
+        level: Optional[List[int]] = None,
+        batch_size: int = 1_000_000,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> None:
+        """Memory Efficient predictions from a Parquet dataset.
+
+        Reads the dataset in batches of complete series, forecasts each batch
+        and appends its predictions to a Parquet file, so neither the panel nor the
+        predictions need to fit in memory. The rows of each serie must be contiguous in the
+        dataset, e.g. sorted by `id_col` or partitioned by `id_col`.
+        Exogenous features aren't supported, the dataset can only have the
+        `id_col`, `time_col` and `target_col` columns.
+
+        Parameters
+        ----------
+        {h}
+        path : str or pathlib.Path
+            Parquet file or directory with a (hive partitioned) Parquet dataset.
+        output_path : str or pathlib.Path
+            Parquet file where the predictions are written.
+        {level}
+        batch_size : int (default=1_000_000)
+            Number of rows read in each batch. Batches are extended to contain complete series.
+        {prediction_intervals}
+        {id_col}
+        {time_col}
+        {target_col}
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        times = {repr(m): 0.0 for m in self.models}
+        # `forecast` caps n_jobs to the number of series of the batch
+        n_jobs = self.n_jobs
+        try:
+            for df in _series_batches(path, batch_size, id_col):
+                exog = [
+                    c for c in df.columns if c not in (id_col, time_col, target_col)
+                ]
+                if exog:
+                    raise ValueError(
+                        f"`forecast_parquet` doesn't support exogenous features, found the columns: {exog}. "
+                        "Please remove them from the dataset or use `forecast` with `X_df`."
+                    )
+                self.n_jobs = n_jobs
+                fcsts_df = self.forecast(
+                    df=df,
+                    h=h,
+                    level=level,
+                    prediction_intervals=prediction_intervals,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                )
+                for model, elapsed in self.forecast_times_.items():
+                    times[model] += elapsed
+                if isinstance(fcsts_df, pd.DataFrame) and fcsts_df.index.name == id_col:
+                    fcsts_df = fcsts_df.reset_index()
+                table = pa.Table.from_pandas(fcsts_df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            self.n_jobs = n_jobs
+            if writer is not None:
+                writer.close()
+        self.forecast_times_ = times
+
+    forecast_parquet.__doc__ = forecast_parquet.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
     def forecast_fitted_values(self):
         """Access insample predictions.
 
@@ -1185,30 +1712,135 @@ class _StatsForecast:
                 df = df.reset_index(drop=True)
         return df
 
-    def _get_pool(self):
-        from multiprocessing import Pool
+    def __getstate__(self):
+        # executors can't be pickled
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        # objects saved by previous versions don't have these attributes
+        state = {
+            "shared_memory": False,
+            "persistent_pool": False,
+            "executor": None,
+            "use_threads": None,
+            **state,
+        }
+        state["_pool"] = None
+        self.__dict__.update(state)
 
-        pool_kwargs = dict()
-        return Pool, pool_kwargs
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shut down the pool of processes kept by `persistent_pool=True`.
+
+        A user provided `executor` isn't shut down."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _threaded(self):
+        if self.executor is not None:
+            return isinstance(self.executor, ThreadPoolExecutor)
+        if self.use_threads is not None:
+            return self.use_threads
+        models = (
+            self.models
+            if self.fallback_model is None
+            else [*self.models, self.fallback_model]
+        )
+        return all(getattr(model, "releases_gil", False) for model in models)
+
+    @contextmanager
+    def _get_executor(self):
+        if self.executor is not None:
+            executor = nullcontext(self.executor)
+        elif self._threaded():
+            executor = ThreadPoolExecutor(self.n_jobs)
+        elif self.persistent_pool:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.n_jobs)
+            executor = nullcontext(self._pool)
+        else:
+            executor = ProcessPoolExecutor(self.n_jobs)
+        # the threads share the BLAS and OpenMP pools of this process
+        limits = _controller.limit(limits=1) if self._threaded() else nullcontext()
+        with limits, executor as ex:
+            yield ex
+
+    def _shared_memory(self):
+        # threads already share the series
+        if self.shared_memory and not self._threaded():
+            return _SharedMemoryManager()
+        return nullcontext()
+
+    def _series_costs(self):
+        # the time to train the models grows with the size of the series
+        return np.diff(self.ga.indptr)
+
+    def _n_chunks(self, tasks_per_job=1):
+        return min(tasks_per_job * self.n_jobs, self.ga.n_groups)
+
+    def _chunk_idxs(self, tasks_per_job=1):
+        # positions of the series in each chunk produced by `_get_gas_Xs`
+        return _split_idxs(
+            self.ga.n_groups, self._n_chunks(tasks_per_job), self._series_costs()
+        )
+
+    def _split(self, ga, n_chunks, shared=None):
+        # ga can also be the future exogenous, which have the same series
+        costs = self._series_costs()
+        if shared is not None:
+            # the workers only receive the offsets of their chunk
+            return shared.grouped_array(ga).split(n_chunks, costs)
+        return ga.split(n_chunks, costs)
+
+    def _warm_start_fm(self, prev_uids):
+        # previously fitted models to warm start from, only if they belong to the same series
+        if not any(getattr(model, "warm_start", False) for model in self.models):
+            return None
+        prev_fm = getattr(self, "fitted_", None)
+        if (
+            prev_fm is None
+            or prev_uids is None
+            or prev_fm.shape != (self.ga.n_groups, len(self.models))
+            or not np.array_equal(np.asarray(prev_uids), np.asarray(self.uids))
+        ):
+            return None
+        return prev_fm
+
+    def _fit_parallel(self, init_fm=None):
+        if init_fm is not None:
+            init_fms = self.ga.split_fm(init_fm, self.n_jobs, self._series_costs())
+        else:
+            from itertools import repeat
 
-    def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+            init_fms = repeat(None)
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            gas = self._split(self.ga, self.n_jobs, shared)
             futures = []
-            for ga in gas:
-                future = executor.apply_async(
-                    ga._single_threaded_fit, (self.models, self.fallback_model)
+            for ga, init_fm_ in zip(gas, init_fms):
+                future = executor.submit(
+                    ga._single_threaded_fit,
+                    self.models,
+                    self.fallback_model,
+                    init_fm_,
                 )
                 futures.append(future)
-            fm = np.vstack([f.get() for f in futures])
+            fm = np.vstack([f.result() for f in futures])
         return fm
 
-    def _get_gas_Xs(self, X, tasks_per_job=1):
-        n_chunks = min(tasks_per_job * self.n_jobs, self.ga.n_groups)
-        gas = self.ga.split(n_chunks)
+    def _get_gas_Xs(self, X, tasks_per_job=1, shared=None):
+        n_chunks = self._n_chunks(tasks_per_job)
+        gas = self._split(self.ga, n_chunks, shared)
         if X is not None:
-            Xs = X.split(n_chunks)
+            Xs = self._split(X, n_chunks, shared)
         else:
             from itertools import repeat
 
@@ -1216,63 +1848,109 @@ class _StatsForecast:
         return gas, Xs
 
     def _predict_parallel(self, h, X, level):
-        # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        fms = self.ga.split_fm(self.fitted_, self.n_jobs, self._series_costs())
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            # create elements for each core
+            gas, Xs = self._get_gas_Xs(X=X, shared=shared)
             futures = []
             for ga, fm, X_ in zip(gas, fms, Xs):
-                future = executor.apply_async(
-                    ga._single_threaded_predict,
-                    (fm, h, X_, level),
-                )
+                future = executor.submit(ga._single_threaded_predict, fm, h, X_, level)
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fcsts, cols = list(zip(*out))
             fcsts = np.vstack(fcsts)
             cols = cols[0]
         return fcsts, cols
 
     def _fit_predict_parallel(self, h, X, level):
-        # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            # create elements for each core
+            gas, Xs = self._get_gas_Xs(X=X, shared=shared)
             futures = []
             for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
-                    ga._single_threaded_fit_predict,
-                    (self.models, h, X_, level),
+                future = executor.submit(
+                    ga._single_threaded_fit_predict, self.models, h, X_, level
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fm, fcsts, cols = list(zip(*out))
             fm = np.vstack(fm)
             fcsts = np.vstack(fcsts)
             cols = cols[0]
         return fm, fcsts, cols
 
+    def _submit_forecast(self, executor, gas, Xs, **kwargs):
+        # send the most expensive chunks first, so that they don't run alone at the end
+        costs = self._series_costs()
+        chunk_costs = np.array([costs[idxs].sum() for idxs in self._chunk_idxs(100)])
+        tasks = list(zip(gas, Xs))
+        return {
+            executor.submit(
+                tasks[i][0]._single_threaded_forecast, X=tasks[i][1], **kwargs
+            ): i
+            for i in np.argsort(-chunk_costs, kind="stable")
+        }
+
+    def _forecast_chunks(self, h, X, level, target_col):
+        # yields the positions of the series of each chunk along with their forecasts
+        kwargs = dict(
+            h=h,
+            models=self.models,
+            fallback_model=self.fallback_model,
+            level=level,
+            verbose=False,
+            target_col=target_col,
+        )
+        idxs = self._chunk_idxs(100)
+        if self.n_jobs == 1:
+            gas, Xs = self._get_gas_Xs(X=X, tasks_per_job=100)
+            for i, (ga, X_) in enumerate(zip(gas, Xs)):
+                yield idxs[i], ga.forecast(X=X_, **kwargs)
+            return
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            gas, Xs = self._get_gas_Xs(X=X, tasks_per_job=100, shared=shared)
+            future2pos = self._submit_forecast(executor, gas, Xs, **kwargs)
+            try:
+                for future in as_completed(future2pos):
+                    yield idxs[future2pos[future]], future.result()
+            finally:
+                # the consumer can stop early
+                for future in future2pos:
+                    future.cancel()
+
     def _forecast_parallel(self, h, fitted, X, level, target_col):
-        gas, Xs = self._get_gas_Xs(X=X, tasks_per_job=100)
-        results = [None] * len(gas)
-        with ProcessPoolExecutor(self.n_jobs) as executor:
-            future2pos = {
-                executor.submit(
-                    ga._single_threaded_forecast,
-                    h=h,
-                    models=self.models,
-                    fallback_model=self.fallback_model,
-                    fitted=fitted,
-                    X=X,
-                    level=level,
-                    verbose=False,
-                    target_col=target_col,
-                ): i
-                for i, (ga, X) in enumerate(zip(gas, Xs))
-            }
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            gas, Xs = self._get_gas_Xs(X=X, tasks_per_job=100, shared=shared)
+            results = [None] * len(gas)
+            kwargs = {}
+            if shared is not None:
+                # the workers write their forecasts in place
+                cuts, _ = self.ga._get_cols(
+                    models=self.models, attr="forecast", h=h, X=X, level=level
+                )
+                dtype = self.ga.data.dtype
+                fcsts = shared.empty((self.ga.n_groups * h, cuts[-1]), dtype)
+                fitted_vals = (
+                    shared.empty((self.ga.data.shape[0], 1 + cuts[-1]), dtype)
+                    if fitted
+                    else None
+                )
+                kwargs["out"] = (fcsts, fitted_vals)
+            future2pos = self._submit_forecast(
+                executor,
+                gas,
+                Xs,
+                h=h,
+                models=self.models,
+                fallback_model=self.fallback_model,
+                fitted=fitted,
+                level=level,
+                verbose=False,
+                target_col=target_col,
+                **kwargs,
+            )
             iterable = tqdm(
                 as_completed(future2pos),
                 disable=not self.verbose,
@@ -1283,9 +1961,17 @@ class _StatsForecast:
             for future in iterable:
                 i = future2pos[future]
                 results[i] = future.result()
+            if shared is not None:
+                fcsts = fcsts.read()
+                if fitted:
+                    fitted_vals = fitted_vals.read()
+            else:
+                fcsts = np.vstack([r["forecasts"] for r in results])
+                if fitted:
+                    fitted_vals = np.vstack([r["fitted"]["values"] for r in results])
         result = {
             "cols": results[0]["cols"],
-            "forecasts": np.vstack([r["forecasts"] for r in results]),
+            "forecasts": fcsts,
             "times": {
                 m: sum(r["times"][m] for r in results)
                 for m in [repr(m) for m in self.models]
@@ -1294,40 +1980,36 @@ class _StatsForecast:
         if fitted:
             result["fitted"] = {
                 "cols": results[0]["fitted"]["cols"],
-                "values": np.vstack([r["fitted"]["values"] for r in results]),
+                "values": fitted_vals,
             }
         return result
 
     def _cross_validation_parallel(
         self, h, test_size, step_size, input_size, fitted, level, refit, target_col
     ):
-        # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
         result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._shared_memory() as shared, self._get_executor() as executor:
+            # create elements for each core
+            gas = self._split(self.ga, self.n_jobs, shared)
             futures = []
             for ga in gas:
-                future = executor.apply_async(
+                future = executor.submit(
                     ga._single_threaded_cross_validation,
-                    tuple(),
-                    dict(
-                        models=self.models,
-                        h=h,
-                        test_size=test_size,
-                        fallback_model=self.fallback_model,
-                        step_size=step_size,
-                        input_size=input_size,
-                        fitted=fitted,
-                        level=level,
-                        refit=refit,
-                        verbose=self.verbose,
-                        target_col=target_col,
-                    ),
+                    models=self.models,
+                    h=h,
+                    test_size=test_size,
+                    fallback_model=self.fallback_model,
+                    step_size=step_size,
+                    input_size=input_size,
+                    fitted=fitted,
+                    level=level,
+                    refit=refit,
+                    verbose=self.verbose,
+                    target_col=target_col,
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fcsts = [d["forecasts"] for d in out]
             fcsts = np.vstack(fcsts)
             cols = out[0]["cols"]
@@ -1539,7 +2221,7 @@ class _StatsForecast:
 
 _StatsForecast.plot.__doc__ = _StatsForecast.plot.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
-# %% ../../nbs/src/core/core.ipynb 30
+# %% ../../nbs/src/core/core.ipynb 38
 class ParallelBackend:
     def forecast(
         self,
@@ -1620,7 +2302,7 @@ class ParallelBackend:
 def make_backend(obj: Any, *args: Any, **kwargs: Any) -> ParallelBackend:
     return ParallelBackend()
 
-# %% ../../nbs/src/core/core.ipynb 31
+# %% ../../nbs/src/core/core.ipynb 39
 class StatsForecast(_StatsForecast):
     def forecast(
         self,
@@ -5,12 +5,14 @@ __all__ = ['ets_f']
 
 # %% ../../nbs/src/ets.ipynb 2
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from statsmodels.tsa.seasonal import seasonal_decompose
 
 from ._lib import ets as _ets
-from .utils import _calculate_intervals, results
+from .utils import _calculate_intervals, _quantiles, results
 
 # %% ../../nbs/src/ets.ipynb 5
 # Global variables
@@ -29,71 +31,26 @@ def etssimulate(
     beta: float,
     gamma: float,
     phi: float,
-    h: int,
-    y: np.ndarray,
     e: np.ndarray,
-) -> None:
-    oldb = 0.0
-    olds = np.zeros(24)
-    s = np.zeros(24)
-    f = np.zeros(10)
-    if m > 24 and season != _ets.Component.Nothing:
-        return
-    elif m < 1:
-        m = 1
-    # Copy initial state components
-    l = x[0]
-    if trend != _ets.Component.Nothing:
-        b = x[1]
-    if season != _ets.Component.Nothing:
-        for j in range(m):
-            s[j] = x[(trend != _ets.Component.Nothing) + j + 1]
-    for i in range(h):
-        # Copy previous state
-        oldl = l
-        if trend != _ets.Component.Nothing:
-            oldb = b
-        if season != _ets.Component.Nothing:
-            for j in range(m):
-                olds[j] = s[j]
-        # one step forecast
-        _ets.forecast(
-            f,
-            oldl,
-            oldb,
-            olds,
-            m,
-            trend,
-            season,
-            phi,
-            1,
-        )
-        if math.fabs(f[0] - _ets.NA) < _ets.TOL:
-            y[0] = _ets.NA
-            return
-        if error == _ets.Component.Additive:
-            y[i] = f[0] + e[i]
-        else:
-            y[i] = f[0] * (1.0 + e[i])
-        # Update state
-        l, b = _ets.update(
-            s,
-            l,
-            b,
-            oldl,
-            oldb,
-            olds,
-            m,
-            trend,
-            season,
-            alpha,
-            beta,
-            gamma,
-            phi,
-            y[i],
-        )
+) -> np.ndarray:
+    """Simulates sample paths starting from the state `x`.
 
-# %% ../../nbs/src/ets.ipynb 7
+    Each row of `e` holds the errors of one path. Returns an array with the shape of `e`.
+    """
+    return _ets.simulate(
+        x,
+        m,
+        error,
+        trend,
+        season,
+        alpha,
+        beta,
+        gamma,
+        phi,
+        np.ascontiguousarray(e, dtype=np.float64),
+    )
+
+# %% ../../nbs/src/ets.ipynb 8
 def etsforecast(
     x: np.ndarray,
     m: int,
@@ -127,7 +84,7 @@ def etsforecast(
         h,
     )
 
-# %% ../../nbs/src/ets.ipynb 10
+# %% ../../nbs/src/ets.ipynb 11
 def initparam(
     alpha: float,
     beta: float,
@@ -171,7 +128,7 @@ def initparam(
             phi = upper[3] - 1e-3
     return {"alpha": alpha, "beta": beta, "gamma": gamma, "phi": phi}
 
-# %% ../../nbs/src/ets.ipynb 12
+# %% ../../nbs/src/ets.ipynb 13
 def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
     if np.isnan(phi):
         phi = 1
@@ -208,7 +165,7 @@ def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
     # passed all tests
     return True
 
-# %% ../../nbs/src/ets.ipynb 13
+# %% ../../nbs/src/ets.ipynb 14
 def check_param(
     alpha: float,
     beta: float,
@@ -237,7 +194,7 @@ def check_param(
             return False
     return True
 
-# %% ../../nbs/src/ets.ipynb 14
+# %% ../../nbs/src/ets.ipynb 15
 def fourier(x, period, K, h=None):
     if h is None:
         times = np.arange(1, len(x) + 1)
@@ -264,41 +221,51 @@ def fourier(x, period, K, h=None):
     X = X[:, ~np.isnan(X.sum(axis=0))]
     return X
 
-# %% ../../nbs/src/ets.ipynb 16
-def initstate(y, m, trendtype, seasontype):
+# %% ../../nbs/src/ets.ipynb 17
+def initseason(y, m, seasontype):
+    # initial seasonal states and seasonally adjusted series, they only
+    # depend on the season type so they can be shared by several models
     n = len(y)
-    if seasontype != "N":
-        if n < 4:
-            raise ValueError("You've got to be joking (not enough data).")
-        elif n < 3 * m:  # fit simple Fourier model
-            fouriery = fourier(y, [m], [1])
-            X_fourier = np.full((n, 4), fill_value=np.nan)
-            X_fourier[:, 0] = np.ones(n)
-            X_fourier[:, 1] = np.arange(1, n + 1)
-            X_fourier[:, 2:4] = fouriery
-            coefs, *_ = np.linalg.lstsq(X_fourier, y, rcond=-1)
-            if seasontype == "A":
-                y_d = dict(seasonal=y - coefs[0] - coefs[1] * X_fourier[:, 1])
-            else:
-                if not min(y) > 0:
-                    raise Exception(
-                        "Multiplicative seasonality is not appropriate for zero and negative values"
-                    )
-                y_d = dict(seasonal=y / (coefs[0] + coefs[1] * X_fourier[:, 1]))
-        else:
-            # n is large enough to do a decomposition
-            y_d = seasonal_decompose(
-                y, period=m, model="additive" if seasontype == "A" else "multiplicative"
-            )
-            y_d = dict(seasonal=y_d.seasonal)
-        init_seas = y_d["seasonal"][1:m][::-1]
+    if n < 4:
+        raise ValueError("You've got to be joking (not enough data).")
+    elif n < 3 * m:  # fit simple Fourier model
+        fouriery = fourier(y, [m], [1])
+        X_fourier = np.full((n, 4), fill_value=np.nan)
+        X_fourier[:, 0] = np.ones(n)
+        X_fourier[:, 1] = np.arange(1, n + 1)
+        X_fourier[:, 2:4] = fouriery
+        coefs, *_ = np.linalg.lstsq(X_fourier, y, rcond=-1)
         if seasontype == "A":
-            y_sa = y - y_d["seasonal"]
+            y_d = dict(seasonal=y - coefs[0] - coefs[1] * X_fourier[:, 1])
         else:
-            init_seas = np.clip(init_seas, a_min=1e-2, a_max=None)
-            if init_seas.sum() > m:
-                init_seas = init_seas / np.sum(init_seas + 1e-2)
-            y_sa = y / np.clip(y_d["seasonal"], a_min=1e-2, a_max=None)
+            if not min(y) > 0:
+                raise Exception(
+                    "Multiplicative seasonality is not appropriate for zero and negative values"
+                )
+            y_d = dict(seasonal=y / (coefs[0] + coefs[1] * X_fourier[:, 1]))
+    else:
+        # n is large enough to do a decomposition
+        y_d = seasonal_decompose(
+            y, period=m, model="additive" if seasontype == "A" else "multiplicative"
+        )
+        y_d = dict(seasonal=y_d.seasonal)
+    init_seas = y_d["seasonal"][1:m][::-1]
+    if seasontype == "A":
+        y_sa = y - y_d["seasonal"]
+    else:
+        init_seas = np.clip(init_seas, a_min=1e-2, a_max=None)
+        if init_seas.sum() > m:
+            init_seas = init_seas / np.sum(init_seas + 1e-2)
+        y_sa = y / np.clip(y_d["seasonal"], a_min=1e-2, a_max=None)
+    return init_seas, y_sa
+
+
+def initstate(y, m, trendtype, seasontype, seasonal=None):
+    n = len(y)
+    if seasontype != "N":
+        if seasonal is None:
+            seasonal = initseason(y, m, seasontype)
+        init_seas, y_sa = seasonal
     else:
         m = 1
         init_seas = []
@@ -342,7 +309,7 @@ def initstate(y, m, trendtype, seasontype):
                 b0 = max(y_sa[1] / div, 1e-3)
     return np.concatenate([[l0, b0], init_seas])
 
-# %% ../../nbs/src/ets.ipynb 20
+# %% ../../nbs/src/ets.ipynb 21
 def switch(x: str) -> _ets.Component:
     if x == "N":
         return _ets.Component.Nothing
@@ -352,7 +319,7 @@ def switch(x: str) -> _ets.Component:
         return _ets.Component.Multiplicative
     raise ValueError(f"Unknown component {x}")
 
-# %% ../../nbs/src/ets.ipynb 22
+# %% ../../nbs/src/ets.ipynb 23
 def switch_criterion(x: str) -> _ets.Criterion:
     if x == "lik":
         return _ets.Criterion.Likelihood
@@ -366,7 +333,17 @@ def switch_criterion(x: str) -> _ets.Criterion:
         return _ets.Criterion.MAE
     raise ValueError(f"Unknown crtierion {x}")
 
-# %% ../../nbs/src/ets.ipynb 24
+
+def switch_ic(x: str) -> _ets.InformationCriterion:
+    if x == "aic":
+        return _ets.InformationCriterion.AIC
+    if x == "bic":
+        return _ets.InformationCriterion.BIC
+    if x == "aicc":
+        return _ets.InformationCriterion.AICC
+    raise ValueError(f"Unknown information criterion {x}")
+
+# %% ../../nbs/src/ets.ipynb 25
 def pegelsresid_C(
     y: np.ndarray,
     m: int,
@@ -414,26 +391,10 @@ def pegelsresid_C(
             lik = np.nan
     return amse, e, x, lik
 
-# %% ../../nbs/src/ets.ipynb 25
-def optimize_ets_target_fn(
-    x0,
-    par,
-    y,
-    nstate,
-    errortype,
-    trendtype,
-    seasontype,
-    damped,
-    par_noopt,
-    lowerb,
-    upperb,
-    opt_crit,
-    nmse,
-    bounds,
-    m,
-    pnames,
-    pnames2,
-):
+# %% ../../nbs/src/ets.ipynb 26
+def _optimize_args(par, par_noopt, trendtype, seasontype, damped, m):
+    # season length, smoothing parameters to optimize and values of the
+    # smoothing parameters taken by the optimizer
     alpha = par_noopt["alpha"] if np.isnan(par["alpha"]) else par["alpha"]
     if np.isnan(alpha):
         raise ValueError("alpha problem!")
@@ -477,6 +438,29 @@ def optimize_ets_target_fn(
         beta = 0.0
     if seasontype == "N":
         gamma = 0.0
+    return m, [optAlpha, optBeta, optGamma, optPhi], [alpha, beta, gamma, phi]
+
+
+def optimize_ets_target_fn(
+    x0,
+    par,
+    y,
+    nstate,
+    errortype,
+    trendtype,
+    seasontype,
+    damped,
+    par_noopt,
+    lowerb,
+    upperb,
+    opt_crit,
+    nmse,
+    bounds,
+    m,
+    pnames,
+    pnames2,
+):
+    m, opt, fixed = _optimize_args(par, par_noopt, trendtype, seasontype, damped, m)
     opt_res = _ets.optimize(
         x0,
         y,
@@ -487,14 +471,8 @@ def optimize_ets_target_fn(
         switch_criterion(opt_crit),
         nmse,
         m,
-        optAlpha,
-        optBeta,
-        optGamma,
-        optPhi,
-        alpha,
-        beta,
-        gamma,
-        phi,
+        *opt,
+        *fixed,
         lowerb,
         upperb,
         1e-4,
@@ -503,11 +481,10 @@ def optimize_ets_target_fn(
     )
     return results(*opt_res, None)
 
-# %% ../../nbs/src/ets.ipynb 26
-def etsmodel(
+# %% ../../nbs/src/ets.ipynb 27
+def _init_etsmodel(
     y: np.ndarray,
     m: int,
-    errortype: str,
     trendtype: str,
     seasontype: str,
     damped: bool,
@@ -517,14 +494,10 @@ def etsmodel(
     phi: float,
     lower: np.ndarray,
     upper: np.ndarray,
-    opt_crit: str,
-    nmse: int,
     bounds: str,
-    maxit: int = 2_000,
-    control=None,
-    seed=None,
-    trace: bool = False,
+    init_state=None,
 ):
+    # starting point and bounds of the optimization of etsmodel
     if seasontype == "N":
         m = 1
     # if not np.isnan(alpha):
@@ -549,7 +522,8 @@ def etsmodel(
     if not check_param(alpha, beta, gamma, phi, lower, upper, bounds, m):
         raise Exception("Parameters out of range")
     # initialize state
-    init_state = initstate(y, m, trendtype, seasontype)
+    if init_state is None:
+        init_state = initstate(y, m, trendtype, seasontype)
     nstate = len(init_state)
     par_ = {key: val for key, val in par_.items() if not np.isnan(val)}
     par = np.full(len(par_) + nstate, fill_value=np.nan)
@@ -563,39 +537,36 @@ def etsmodel(
             lower_[j] = lower[i]
             upper_[j] = upper[i]
             j += 1
-    lower = lower_
-    upper = upper_
-    np_ = len(par)
-    if np_ >= len(y) - 1:
-        return dict(
-            aic=np.inf,
-            bic=np.inf,
-            aicc=np.inf,
-            mse=np.inf,
-            amse=np.inf,
-            fit=None,
-            par=par,
-            states=init_state,
-        )
-    fred = optimize_ets_target_fn(
-        x0=par,
-        par=par_,
-        y=y,
-        nstate=nstate,
-        errortype=errortype,
-        trendtype=trendtype,
-        seasontype=seasontype,
-        damped=damped,
-        par_noopt=par_noopt,
-        lowerb=lower,
-        upperb=upper,
-        opt_crit=opt_crit,
-        nmse=nmse,
-        bounds=bounds,
+    return dict(
         m=m,
-        pnames=par_.keys(),
-        pnames2=par_noopt.keys(),
+        par=par,
+        par_=par_,
+        par_noopt=par_noopt,
+        lower=lower_,
+        upper=upper_,
+        init_state=init_state,
+        nstate=nstate,
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
     )
+
+
+def _fitted_etsmodel(
+    y: np.ndarray,
+    init: dict,
+    errortype: str,
+    trendtype: str,
+    seasontype: str,
+    damped: bool,
+    nmse: int,
+    fred,
+):
+    # etsmodel from the result of the optimization started at init
+    m = init["m"]
+    nstate = init["nstate"]
+    alpha, beta, gamma, phi = [init[pr] for pr in ["alpha", "beta", "gamma", "phi"]]
     fit_par = fred.x
     init_state = fit_par[-nstate:]
     if seasontype != "N":
@@ -636,7 +607,7 @@ def etsmodel(
         phi,
         nmse,
     )
-    np_ = np_ + 1
+    np_ = len(init["par"]) + 1
     ny = len(y)
     aic = lik + 2 * np_
     bic = lik + np.log(ny) * np_
@@ -675,11 +646,208 @@ def etsmodel(
         n_params=np_,
     )
 
-# %% ../../nbs/src/ets.ipynb 28
+
+def etsmodel(
+    y: np.ndarray,
+    m: int,
+    errortype: str,
+    trendtype: str,
+    seasontype: str,
+    damped: bool,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    phi: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    opt_crit: str,
+    nmse: int,
+    bounds: str,
+    maxit: int = 2_000,
+    control=None,
+    seed=None,
+    trace: bool = False,
+):
+    init = _init_etsmodel(
+        y,
+        m,
+        trendtype,
+        seasontype,
+        damped,
+        alpha,
+        beta,
+        gamma,
+        phi,
+        lower,
+        upper,
+        bounds,
+    )
+    par = init["par"]
+    if len(par) >= len(y) - 1:
+        return dict(
+            aic=np.inf,
+            bic=np.inf,
+            aicc=np.inf,
+            mse=np.inf,
+            amse=np.inf,
+            fit=None,
+            par=par,
+            states=init["init_state"],
+        )
+    fred = optimize_ets_target_fn(
+        x0=par,
+        par=init["par_"],
+        y=y,
+        nstate=init["nstate"],
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=damped,
+        par_noopt=init["par_noopt"],
+        lowerb=init["lower"],
+        upperb=init["upper"],
+        opt_crit=opt_crit,
+        nmse=nmse,
+        bounds=bounds,
+        m=init["m"],
+        pnames=init["par_"].keys(),
+        pnames2=init["par_noopt"].keys(),
+    )
+    return _fitted_etsmodel(
+        y, init, errortype, trendtype, seasontype, damped, nmse, fred
+    )
+
+
+def select_etsmodel(
+    y: np.ndarray,
+    m: int,
+    candidates: list,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    phi: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    opt_crit: str,
+    nmse: int,
+    bounds: str,
+    ic: str,
+    n_jobs: int = 1,
+):
+    """Fits the candidate models natively and returns the best one.
+
+    `candidates` holds the (error, trend, season, damped) of each model. Their initial
+    states are computed once per trend and season types. The information criteria of
+    all the candidates are stored in the `ics` entry of the returned model.
+    With `n_jobs=1` all the candidates are fitted in a single call, otherwise they're
+    fitted concurrently by a pool of threads, selecting the same model."""
+    if not candidates:
+        raise Exception("no model able to be fitted")
+    seasonals = {}
+    init_states = {}
+    inits = []
+    for etype, ttype, stype, dtype in candidates:
+        if (ttype, stype) not in init_states:
+            if stype != "N" and stype not in seasonals:
+                seasonals[stype] = initseason(y, m, stype)
+            init_states[ttype, stype] = initstate(
+                y, m, ttype, stype, seasonals.get(stype)
+            )
+        inits.append(
+            _init_etsmodel(
+                y,
+                m,
+                ttype,
+                stype,
+                dtype,
+                alpha,
+                beta,
+                gamma,
+                phi,
+                lower,
+                upper,
+                bounds,
+                init_states[ttype, stype],
+            )
+        )
+    indptr = np.cumsum([0] + [init["par"].size for init in inits], dtype=np.int32)
+    components = np.empty((len(candidates), 4), dtype=np.int32)
+    opt = np.empty((len(candidates), 4), dtype=np.int32)
+    fixed = np.empty((len(candidates), 4), dtype=np.float64)
+    ms = np.empty(len(candidates), dtype=np.int32)
+    for i, ((etype, ttype, stype, dtype), init) in enumerate(zip(candidates, inits)):
+        components[i] = [int(switch(comp)) for comp in (etype, ttype, stype)] + [dtype]
+        ms[i], opt[i], fixed[i] = _optimize_args(
+            init["par_"], init["par_noopt"], ttype, stype, dtype, init["m"]
+        )
+    x0 = np.hstack([init["par"] for init in inits])
+    lowerb = np.hstack([init["lower"] for init in inits])
+    upperb = np.hstack([init["upper"] for init in inits])
+    n_states = np.array([init["nstate"] for init in inits], dtype=np.int32)
+
+    def select(start, end):
+        # fits the candidates in [start, end)
+        return _ets.select(
+            y,
+            indptr[start : end + 1] - indptr[start],
+            x0[indptr[start] : indptr[end]],
+            lowerb[indptr[start] : indptr[end]],
+            upperb[indptr[start] : indptr[end]],
+            components[start:end],
+            n_states[start:end],
+            ms[start:end],
+            opt[start:end],
+            fixed[start:end],
+            switch_criterion(opt_crit),
+            nmse,
+            switch_ic(ic),
+            1e-4,
+            1_000,
+            True,
+        )
+
+    if n_jobs == 1:
+        x, fn, nit, ics, best = select(0, len(candidates))
+    else:
+        if n_jobs == -1 or n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        # the native fit releases the GIL
+        with ThreadPoolExecutor(n_jobs) as executor:
+            fits = list(
+                executor.map(lambda i: select(i, i + 1), range(len(candidates)))
+            )
+        x, fn, nit = [np.hstack([fit[k] for fit in fits]) for k in range(3)]
+        ics = np.vstack([fit[3] for fit in fits])
+        # first candidate with the lowest criterion, as in the serial sweep
+        fitted = np.flatnonzero([fit[4] >= 0 for fit in fits])
+        ic_values = ics[fitted, ["loglik", "aic", "bic", "aicc"].index(ic)]
+        best = fitted[np.argmin(ic_values)] if fitted.size else -1
+    if best < 0:
+        raise Exception("no model able to be fitted")
+    fred = results(x[indptr[best] : indptr[best + 1]], fn[best], nit[best], None)
+    errortype, trendtype, seasontype, damped = candidates[best]
+    model = _fitted_etsmodel(
+        y, inits[best], errortype, trendtype, seasontype, damped, nmse, fred
+    )
+    model["method"] = _ets_method(errortype, trendtype, seasontype, damped)
+    model["ics"] = {
+        "method": [_ets_method(*candidate) for candidate in candidates],
+        **{
+            name: ics[:, i]
+            for i, name in enumerate(["loglik", "aic", "bic", "aicc", "mse", "amse"])
+        },
+    }
+    return model
+
+
+def _ets_method(errortype, trendtype, seasontype, damped):
+    return f"ETS({errortype},{trendtype}{'d' if damped else ''},{seasontype})"
+
+# %% ../../nbs/src/ets.ipynb 29
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../../nbs/src/ets.ipynb 30
+# %% ../../nbs/src/ets.ipynb 31
 def ets_f(
     y,
     m,
@@ -702,6 +870,7 @@ def ets_f(
     allow_multiplicative_trend=False,
     use_initial_values=False,
     maxit=2_000,
+    n_jobs=1,
 ):
     y = y.astype(np.float64, copy=False)
     # converting params to floats
@@ -868,7 +1037,7 @@ def ets_f(
         damped = [True, False]
     else:
         damped = [damped]
-    best_ic = np.inf
+    candidates = []
     for etype in errortype:
         for ttype in trendtype:
             for stype in seasontype:
@@ -891,49 +1060,40 @@ def ets_f(
                         continue
                     if stype != "N" and m == 1:
                         continue
-                    fit = etsmodel(
-                        y,
-                        m,
-                        etype,
-                        ttype,
-                        stype,
-                        dtype,
-                        alpha,
-                        beta,
-                        gamma,
-                        phi,
-                        lower=lower,
-                        upper=upper,
-                        opt_crit=opt_crit,
-                        nmse=nmse,
-                        bounds=bounds,
-                        maxit=maxit,
-                    )
-                    fit_ic = fit[ic]
-                    if not np.isnan(fit_ic):
-                        if fit_ic < best_ic:
-                            model = fit
-                            best_ic = fit_ic
-                            best_e = etype
-                            best_t = ttype
-                            best_s = stype
-                            best_d = dtype
-    if np.isinf(best_ic):
-        raise Exception("no model able to be fitted")
-    model["method"] = f"ETS({best_e},{best_t}{'d' if best_d else ''},{best_s})"
-    return model
+                    candidates.append((etype, ttype, stype, dtype))
+    return select_etsmodel(
+        y,
+        m,
+        candidates,
+        alpha,
+        beta,
+        gamma,
+        phi,
+        lower=lower,
+        upper=upper,
+        opt_crit=opt_crit,
+        nmse=nmse,
+        bounds=bounds,
+        ic=ic,
+        n_jobs=n_jobs,
+    )
+
+# %% ../../nbs/src/ets.ipynb 34
+def _last_state(obj):
+    # `update_ets` keeps the state it stopped at apart from the states of the training data
+    return obj["last_state"] if "last_state" in obj else obj["states"][-1]
+
 
-# %% ../../nbs/src/ets.ipynb 31
 def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     forecast = np.full(h, fill_value=np.nan)
-    states = obj["states"][-1, :]
+    states = _last_state(obj)
     etype, ttype, stype = [switch(comp) for comp in obj["components"][:3]]
     phi = 1 if obj["components"][3] == "N" else obj["par"][3]
     m = obj["m"]
     etsforecast(x=states, m=m, trend=ttype, season=stype, phi=phi, h=h, f=forecast)
     return forecast
 
-# %% ../../nbs/src/ets.ipynb 32
+# %% ../../nbs/src/ets.ipynb 35
 def _compute_sigmah(pf, h, sigma, cvals):
     theta = np.full(h, np.nan)
     theta[0] = pf[0] ** 2
@@ -944,7 +1104,7 @@ def _compute_sigmah(pf, h, sigma, cvals):
 
     return (1 + sigma) * theta - pf**2
 
-# %% ../../nbs/src/ets.ipynb 33
+# %% ../../nbs/src/ets.ipynb 36
 def _class3models(
     h,
     sigma,
@@ -1045,7 +1205,7 @@ def _class3models(
 
     return var
 
-# %% ../../nbs/src/ets.ipynb 34
+# %% ../../nbs/src/ets.ipynb 37
 def _compute_pred_intervals(model, forecasts, h, level):
     sigma = model["sigma2"]
     season_length = model["m"]
@@ -1054,7 +1214,7 @@ def _compute_pred_intervals(model, forecasts, h, level):
     model_type = model["components"]
     steps = steps = np.arange(1, h + 1)
     hm = np.floor((h - 1) / season_length)
-    last_state = model["states"][-1]
+    last_state = _last_state(model)
 
     # error, trend, and seasonality type
     error = model_type[0]
@@ -1193,10 +1353,8 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     else:
         # Classes 4 and 5 models
-        np.random.seed(1)
         compute_intervals = False
         nsim = 5000
-        y_path = np.zeros([nsim, h])
 
         if math.isnan(beta):
             beta = 0
@@ -1205,24 +1363,19 @@ def _compute_pred_intervals(model, forecasts, h, level):
         if math.isnan(phi):
             phi = 0
 
-        for k in range(nsim):
-            e = np.random.normal(0, np.sqrt(sigma), h)
-            yhat = np.zeros(h)
-            etssimulate(
-                last_state,
-                season_length,
-                switch(error),
-                switch(trend),
-                switch(seasonality),
-                alpha,
-                beta,
-                gamma,
-                phi,
-                h,
-                yhat,
-                e,
-            )
-            y_path[k,] = yhat
+        e = np.random.RandomState(1).normal(0, np.sqrt(sigma), (nsim, h))
+        y_path = etssimulate(
+            last_state,
+            season_length,
+            switch(error),
+            switch(trend),
+            switch(seasonality),
+            alpha,
+            beta,
+            gamma,
+            phi,
+            e,
+        )
 
         lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
         upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
@@ -1236,7 +1389,125 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     return pi
 
-# %% ../../nbs/src/ets.ipynb 35
+
+def _ets_class(components):
+    # class of the model in Hyndman et al. (2008), the forecast variances
+    # of the classes 1 to 3 have closed forms and the others are simulated
+    error, trend, seasonality = components[:3]
+    if trend != "M" and seasonality != "M":
+        return 1 if error == "A" else 2
+    if error == "M" and seasonality == "M":
+        return 3
+    return 4
+
+
+def _compute_sigmah_rows(pf, sigma, cvals):
+    # `_compute_sigmah` for each row of pf
+    theta = np.full(pf.shape, np.nan)
+    theta[:, 0] = pf[:, 0] ** 2
+    for k in range(1, pf.shape[1]):
+        sum_val = np.sum(cvals[:, :k] ** 2 * theta[:, k - 1 :: -1], axis=1)
+        theta[:, k] = pf[:, k] ** 2 + sigma[:, 0] * sum_val
+    return (1 + sigma) * theta - pf**2
+
+
+def _compute_sigmah_batch(components, par, sigma2, last_states, season_length, pf):
+    # forecast variances of many models, the closed forms are evaluated at once for all the
+    # models of the same type. the rows of the models of classes 4 and 5 are nan
+    h = pf.shape[1]
+    sigmah = np.full(pf.shape, np.nan)
+    steps = np.arange(1, h + 1)
+    types, inverse = np.unique(np.asarray(components), return_inverse=True)
+    for i, model_type in enumerate(types):
+        rows = np.flatnonzero(inverse == i)
+        error, trend, seasonality, damped = model_type
+        model_class = _ets_class(model_type)
+        if model_class == 3:
+            for row in rows:
+                alpha, beta, gamma, phi = par[row, :4]
+                sigmah[row] = _class3models(
+                    h,
+                    sigma2[row],
+                    last_states[row],
+                    season_length[row],
+                    error,
+                    trend,
+                    seasonality,
+                    damped,
+                    alpha,
+                    beta,
+                    gamma,
+                    phi,
+                )
+        if model_class > 2:
+            continue
+        # parameters of shape (n_rows, 1)
+        alpha, beta, gamma, phi = par[rows, :4].T[:, :, None]
+        sigma = sigma2[rows, None]
+        m = season_length[rows, None]
+        hm = np.floor((h - 1) / m)
+        dvals = (steps % m == 0).astype(float)
+        if model_class == 1:
+            if trend == "A":
+                exp1 = (
+                    alpha**2
+                    + alpha * beta * steps
+                    + (1 / 6) * beta**2 * steps * (2 * steps - 1)
+                )
+            if damped == "D":
+                exp2 = (beta * phi * steps) / (1 - phi) ** 2
+                exp3 = 2 * alpha * (1 - phi) + beta * phi
+                exp4 = (beta * phi * (1 - phi**steps)) / ((1 - phi) ** 2 * (1 - phi**2))
+                exp5 = 2 * alpha * (1 - phi**2) + beta * phi * (
+                    1 + 2 * phi - phi**steps
+                )
+            if trend == "N" and seasonality == "N":
+                # Model ANN
+                var = 1 + alpha**2 * (steps - 1)
+            elif seasonality == "N" and damped == "N":
+                # Model AAN
+                var = 1 + (steps - 1) * exp1
+            elif seasonality == "N":
+                # Model AAdN
+                var = 1 + alpha**2 * (steps - 1) + exp2 * exp3 - exp4 * exp5
+            elif trend == "N":
+                # Model ANA
+                var = 1 + alpha**2 * (steps - 1) + gamma * hm * (2 * alpha + gamma)
+            elif damped == "N":
+                # Model AAA
+                exp6 = 2 * alpha + gamma + beta * m * (hm + 1)
+                var = 1 + (steps - 1) * exp1 + gamma * hm * exp6
+            else:
+                # Model AAdA
+                exp7 = (2 * beta * gamma * phi) / ((1 - phi) * (1 - phi**m))
+                exp8 = hm * (1 - phi**m) - phi**m * (1 - phi ** (m * hm))
+                var = (
+                    1
+                    + alpha**2 * (steps - 1)
+                    + exp2 * exp3
+                    - exp4 * exp5
+                    + gamma * hm * (2 * alpha + gamma)
+                    + exp7 * exp8
+                )
+            sigmah[rows] = sigma * var
+        else:
+            if trend == "N":
+                # Models MNN and MNA
+                cvals = np.repeat(alpha, h, axis=1)
+            elif damped == "N":
+                # Models MAN and MAA
+                cvals = (
+                    alpha * beta * steps if seasonality == "A" else alpha + beta * steps
+                )
+            else:
+                # Models MAdN and MAdA
+                cvals = alpha + beta * np.cumsum(phi**steps, axis=1)
+            if seasonality == "A":
+                cvals = cvals + gamma * dvals
+            sigmah[rows] = _compute_sigmah_rows(pf[rows], sigma, cvals)
+    return sigmah
+
+# %% ../../nbs/src/ets.ipynb 38
 def forecast_ets(obj, h, level=None):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
@@ -1247,6 +1518,126 @@ def forecast_ets(obj, h, level=None):
         out = {**out, **pi}
     return out
 
-# %% ../../nbs/src/ets.ipynb 42
+
+def forecast_ets_batch(objs, h, level=None):
+    # forecasts of several fitted models. the intervals of the models with closed form
+    # variances are computed at once, the ones of the classes 4 and 5 are simulated
+    out = {"mean": np.stack([pegelsfcast_C(h, obj) for obj in objs])}
+    if level is None:
+        return out
+    sigmah = _compute_sigmah_batch(
+        components=[obj["components"] for obj in objs],
+        par=np.stack([obj["par"][:4] for obj in objs]),
+        sigma2=np.array([obj["sigma2"] for obj in objs]),
+        last_states=[_last_state(obj) for obj in objs],
+        season_length=np.array([obj["m"] for obj in objs]),
+        pf=out["mean"],
+    )
+    z = _quantiles(np.asarray(level))
+    out.update(
+        {f"lo-{lv}": out["mean"] - z[i] * np.sqrt(sigmah) for i, lv in enumerate(level)}
+    )
+    out.update(
+        {f"hi-{lv}": out["mean"] + z[i] * np.sqrt(sigmah) for i, lv in enumerate(level)}
+    )
+    for i, obj in enumerate(objs):
+        if _ets_class(obj["components"]) > 3:
+            pi = _compute_pred_intervals(
+                model=obj, forecasts={"mean": out["mean"][i]}, h=h, level=level
+            )
+            for key, val in pi.items():
+                out[key][i] = val
+    return out
+
+# %% ../../nbs/src/ets.ipynb 46
 def forward_ets(fitted_model, y):
     return ets_f(y=y, m=fitted_model["m"], model=fitted_model)
+
+# %% ../../nbs/src/ets.ipynb 47
+def forward_windows_ets(fitted_model, y, h, cutoffs, level=None):
+    # rolling origin forecasts from a single pass of the recursion over y,
+    # the forecasts of each window start from the state at its cutoff
+    n_windows = len(cutoffs)
+    out = {"mean": np.full((n_windows, h), np.nan)}
+    if level is not None:
+        for lv in level:
+            out[f"lo-{lv}"] = np.full((n_windows, h), np.nan)
+            out[f"hi-{lv}"] = np.full((n_windows, h), np.nan)
+    # training sets that are constant are refitted by ets_f
+    not_constant = np.flatnonzero(y != y[0])
+    first_change = not_constant[0] if not_constant.size else y.size
+    mod = forward_ets(fitted_model, y)
+    states = mod["states"]
+    etype, ttype, stype = [switch(comp) for comp in mod["components"][:3]]
+    phi = 1 if mod["components"][3] == "N" else mod["par"][3]
+    sq_e = mod["residuals"] ** 2
+    sum_sq_e = np.cumsum(np.where(np.isinf(sq_e), 0.0, sq_e))
+    np_ = mod["n_params"]
+    for i, cutoff in enumerate(cutoffs):
+        if cutoff <= first_change:
+            fcst = forecast_ets(forward_ets(fitted_model, y[:cutoff]), h=h, level=level)
+        else:
+            fcst = {"mean": np.full(h, np.nan)}
+            etsforecast(
+                x=states[cutoff],
+                m=mod["m"],
+                trend=ttype,
+                season=stype,
+                phi=phi,
+                h=h,
+                f=fcst["mean"],
+            )
+            if level is not None:
+                window_mod = {
+                    "sigma2": sum_sq_e[cutoff - 1] / (cutoff - np_ - 1),
+                    "m": mod["m"],
+                    "components": mod["components"],
+                    "states": states[: cutoff + 1],
+                    "par": mod["par"],
+                }
+                fcst.update(_compute_pred_intervals(window_mod, fcst, h=h, level=level))
+        for key in out:
+            out[key][i] = fcst[key]
+    return out
+
+# %% ../../nbs/src/ets.ipynb 48
+def update_ets(model, y):
+    """Filters new observations through a fitted model.
+
+    The parameters are kept and the recursion starts from the last state. Only that state
+    and the running sum of the squared residuals are updated, the fitted values, residuals
+    and states of the training data are left as they were, so the cost is linear in the
+    number of new observations."""
+    y = np.asarray(y, dtype=np.float64)
+    errortype, trendtype, seasontype = model["components"][:3]
+    alpha, beta, gamma, phi = model["par"][:4]
+    _, e, states, _ = pegelsresid_C(
+        y=y,
+        m=model["m"],
+        init_state=_last_state(model),
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=model["components"][3] != "N",
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
+        nmse=1,
+    )
+    if "sum_sq_e" in model:
+        sum_sq_e, n_obs = model["sum_sq_e"], model["n_obs"]
+    else:
+        # the sum over the training residuals is only computed on the first update
+        sq_e = model["residuals"] ** 2
+        sum_sq_e, n_obs = sq_e[~np.isinf(sq_e)].sum(), sq_e.size
+    sq_e = e**2
+    sum_sq_e += sq_e[~np.isinf(sq_e)].sum()
+    n_obs += y.size
+    return {
+        **model,
+        "last_state": states[-1],
+        "sum_sq_e": sum_sq_e,
+        "n_obs": n_obs,
+        "sigma2": sum_sq_e / (n_obs - model["n_params"] - 1),
+    }
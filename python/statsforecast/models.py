@@ -24,8 +24,10 @@ from statsforecast.arima import (
     auto_arima_f,
     fitted_arima,
     forecast_arima,
+    forecast_arima_batch,
     forward_arima,
     is_constant,
+    update_arima,
 )
 from .ces import auto_ces, forecast_ces, forward_ces
 from statsforecast.ets import (
@@ -33,7 +35,10 @@ from statsforecast.ets import (
     _PHI_UPPER,
     ets_f,
     forecast_ets,
+    forecast_ets_batch,
     forward_ets,
+    forward_windows_ets,
+    update_ets,
 )
 from .mfles import MFLES as _MFLES
 from .mstl import mstl
@@ -111,8 +116,52 @@ def _get_conformal_method(method: str):
     return available_methods[method]
 
 # %% ../../nbs/src/core/models.ipynb 10
+def _reduce_by_size(x: np.ndarray, indptr: np.ndarray, func) -> np.ndarray:
+    # applies `func` to each group defined by `indptr`. groups with the same size
+    # are stacked and reduced row-wise, which gives the same result as reducing
+    # each group separately.
+    sizes = np.diff(indptr)
+    out = np.empty(sizes.size, dtype=x.dtype)
+    for size in np.unique(sizes):
+        grps = np.where(sizes == size)[0]
+        idxs = indptr[grps, None] + np.arange(size)
+        out[grps] = func(x[idxs], axis=1)
+    return out
+
+
+def _grouped_sigma(
+    residuals: np.ndarray, indptr: np.ndarray, n: np.ndarray
+) -> np.ndarray:
+    # `_calculate_sigma` for each group
+    sums = _reduce_by_size(residuals**2, indptr, np.nansum)
+    sigma = np.zeros(sums.size)
+    valid = n > 0
+    sigma[valid] = np.sqrt(sums[valid] / n[valid])
+    return sigma
+
+
+def _add_grouped_intervals(res, level, sigmah):
+    # `_calculate_intervals` for forecasts of shape (n_groups, h)
+    z = _quantiles(np.asarray(level))
+    mean = res["mean"]
+    lo = {f"lo-{lv}": mean - z[i] * sigmah for i, lv in enumerate(level)}
+    hi = {f"hi-{lv}": mean + z[i] * sigmah for i, lv in enumerate(level)}
+    return {**res, **lo, **hi}
+
+
+def _check_batch_intervals(model, level):
+    if level is not None and model.prediction_intervals is not None:
+        raise NotImplementedError(
+            "Conformal prediction intervals are not supported by `forecast_batch`, "
+            "please use `forecast` for each serie instead."
+        )
+
+# %% ../../nbs/src/core/models.ipynb 11
 class _TS:
     uses_exog = False
+    # whether fit, forecast and forward run without holding the GIL,
+    # so that several series can be processed by threads
+    releases_gil = False
 
     def new(self):
         b = type(self).__new__(type(self))
@@ -172,7 +221,7 @@ class _TS:
     def _add_predict_conformal_intervals(self, fcst, level):
         return self._add_conformal_intervals(fcst=fcst, y=None, X=None, level=level)
 
-# %% ../../nbs/src/core/models.ipynb 15
+# %% ../../nbs/src/core/models.ipynb 16
 class AutoARIMA(_TS):
     r"""AutoARIMA model.
 
@@ -231,6 +280,9 @@ class AutoARIMA(_TS):
         If True, conditional sums-of-squares estimation, final MLE.
     method : Optional[str]
         Fitting method between maximum likelihood or sums-of-squares.
+    optim_method : str
+        Optimizer of the coefficients, any method supported by `scipy.optimize.minimize`.
+        Use 'native' to run R's BFGS entirely in the compiled extension, which is faster.
     truncate : Optional[int]
         Observations truncated series used in model selection.
     test : str
@@ -251,6 +303,19 @@ class AutoARIMA(_TS):
         Use adjusted back-transformed mean Box-Cox.
     season_length : int
         Number of observations per unit of time. Ex: 24 Hourly data.
+    n_jobs : int
+        Number of jobs used to fit the candidate models of the search concurrently, -1 uses all the cores.
+        Processes are used unless `optim_method='native'`. The selected model is the same as with `n_jobs=1`.
+    warm_start : bool
+        If True, refitting an already fitted model starts the search from the previous model
+        and its optimizer from the previous coefficients. `StatsForecast.fit` warm starts
+        each serie from its previously fitted model. `forecast` always searches from scratch.
+    restrict_search : bool
+        If True and warm starting, keeps the previous differencing orders and only considers
+        the previous model and its neighbours in the stepwise search.
+    SSinit : str
+        Method to compute the initial covariance of the state space models, 'Gardner1980' or 'Lyapunov'.
+        'Lyapunov' solves the same equation with the doubling algorithm, which is much faster for long seasonal periods.
     alias : str
         Custom name of the model.
     prediction_intervals : Optional[ConformalIntervals]
@@ -284,6 +349,7 @@ class AutoARIMA(_TS):
         trace: bool = False,
         approximation: Optional[bool] = False,
         method: Optional[str] = None,
+        optim_method: str = "BFGS",
         truncate: Optional[bool] = None,
         test: str = "kpss",
         test_kwargs: Optional[str] = None,
@@ -294,6 +360,10 @@ class AutoARIMA(_TS):
         blambda: Optional[float] = None,
         biasadj: bool = False,
         season_length: int = 1,
+        n_jobs: int = 1,
+        warm_start: bool = False,
+        restrict_search: bool = False,
+        SSinit: str = "Gardner1980",
         alias: str = "AutoARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
     ):
@@ -318,6 +388,7 @@ class AutoARIMA(_TS):
         self.trace = trace
         self.approximation = approximation
         self.method = method
+        self.optim_method = optim_method
         self.truncate = truncate
         self.test = test
         self.test_kwargs = test_kwargs
@@ -328,9 +399,18 @@ class AutoARIMA(_TS):
         self.blambda = blambda
         self.biasadj = biasadj
         self.season_length = season_length
+        self.n_jobs = n_jobs
+        self.warm_start = warm_start
+        self.restrict_search = restrict_search
+        self.SSinit = SSinit
         self.alias = alias
         self.prediction_intervals = prediction_intervals
 
+    def _init_model(self):
+        if self.warm_start and hasattr(self, "model_"):
+            return self.model_
+        return None
+
     def fit(
         self,
         y: np.ndarray,
@@ -378,6 +458,8 @@ class AutoARIMA(_TS):
                 trace=self.trace,
                 approximation=self.approximation,
                 method=self.method,
+                optim_method=self.optim_method,
+                SSinit=self.SSinit,
                 truncate=self.truncate,
                 xreg=X,
                 test=self.test,
@@ -389,6 +471,9 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                n_jobs=self.n_jobs,
+                init_model=self._init_model(),
+                restrict_search=self.restrict_search,
             )
 
         self._store_cs(y=y, X=X)
@@ -512,6 +597,8 @@ class AutoARIMA(_TS):
                 trace=self.trace,
                 approximation=self.approximation,
                 method=self.method,
+                optim_method=self.optim_method,
+                SSinit=self.SSinit,
                 truncate=self.truncate,
                 xreg=X,
                 test=self.test,
@@ -523,6 +610,7 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                n_jobs=self.n_jobs,
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
@@ -544,6 +632,35 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted AutoARIMA with new observations.
+
+        Filters the observations that follow the training data through the state space
+        model, keeping the estimated coefficients, so `predict` forecasts from the end
+        of the new observations. Unlike `forward` it doesn't go over the history again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of the new observations of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            AutoARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        y = _ensure_float(y)
+        self.model_ = update_arima(self.model_, y=y, xreg=X)
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -579,7 +696,9 @@ class AutoARIMA(_TS):
             raise Exception("You have to use the `fit` method first")
         y = _ensure_float(y)
         with np.errstate(invalid="ignore"):
-            mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+            mod = forward_arima(
+                self.model_, y=y, xreg=X, method=self.method, SSinit=self.SSinit
+            )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
         if fitted:
@@ -600,7 +719,7 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 31
+# %% ../../nbs/src/core/models.ipynb 34
 class AutoETS(_TS):
     r"""Automatic Exponential Smoothing model.
 
@@ -636,6 +755,9 @@ class AutoETS(_TS):
         A parameter that 'dampens' the trend.
     phi : float, optional (default=None)
         Smoothing parameter for trend damping. Only used when `damped=True`.
+    n_jobs : int
+        Number of threads used to fit the candidate models of each serie concurrently, -1 uses all the cores.
+        The selected model is the same as with `n_jobs=1`.
     alias : str
         Custom name of the model.
     prediction_intervals : Optional[ConformalIntervals],
@@ -644,12 +766,16 @@ class AutoETS(_TS):
         intervals.
     """
 
+    # number of series fitted and forecasted together by `forecast_batch`
+    _batch_size = 1_000
+
     def __init__(
         self,
         season_length: int = 1,
         model: str = "ZZZ",
         damped: Optional[bool] = None,
         phi: Optional[float] = None,
+        n_jobs: int = 1,
         alias: str = "AutoETS",
         prediction_intervals: Optional[ConformalIntervals] = None,
     ):
@@ -662,6 +788,7 @@ class AutoETS(_TS):
             if not _PHI_LOWER <= phi <= _PHI_UPPER:
                 raise ValueError(f"Valid range for phi is [{_PHI_LOWER}, {_PHI_UPPER}]")
         self.phi = phi
+        self.n_jobs = n_jobs
         self.alias = alias
         self.prediction_intervals = prediction_intervals
 
@@ -689,7 +816,12 @@ class AutoETS(_TS):
         """
         y = _ensure_float(y)
         self.model_ = ets_f(
-            y, m=self.season_length, model=self.model, damped=self.damped, phi=self.phi
+            y,
+            m=self.season_length,
+            model=self.model,
+            damped=self.damped,
+            phi=self.phi,
+            n_jobs=self.n_jobs,
         )
         self.model_["actual_residuals"] = y - self.model_["fitted"]
         self._store_cs(y=y, X=X)
@@ -786,7 +918,12 @@ class AutoETS(_TS):
         """
         y = _ensure_float(y)
         mod = ets_f(
-            y, m=self.season_length, model=self.model, damped=self.damped, phi=self.phi
+            y,
+            m=self.season_length,
+            model=self.model,
+            damped=self.damped,
+            phi=self.phi,
+            n_jobs=self.n_jobs,
         )
         fcst = forecast_ets(mod, h=h, level=level)
         keys = ["mean"]
@@ -809,6 +946,121 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient Exponential Smoothing predictions for many series at once.
+
+        Selects the model of each serie like `forecast` and computes the prediction intervals of all of them together,
+        evaluating the closed form forecast variances at once for all the series that share the same model type.
+        The series are processed in chunks, so only the fitted models of one chunk are kept in memory.
+        Produces the same outputs as calling `forecast` on each serie, a serie that can't be fitted raises a `ValueError`
+        that names it.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        y = _ensure_float(data)
+        if level is not None:
+            level = sorted(level)
+
+        def fit_serie(i):
+            try:
+                return ets_f(
+                    y[indptr[i] : indptr[i + 1]],
+                    m=self.season_length,
+                    model=self.model,
+                    damped=self.damped,
+                    phi=self.phi,
+                    n_jobs=self.n_jobs,
+                )
+            except Exception as error:
+                raise ValueError(
+                    f"{self} couldn't be fitted to the serie {i} of the batch: {error}"
+                ) from error
+
+        n_series = len(indptr) - 1
+        fcst: Dict[str, np.ndarray] = {}
+        fitted_vals = np.empty(y.size if fitted else 0)
+        n_params = np.empty(n_series, dtype=np.int64)
+        # only the models of a chunk of series are kept in memory
+        for start in range(0, n_series, self._batch_size):
+            end = min(start + self._batch_size, n_series)
+            mods = [fit_serie(i) for i in range(start, end)]
+            for key, val in forecast_ets_batch(mods, h=h, level=level).items():
+                fcst.setdefault(key, np.empty((n_series, h)))[start:end] = val
+            if fitted:
+                fitted_vals[indptr[start] : indptr[end]] = np.concatenate(
+                    [mod["fitted"] for mod in mods]
+                )
+            n_params[start:end] = [mod["n_params"] for mod in mods]
+        res = {"mean": fcst["mean"]}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            res = {
+                **res,
+                **{f"lo-{l}": fcst[f"lo-{l}"] for l in reversed(level)},
+                **{f"hi-{l}": fcst[f"hi-{l}"] for l in level},
+            }
+            if fitted:
+                sizes = np.diff(indptr)
+                se = _grouped_sigma(y - res["fitted"], indptr, sizes - n_params)
+                res = _add_fitted_pi(res=res, se=np.repeat(se, sizes), level=level)
+        return res
+
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted Exponential Smoothing model with new observations.
+
+        Runs the recursion of the selected model over the observations that follow the training data,
+        starting from its last state and keeping the estimated parameters, so `predict` forecasts from the end
+        of the new observations. Unlike `forward` it doesn't go over the history again, the insample predictions
+        are still the ones of the training data.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of the new observations of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            Exponential Smoothing updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        y = _ensure_float(y)
+        self.model_ = update_ets(self.model_, y=y)
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -865,7 +1117,55 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 46
+    def forward_windows(
+        self,
+        y: np.ndarray,
+        h: int,
+        cutoffs: np.ndarray,
+        level: Optional[List[int]] = None,
+    ):
+        r"""Apply fitted Exponential Smoothing model to several training sets of a time series.
+
+        The training set of each window is `y[:cutoff]`, the forecasts of all the windows
+        are computed from a single pass of the model over `y`.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series of shape (n, ).
+        h : int
+            Forecast horizon.
+        cutoffs : numpy.array
+            Number of observations of the training set of each window.
+        level : List[float]
+            Confidence levels for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each one of shape (n_windows, h).
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        y = _ensure_float(y)
+        if level is not None and self.prediction_intervals is not None:
+            windows = [
+                self.forward(y=y[:cutoff], h=h, level=level) for cutoff in cutoffs
+            ]
+            return {key: np.vstack([w[key] for w in windows]) for key in windows[0]}
+        fcst = forward_windows_ets(self.model_, y=y, h=h, cutoffs=cutoffs, level=level)
+        res = {"mean": fcst["mean"]}
+        if level is not None:
+            level = sorted(level)
+            res = {
+                **res,
+                **{f"lo-{l}": fcst[f"lo-{l}"] for l in reversed(level)},
+                **{f"hi-{l}": fcst[f"hi-{l}"] for l in level},
+            }
+        return res
+
+# %% ../../nbs/src/core/models.ipynb 53
 class ETS(AutoETS):
     @classmethod
     def _warn(cls):
@@ -894,7 +1194,7 @@ class ETS(AutoETS):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 51
+# %% ../../nbs/src/core/models.ipynb 58
 class AutoCES(_TS):
     r"""Complex Exponential Smoothing model.
 
@@ -928,6 +1228,8 @@ class AutoCES(_TS):
         intervals.
     """
 
+    releases_gil = NOGIL
+
     def __init__(
         self,
         season_length: int = 1,
@@ -1149,7 +1451,7 @@ class AutoCES(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 69
+# %% ../../nbs/src/core/models.ipynb 76
 class AutoTheta(_TS):
     r"""AutoTheta model.
 
@@ -1177,6 +1479,8 @@ class AutoTheta(_TS):
         intervals.
     """
 
+    releases_gil = NOGIL
+
     def __init__(
         self,
         season_length: int = 1,
@@ -1369,7 +1673,7 @@ class AutoTheta(_TS):
             res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 85
+# %% ../../nbs/src/core/models.ipynb 92
 class ARIMA(_TS):
     r"""ARIMA model.
 
@@ -1405,12 +1709,18 @@ class ARIMA(_TS):
     method : str (default='CSS-ML')
         Fitting method: maximum likelihood or minimize conditional sum-of-squares.
         The default (unless there are missing values) is to use conditional-sum-of-squares to find starting values, then maximum likelihood.
+    optim_method : str (default='BFGS')
+        Optimizer of the coefficients, any method supported by `scipy.optimize.minimize`.
+        Use 'native' to run R's BFGS entirely in the compiled extension, which is faster.
     fixed : dict, optional (default=None)
         Dictionary containing fixed coefficients for the arima model. Example: `{'ar1': 0.5, 'ma2': 0.75}`.
         For autoregressive terms use the `ar{i}` keys. For its seasonal version use `sar{i}`.
         For moving average terms use the `ma{i}` keys. For its seasonal version use `sma{i}`.
         For intercept and drift use the `intercept` and `drift` keys.
         For exogenous variables use the `ex_{i}` keys.
+    SSinit : str (default='Gardner1980')
+        Method to compute the initial covariance of the state space model, 'Gardner1980' or 'Lyapunov'.
+        'Lyapunov' solves the same equation with the doubling algorithm, which is much faster for long seasonal periods.
     alias : str
         Custom name of the model.
     prediction_intervals : Optional[ConformalIntervals]
@@ -1432,7 +1742,9 @@ class ARIMA(_TS):
         blambda: Optional[float] = None,
         biasadj: bool = False,
         method: str = "CSS-ML",
+        optim_method: str = "BFGS",
         fixed: Optional[dict] = None,
+        SSinit: str = "Gardner1980",
         alias: str = "ARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
     ):
@@ -1445,10 +1757,22 @@ class ARIMA(_TS):
         self.blambda = blambda
         self.biasadj = biasadj
         self.method = method
+        self.optim_method = optim_method
         self.fixed = fixed
+        self.SSinit = SSinit
         self.alias = alias
         self.prediction_intervals = prediction_intervals
 
+    @property
+    def batchable(self) -> bool:
+        # configurations fitted by `forecast_batch`, the rest are fitted serie by serie
+        return (
+            self.optim_method == "native"
+            and self.method in ("CSS-ML", "ML")
+            and self.fixed is None
+            and self.blambda is None
+        )
+
     def fit(
         self,
         y: np.ndarray,
@@ -1483,6 +1807,8 @@ class ARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 method=self.method,
+                optim_method=self.optim_method,
+                SSinit=self.SSinit,
                 fixed=self.fixed,
             )
         self._store_cs(y=y, X=X)
@@ -1594,6 +1920,8 @@ class ARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 method=self.method,
+                optim_method=self.optim_method,
+                SSinit=self.SSinit,
                 fixed=self.fixed,
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
@@ -1616,6 +1944,113 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient ARIMA predictions for many series at once.
+
+        Fits the same specification to all the series in a single call to the compiled extension,
+        which shares the model structure and the working buffers between them.
+        Fits each serie like calling `forecast` with `optim_method='native'`, from the same starting values.
+        The least squares estimate of the intercept or drift is computed in closed form, so ill-conditioned fits
+        can converge to slightly different coefficients, the outputs agree within a relative tolerance of 1e-3.
+        Only available when `batchable` is True and the series don't have exogenous variables or missing values.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        if not self.batchable:
+            raise NotImplementedError(
+                "`forecast_batch` requires optim_method='native', method 'CSS-ML' or 'ML' "
+                "and no fixed coefficients nor Box-Cox transformation."
+            )
+        y = _ensure_float(data)
+        with np.errstate(invalid="ignore"):
+            fcst = forecast_arima_batch(
+                y,
+                indptr,
+                h,
+                order=self.order,
+                seasonal={"order": self.seasonal_order, "period": self.season_length},
+                include_mean=self.include_mean,
+                include_drift=self.include_drift,
+                include_constant=self.include_constant,
+                method=self.method,
+                SSinit=self.SSinit,
+            )
+        res = {"mean": fcst["mean"]}
+        if fitted:
+            res["fitted"] = fcst["fitted"]
+        if level is not None:
+            level = sorted(level)
+            z = _quantiles(np.asarray(level))
+            res = {
+                **res,
+                **{
+                    f"lo-{l}": fcst["mean"] - z[i] * fcst["se"]
+                    for i, l in reversed(list(enumerate(level)))
+                },
+                **{
+                    f"hi-{l}": fcst["mean"] + z[i] * fcst["se"]
+                    for i, l in enumerate(level)
+                },
+            }
+            if fitted:
+                se = np.repeat(np.sqrt(fcst["sigma2"]), np.diff(indptr))
+                res = _add_fitted_pi(res=res, se=se, level=level)
+        return res
+
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted ARIMA with new observations.
+
+        Filters the observations that follow the training data through the state space
+        model, keeping the estimated coefficients, so `predict` forecasts from the end
+        of the new observations. Unlike `forward` it doesn't go over the history again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of the new observations of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            ARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        y = _ensure_float(y)
+        self.model_ = update_arima(self.model_, y=y, xreg=X)
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -1651,7 +2086,9 @@ class ARIMA(_TS):
             raise Exception("You have to use the `fit` method first")
         y = _ensure_float(y)
         with np.errstate(invalid="ignore"):
-            mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+            mod = forward_arima(
+                self.model_, y=y, xreg=X, method=self.method, SSinit=self.SSinit
+            )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
         if fitted:
@@ -1672,7 +2109,7 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 100
+# %% ../../nbs/src/core/models.ipynb 109
 class AutoRegressive(ARIMA):
     r"""Simple Autoregressive model.
 
@@ -1695,6 +2132,9 @@ class AutoRegressive(ARIMA):
     method : str (default='CSS-ML')
         Fitting method: maximum likelihood or minimize conditional sum-of-squares.
         The default (unless there are missing values) is to use conditional-sum-of-squares to find starting values, then maximum likelihood.
+    optim_method : str (default='BFGS')
+        Optimizer of the coefficients, any method supported by `scipy.optimize.minimize`.
+        Use 'native' to run R's BFGS entirely in the compiled extension, which is faster.
     fixed : dict, optional (default=None)
         Dictionary containing fixed coefficients for the AutoRegressive model. Example: `{'ar1': 0.5, 'ar5': 0.75}`.
         For autoregressive terms use the `ar{i}` keys.
@@ -1716,6 +2156,7 @@ class AutoRegressive(ARIMA):
         blambda: Optional[float] = None,
         biasadj: bool = False,
         method: str = "CSS-ML",
+        optim_method: str = "BFGS",
         fixed: Optional[dict] = None,
         alias: str = "AutoRegressive",
         prediction_intervals: Optional[ConformalIntervals] = None,
@@ -1741,12 +2182,13 @@ class AutoRegressive(ARIMA):
             blambda=blambda,
             biasadj=biasadj,
             method=method,
+            optim_method=optim_method,
             alias=alias,
             fixed=fixed,
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 115
+# %% ../../nbs/src/core/models.ipynb 124
 @njit(nogil=NOGIL, cache=CACHE)
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     r"""Perform simple exponential smoothing on a series.
@@ -1817,7 +2259,7 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     n_elems = n_chunks * chunk_size
     return array[:n_elems].reshape(n_chunks, chunk_size).sum(axis=1)
 
-# %% ../../nbs/src/core/models.ipynb 116
+# %% ../../nbs/src/core/models.ipynb 125
 def _ses(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1830,7 +2272,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 117
+# %% ../../nbs/src/core/models.ipynb 126
 class SimpleExponentialSmoothing(_TS):
     r"""SimpleExponentialSmoothing model.
 
@@ -1856,6 +2298,8 @@ class SimpleExponentialSmoothing(_TS):
         intervals.
     """
 
+    releases_gil = NOGIL
+
     def __init__(
         self,
         alpha: float,
@@ -1992,7 +2436,7 @@ class SimpleExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 129
+# %% ../../nbs/src/core/models.ipynb 138
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2005,7 +2449,7 @@ def _ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 130
+# %% ../../nbs/src/core/models.ipynb 139
 class SimpleExponentialSmoothingOptimized(_TS):
     r"""SimpleExponentialSmoothing model.
 
@@ -2161,7 +2605,7 @@ class SimpleExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 142
+# %% ../../nbs/src/core/models.ipynb 151
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2185,7 +2629,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 143
+# %% ../../nbs/src/core/models.ipynb 152
 class SeasonalExponentialSmoothing(_TS):
     r"""SeasonalExponentialSmoothing model.
 
@@ -2217,6 +2661,8 @@ class SeasonalExponentialSmoothing(_TS):
         This is required for generating future prediction intervals.
     """
 
+    releases_gil = NOGIL
+
     def __init__(
         self,
         season_length: int,
@@ -2362,7 +2808,7 @@ class SeasonalExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 158
+# %% ../../nbs/src/core/models.ipynb 167
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2385,7 +2831,7 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 159
+# %% ../../nbs/src/core/models.ipynb 168
 class SeasonalExponentialSmoothingOptimized(_TS):
 
     def __init__(
@@ -2559,7 +3005,7 @@ class SeasonalExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 172
+# %% ../../nbs/src/core/models.ipynb 181
 class Holt(AutoETS):
     r"""Holt's method.
 
@@ -2600,7 +3046,7 @@ class Holt(AutoETS):
             season_length, model, alias=alias, prediction_intervals=prediction_intervals
         )
 
-# %% ../../nbs/src/core/models.ipynb 186
+# %% ../../nbs/src/core/models.ipynb 195
 class HoltWinters(AutoETS):
     r"""Holt-Winters' method.
 
@@ -2640,7 +3086,7 @@ class HoltWinters(AutoETS):
             season_length, model, alias=alias, prediction_intervals=prediction_intervals
         )
 
-# %% ../../nbs/src/core/models.ipynb 201
+# %% ../../nbs/src/core/models.ipynb 210
 def _historic_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2652,7 +3098,7 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 202
+# %% ../../nbs/src/core/models.ipynb 211
 class HistoricAverage(_TS):
 
     def __init__(
@@ -2830,7 +3276,58 @@ class HistoricAverage(_TS):
 
         return res
 
-# %% ../../nbs/src/core/models.ipynb 215
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient HistoricAverage predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        avgs = _reduce_by_size(y, indptr, np.mean)
+        res = {"mean": np.repeat(avgs[:, None], h, axis=1)}
+        if not fitted and level is None:
+            return res
+        fitted_vals = np.repeat(avgs, sizes)
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            sigma = _grouped_sigma(y - fitted_vals, indptr, sizes - 1)
+            sigmah = sigma * np.sqrt(1 + (1 / sizes))
+            res = _add_grouped_intervals(res, level, sigmah[:, None])
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigmah, sizes), level=level)
+        return res
+
+# %% ../../nbs/src/core/models.ipynb 226
 class Naive(_TS):
 
     def __init__(
@@ -3040,7 +3537,59 @@ class Naive(_TS):
         )
         return res
 
-# %% ../../nbs/src/core/models.ipynb 231
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient Naive predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        res = {"mean": np.repeat(y[indptr[1:] - 1, None], h, axis=1)}
+        if not fitted and level is None:
+            return res
+        fitted_vals = np.empty_like(y)
+        fitted_vals[1:] = y[:-1]
+        fitted_vals[indptr[:-1]] = np.nan
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            steps = np.arange(1, h + 1)
+            sigma = _grouped_sigma(y - fitted_vals, indptr, sizes - 1)
+            res = _add_grouped_intervals(res, level, sigma[:, None] * np.sqrt(steps))
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../../nbs/src/core/models.ipynb 244
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3059,7 +3608,7 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../../nbs/src/core/models.ipynb 232
+# %% ../../nbs/src/core/models.ipynb 245
 class RandomWalkWithDrift(_TS):
 
     def __init__(
@@ -3236,7 +3785,65 @@ class RandomWalkWithDrift(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 247
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient RandomWalkWithDrift predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        last_y = y[indptr[1:] - 1]
+        slope = (last_y - y[indptr[:-1]]) / (sizes - 1)
+        hrange = np.arange(h, dtype=y.dtype)
+        res = {"mean": slope[:, None] * (1 + hrange) + last_y[:, None]}
+        if not fitted and level is None:
+            return res
+        fitted_vals = np.empty_like(y)
+        fitted_vals[1:] = np.repeat(slope, sizes)[1:] + y[:-1]
+        fitted_vals[indptr[:-1]] = np.nan
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            steps = np.arange(1, h + 1)
+            sigma = _grouped_sigma(y - fitted_vals, indptr, sizes - 1)
+            sigmah = sigma[:, None] * np.sqrt(
+                steps * (1 + steps / (sizes[:, None] - 1))
+            )
+            res = _add_grouped_intervals(res, level, sigmah)
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../../nbs/src/core/models.ipynb 262
 class SeasonalNaive(_TS):
 
     def __init__(
@@ -3423,7 +4030,69 @@ class SeasonalNaive(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 262
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient SeasonalNaive predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        _check_batch_intervals(self, level)
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        season_length = self.season_length
+        season_samples = np.minimum(sizes, season_length)[:, None]
+        season_idxs = np.arange(season_length)
+        has_sample = season_idxs < season_samples
+        season_vals = np.full((sizes.size, season_length), np.nan, dtype=y.dtype)
+        season_vals[has_sample] = y[
+            (indptr[1:, None] - season_samples + season_idxs)[has_sample]
+        ]
+        repeats = int(np.ceil(h / season_length))
+        res = {"mean": np.tile(season_vals, repeats)[:, :h]}
+        if not fitted and level is None:
+            return res
+        fitted_vals = np.full_like(y, np.nan)
+        positions = np.arange(y.size) - np.repeat(indptr[:-1], sizes)
+        has_lag = np.where(positions >= season_length)[0]
+        fitted_vals[has_lag] = y[has_lag - season_length]
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            k = np.floor((h - 1) / season_length)
+            sigma = _grouped_sigma(y - fitted_vals, indptr, sizes - season_length)
+            res = _add_grouped_intervals(res, level, sigma[:, None] * np.sqrt(k + 1))
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../../nbs/src/core/models.ipynb 279
 def _window_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3438,7 +4107,7 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../../nbs/src/core/models.ipynb 263
+# %% ../../nbs/src/core/models.ipynb 280
 class WindowAverage(_TS):
 
     def __init__(
@@ -3596,7 +4265,52 @@ class WindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 274
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient WindowAverage predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        if fitted:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            _check_batch_intervals(self, level)
+            raise Exception("You must pass `prediction_intervals` to compute them.")
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        avgs = np.full(sizes.size, np.nan, dtype=y.dtype)
+        valid = sizes >= self.window_size
+        idxs = indptr[1:][valid, None] - self.window_size + np.arange(self.window_size)
+        avgs[valid] = y[idxs].mean(axis=1)
+        return {"mean": np.repeat(avgs[:, None], h, axis=1)}
+
+# %% ../../nbs/src/core/models.ipynb 293
 def _seasonal_window_average(
     y: np.ndarray,
     h: int,
@@ -3613,7 +4327,7 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h)
     return {"mean": out}
 
-# %% ../../nbs/src/core/models.ipynb 275
+# %% ../../nbs/src/core/models.ipynb 294
 class SeasonalWindowAverage(_TS):
 
     def __init__(
@@ -3785,7 +4499,56 @@ class SeasonalWindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../../nbs/src/core/models.ipynb 287
+    def forecast_batch(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Memory Efficient SeasonalWindowAverage predictions for many series at once.
+
+        Produces the same outputs as calling `forecast` on each serie,
+        working directly on the stacked values of all the series.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series of shape (n, ), one serie after the other.
+        indptr : numpy.array
+            Start and end offsets of each serie in `data`, of shape (n_series + 1, ).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions,
+            each of shape (n_series, h). Insample predictions have shape (n, ).
+        """
+        if fitted:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            _check_batch_intervals(self, level)
+            raise Exception("You must pass `prediction_intervals` to compute them.")
+        y = _ensure_float(data)
+        sizes = np.diff(indptr)
+        min_samples = self.season_length * self.window_size
+        season_avgs = np.full((sizes.size, self.season_length), np.nan, dtype=y.dtype)
+        valid = sizes >= min_samples
+        idxs = indptr[1:][valid, None] - min_samples + np.arange(min_samples)
+        season_avgs[valid] = (
+            y[idxs].reshape(-1, self.window_size, self.season_length).mean(axis=1)
+        )
+        repeats = int(np.ceil(h / self.season_length))
+        return {"mean": np.tile(season_avgs, repeats)[:, :h]}
+
+# %% ../../nbs/src/core/models.ipynb 308
 def _chunk_forecast(y, aggregation_level):
     lost_remainder_data = len(y) % aggregation_level
     y_cut = y[lost_remainder_data:]
@@ -3868,7 +4631,7 @@ def _adida(
         res["fitted"] = np.append(np.nan, sums_fitted / fitted_aggregation_levels)
     return res
 
-# %% ../../nbs/src/core/models.ipynb 288
+# %% ../../nbs/src/core/models.ipynb 309
 class ADIDA(_TS):
 
     def __init__(
@@ -4037,7 +4800,7 @@ class ADIDA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 300
+# %% ../../nbs/src/core/models.ipynb 321
 def _croston_classic(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4065,7 +4828,7 @@ def _croston_classic(
         out["fitted"] = ydf / yif
     return out
 
-# %% ../../nbs/src/core/models.ipynb 301
+# %% ../../nbs/src/core/models.ipynb 322
 class CrostonClassic(_TS):
 
     def __init__(
@@ -4229,7 +4992,7 @@ class CrostonClassic(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 312
+# %% ../../nbs/src/core/models.ipynb 333
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4271,7 +5034,7 @@ def _croston_optimized(
         out["fitted"] = ydf / yif
     return out
 
-# %% ../../nbs/src/core/models.ipynb 313
+# %% ../../nbs/src/core/models.ipynb 334
 class CrostonOptimized(_TS):
 
     def __init__(
@@ -4432,7 +5195,7 @@ class CrostonOptimized(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 324
+# %% ../../nbs/src/core/models.ipynb 345
 def _croston_sba(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4444,7 +5207,7 @@ def _croston_sba(
         out["fitted"] *= 0.95
     return out
 
-# %% ../../nbs/src/core/models.ipynb 325
+# %% ../../nbs/src/core/models.ipynb 346
 class CrostonSBA(_TS):
 
     def __init__(
@@ -4610,7 +5373,7 @@ class CrostonSBA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 336
+# %% ../../nbs/src/core/models.ipynb 357
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4644,7 +5407,7 @@ def _imapa(
         res["fitted"] = fitted_vals
     return res
 
-# %% ../../nbs/src/core/models.ipynb 337
+# %% ../../nbs/src/core/models.ipynb 358
 class IMAPA(_TS):
 
     def __init__(
@@ -4809,7 +5572,7 @@ class IMAPA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 348
+# %% ../../nbs/src/core/models.ipynb 369
 def _tsb(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4834,7 +5597,7 @@ def _tsb(
         res["fitted"] = ypft * ydft
     return res
 
-# %% ../../nbs/src/core/models.ipynb 349
+# %% ../../nbs/src/core/models.ipynb 370
 class TSB(_TS):
 
     def __init__(
@@ -5009,7 +5772,7 @@ class TSB(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 361
+# %% ../../nbs/src/core/models.ipynb 382
 def _predict_mstl_components(mstl_ob, h, season_length):
     seasoncolumns = mstl_ob.filter(regex="seasonal*").columns
     nseasons = len(seasoncolumns)
@@ -5030,7 +5793,7 @@ def _predict_mstl_seas(mstl_ob, h, season_length):
     seascomp = _predict_mstl_components(mstl_ob, h, season_length)
     return seascomp.sum(axis=1)
 
-# %% ../../nbs/src/core/models.ipynb 362
+# %% ../../nbs/src/core/models.ipynb 383
 class MSTL(_TS):
     r"""MSTL model.
 
@@ -5309,7 +6072,7 @@ class MSTL(_TS):
         }
         return res
 
-# %% ../../nbs/src/core/models.ipynb 378
+# %% ../../nbs/src/core/models.ipynb 399
 class TBATS(_TS):
     r"""Trigonometric Box-Cox transform, ARMA errors, Trend and Seasonal components (TBATS) model.
 
@@ -5523,7 +6286,7 @@ class TBATS(_TS):
             res_trans = res
         return res_trans
 
-# %% ../../nbs/src/core/models.ipynb 386
+# %% ../../nbs/src/core/models.ipynb 407
 class AutoTBATS(TBATS):
     r"""AutoTBATS model.
 
@@ -5582,7 +6345,7 @@ class AutoTBATS(TBATS):
             alias=alias,
         )
 
-# %% ../../nbs/src/core/models.ipynb 396
+# %% ../../nbs/src/core/models.ipynb 417
 class Theta(AutoTheta):
     r"""Standard Theta Method.
 
@@ -5619,7 +6382,7 @@ class Theta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 410
+# %% ../../nbs/src/core/models.ipynb 431
 class OptimizedTheta(AutoTheta):
     r"""Optimized Theta Method.
 
@@ -5656,7 +6419,7 @@ class OptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 424
+# %% ../../nbs/src/core/models.ipynb 445
 class DynamicTheta(AutoTheta):
     r"""Dynamic Standard Theta Method.
 
@@ -5693,7 +6456,7 @@ class DynamicTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 438
+# %% ../../nbs/src/core/models.ipynb 459
 class DynamicOptimizedTheta(AutoTheta):
     r"""Dynamic Optimized Theta Method.
 
@@ -5730,7 +6493,7 @@ class DynamicOptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../../nbs/src/core/models.ipynb 453
+# %% ../../nbs/src/core/models.ipynb 474
 class GARCH(_TS):
     r"""Generalized Autoregressive Conditional Heteroskedasticity (GARCH) model.
 
@@ -5924,7 +6687,7 @@ class GARCH(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 466
+# %% ../../nbs/src/core/models.ipynb 487
 class ARCH(GARCH):
     r"""Autoregressive Conditional Heteroskedasticity (ARCH) model.
 
@@ -5968,7 +6731,7 @@ class ARCH(GARCH):
         self.alias = alias
         super().__init__(p, q=0, alias=alias)
 
-# %% ../../nbs/src/core/models.ipynb 477
+# %% ../../nbs/src/core/models.ipynb 498
 class SklearnModel(_TS):
     r"""scikit-learn model wrapper
 
@@ -6176,7 +6939,7 @@ class SklearnModel(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 487
+# %% ../../nbs/src/core/models.ipynb 508
 class MFLES(_TS):
     r"""MFLES model.
 
@@ -6458,7 +7221,7 @@ class MFLES(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 495
+# %% ../../nbs/src/core/models.ipynb 516
 class AutoMFLES(_TS):
     r"""AutoMFLES
 
@@ -6659,7 +7422,7 @@ class AutoMFLES(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../../nbs/src/core/models.ipynb 499
+# %% ../../nbs/src/core/models.ipynb 520
 class ConstantModel(_TS):
 
     def __init__(self, constant: float, alias: str = "ConstantModel"):
@@ -6845,7 +7608,7 @@ class ConstantModel(_TS):
         )
         return res
 
-# %% ../../nbs/src/core/models.ipynb 513
+# %% ../../nbs/src/core/models.ipynb 534
 class ZeroModel(ConstantModel):
 
     def __init__(self, alias: str = "ZeroModel"):
@@ -6860,7 +7623,7 @@ class ZeroModel(ConstantModel):
         """
         super().__init__(constant=0, alias=alias)
 
-# %% ../../nbs/src/core/models.ipynb 527
+# %% ../../nbs/src/core/models.ipynb 548
 class NaNModel(ConstantModel):
 
     def __init__(self, alias: str = "NaNModel"):
@@ -1,13 +1,21 @@
 #include <algorithm>
 #include <array>
 #include <cmath>
+#include <limits>
 #include <vector>
 
+#include <pybind11/eigen.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "bfgs.h"
 
 namespace arima {
 namespace py = pybind11;
+using Eigen::VectorXd;
+using RowMajorMatrixXd =
+    Eigen::Matrix<double, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
 
 void partrans(int p, const double *raw, double *newv) {
   std::transform(raw, raw + p, newv, [](double x) { return std::tanh(x); });
@@ -20,11 +28,8 @@ void partrans(int p, const double *raw, double *newv) {
   }
 }
 
-std::tuple<py::array_t<double>, py::array_t<double>>
-arima_transpar(const py::array_t<double> params_inv,
-               const py::array_t<int> armav, bool trans) {
-  auto arma = armav.data();
-  auto params_in = params_inv.data();
+void transpar(const double *params_in, int n_params, const int *arma,
+              bool trans, double *phi, double *theta) {
   int mp = arma[0];
   int mq = arma[1];
   int msp = arma[2];
@@ -32,11 +37,7 @@ arima_transpar(const py::array_t<double> params_inv,
   int ns = arma[4];
   int p = mp + ns * msp;
   int q = mq + ns * msq;
-  auto params = std::vector<double>(params_in, params_in + params_inv.size());
-  py::array_t<double> phiv(p);
-  py::array_t<double> thetav(q);
-  auto phi = phiv.mutable_data();
-  auto theta = thetav.mutable_data();
+  auto params = std::vector<double>(params_in, params_in + n_params);
   if (trans) {
     if (mp > 0) {
       partrans(mp, params_in, params.data());
@@ -67,26 +68,27 @@ arima_transpar(const py::array_t<double> params_inv,
     std::copy(params.begin(), params.begin() + mp, phi);
     std::copy(params.begin() + mp, params.begin() + mp + mq, theta);
   }
-  return {phiv, thetav};
 }
 
-std::tuple<double, py::array_t<double>>
-arima_css(const py::array_t<double> yv, const py::array_t<int> armav,
-          const py::array_t<double> phiv, const py::array_t<double> thetav) {
-  int n = static_cast<int>(yv.size());
-  int p = static_cast<int>(phiv.size());
-  int q = static_cast<int>(thetav.size());
-  auto y = yv.data();
+std::tuple<py::array_t<double>, py::array_t<double>>
+arima_transpar(const py::array_t<double> params_inv,
+               const py::array_t<int> armav, bool trans) {
   auto arma = armav.data();
-  auto phi = phiv.data();
-  auto theta = thetav.data();
+  py::array_t<double> phiv(arma[0] + arma[4] * arma[2]);
+  py::array_t<double> thetav(arma[1] + arma[4] * arma[3]);
+  transpar(params_inv.data(), static_cast<int>(params_inv.size()), arma, trans,
+           phiv.mutable_data(), thetav.mutable_data());
+  return {phiv, thetav};
+}
+
+double css(const double *y, int n, const int *arma, const double *phi, int p,
+           const double *theta, int q, double *resid) {
   int ncond = arma[0] + arma[5] + arma[4] * (arma[2] + arma[6]);
   int nu = 0;
   double ssq = 0.0;
 
-  auto residv = py::array_t<double>(n);
-  auto resid = residv.mutable_data();
-  auto w = std::vector<double>(y, y + yv.size());
+  auto w = std::vector<double>(y, y + n);
+  std::fill(resid, resid + std::min(ncond, n), 0.0);
   for (int _ = 0; _ < arma[5]; ++_) {
     for (int l = n - 1; l > 0; --l) {
       w[l] -= w[l - 1];
@@ -115,159 +117,177 @@ arima_css(const py::array_t<double> yv, const py::array_t<int> armav,
       ssq += tmp * tmp;
     }
   }
-  return {ssq / nu, residv};
+  return ssq / nu;
 }
 
-std::tuple<double, double, int>
-arima_like(const py::array_t<double> yv, const py::array_t<double> phiv,
-           const py::array_t<double> thetav, const py::array_t<double> deltav,
-           py::array_t<double> av, py::array_t<double> Pv,
-           py::array_t<double> Pnewv, int up, bool use_resid,
-           py::array_t<double> rsResidv) {
+std::tuple<double, py::array_t<double>>
+arima_css(const py::array_t<double> yv, const py::array_t<int> armav,
+          const py::array_t<double> phiv, const py::array_t<double> thetav) {
   int n = static_cast<int>(yv.size());
-  int d = static_cast<int>(deltav.size());
-  int rd = static_cast<int>(av.size());
-  int p = static_cast<int>(phiv.size());
-  int q = static_cast<int>(thetav.size());
-  auto y = yv.data();
-  auto phi = phiv.data();
-  auto theta = thetav.data();
-  auto delta = deltav.data();
-  auto a = av.mutable_data();
-  auto P = Pv.mutable_data();
-  auto Pnew = Pnewv.mutable_data();
-  auto rsResid = rsResidv.mutable_data();
-  double ssq = 0.0;
-  double sumlog = 0.0;
-  int nu = 0;
-  int r = rd - d;
+  auto residv = py::array_t<double>(n);
+  auto resid = residv.mutable_data();
+  double res;
+  {
+    py::gil_scoped_release release;
+    res = css(yv.data(), n, armav.data(), phiv.data(),
+              static_cast<int>(phiv.size()), thetav.data(),
+              static_cast<int>(thetav.size()), resid);
+  }
+  return {res, residv};
+}
 
-  std::vector<double> anew(rd);
-  std::vector<double> M(rd);
-  std::vector<double> mm;
+// anew = T a, with T the transition matrix of the state space form.
+void predict_state(const double *phi, int p, const double *delta, int d, int r,
+                   const double *a, double *anew) {
+  int rd = r + d;
+  double tmp;
+  for (int i = 0; i < r; ++i) {
+    if (i < r - 1) {
+      tmp = a[i + 1];
+    } else {
+      tmp = 0.0;
+    }
+    if (i < p) {
+      tmp += phi[i] * a[0];
+    }
+    anew[i] = tmp;
+  }
   if (d > 0) {
-    mm.resize(rd * rd);
+    for (int i = r + 1; i < rd; ++i) {
+      anew[i] = a[i - 1];
+    }
+    tmp = a[0];
+    for (int i = 0; i < d; ++i) {
+      tmp += delta[i] * a[r + i];
+    }
+    anew[r] = tmp;
   }
+}
+
+// Pnew = T P T' + V. mm is a workspace of size rd * rd used when d > 0.
+void predict_cov(const double *phi, int p, const double *theta, int q,
+                 const double *delta, int d, int r, const double *P,
+                 double *Pnew, double *mm) {
+  int rd = r + d;
   double tmp;
-  for (int l = 0; l < n; ++l) {
+  if (d == 0) {
     for (int i = 0; i < r; ++i) {
-      if (i < r - 1) {
-        tmp = a[i + 1];
-      } else {
+      double vi = 0.0;
+      if (i == 0) {
+        vi = 1.0;
+      } else if (i - 1 < q) {
+        vi = theta[i - 1];
+      }
+      for (int j = 0; j < r; ++j) {
         tmp = 0.0;
+        if (j == 0) {
+          tmp = vi;
+        } else if (j - 1 < q) {
+          tmp = vi * theta[j - 1];
+        }
+        if (i < p && j < p) {
+          tmp += phi[i] * phi[j] * P[0];
+        }
+        if (i < r - 1 && j < r - 1) {
+          tmp += P[i + 1 + r * (j + 1)];
+        }
+        if (i < p && j < r - 1) {
+          tmp += phi[i] * P[j + 1];
+        }
+        if (j < p && i < r - 1) {
+          tmp += phi[j] * P[i + 1];
+        }
+        Pnew[i + r * j] = tmp;
       }
-      if (i < p) {
-        tmp += phi[i] * a[0];
+    }
+  } else {
+    for (int i = 0; i < r; ++i) {
+      for (int j = 0; j < rd; ++j) {
+        tmp = 0.0;
+        if (i < p) {
+          tmp += phi[i] * P[rd * j];
+        }
+        if (i < r - 1) {
+          tmp += P[i + 1 + rd * j];
+        }
+        mm[i + rd * j] = tmp;
       }
-      anew[i] = tmp;
     }
-    if (d > 0) {
-      for (int i = r + 1; i < rd; ++i) {
-        anew[i] = a[i - 1];
+    for (int j = 0; j < rd; ++j) {
+      tmp = P[rd * j];
+      for (int k = 0; k < d; ++k) {
+        tmp += delta[k] * P[r + k + rd * j];
       }
-      tmp = a[0];
-      for (int i = 0; i < d; ++i) {
-        tmp += delta[i] * a[r + i];
+      mm[r + rd * j] = tmp;
+    }
+    for (int i = 1; i < d; ++i) {
+      for (int j = 0; j < rd; ++j) {
+        mm[r + i + rd * j] = P[r + i - 1 + rd * j];
       }
-      anew[r] = tmp;
     }
-    if (l > up) {
-      if (d == 0) {
-        for (int i = 0; i < r; ++i) {
-          double vi = 0.0;
-          if (i == 0) {
-            vi = 1.0;
-          } else if (i - 1 < q) {
-            vi = theta[i - 1];
-          }
-          for (int j = 0; j < r; ++j) {
-            tmp = 0.0;
-            if (j == 0) {
-              tmp = vi;
-            } else if (j - 1 < q) {
-              tmp = vi * theta[j - 1];
-            }
-            if (i < p && j < p) {
-              tmp += phi[i] * phi[j] * P[0];
-            }
-            if (i < r - 1 && j < r - 1) {
-              tmp += P[i + 1 + r * (j + 1)];
-            }
-            if (i < p && j < r - 1) {
-              tmp += phi[i] * P[j + 1];
-            }
-            if (j < p && i < r - 1) {
-              tmp += phi[j] * P[i + 1];
-            }
-            Pnew[i + r * j] = tmp;
-          }
-        }
-      } else {
-        for (int i = 0; i < r; ++i) {
-          for (int j = 0; j < rd; ++j) {
-            tmp = 0.0;
-            if (i < p) {
-              tmp += phi[i] * P[rd * j];
-            }
-            if (i < r - 1) {
-              tmp += P[i + 1 + rd * j];
-            }
-            mm[i + rd * j] = tmp;
-          }
-        }
-        for (int j = 0; j < rd; ++j) {
-          tmp = P[rd * j];
-          for (int k = 0; k < d; ++k) {
-            tmp += delta[k] * P[r + k + rd * j];
-          }
-          mm[r + rd * j] = tmp;
-        }
-        for (int i = 1; i < d; ++i) {
-          for (int j = 0; j < rd; ++j) {
-            mm[r + i + rd * j] = P[r + i - 1 + rd * j];
-          }
-        }
-        for (int i = 0; i < r; ++i) {
-          for (int j = 0; j < rd; ++j) {
-            tmp = 0.0;
-            if (i < p) {
-              tmp += phi[i] * mm[j];
-            }
-            if (i < r - 1) {
-              tmp += mm[rd * (i + 1) + j];
-            }
-            Pnew[j + rd * i] = tmp;
-          }
-        }
-        for (int j = 0; j < rd; ++j) {
-          tmp = mm[j];
-          for (int k = 0; k < d; ++k) {
-            tmp += delta[k] * mm[rd * (r + k) + j];
-          }
-          Pnew[rd * r + j] = tmp;
+    for (int i = 0; i < r; ++i) {
+      for (int j = 0; j < rd; ++j) {
+        tmp = 0.0;
+        if (i < p) {
+          tmp += phi[i] * mm[j];
         }
-        for (int i = 1; i < d; ++i) {
-          for (int j = 0; j < rd; ++j) {
-            Pnew[rd * (r + i) + j] = mm[rd * (r + i - 1) + j];
-          }
+        if (i < r - 1) {
+          tmp += mm[rd * (i + 1) + j];
         }
-        for (int i = 0; i < q + 1; ++i) {
-          double vi;
-          if (i == 0) {
-            vi = 1.0;
-          } else {
-            vi = theta[i - 1];
-          }
-          for (int j = 0; j < q + 1; ++j) {
-            if (j == 0) {
-              Pnew[i + rd * j] += vi;
-            } else {
-              Pnew[i + rd * j] += vi * theta[j - 1];
-            }
-          }
+        Pnew[j + rd * i] = tmp;
+      }
+    }
+    for (int j = 0; j < rd; ++j) {
+      tmp = mm[j];
+      for (int k = 0; k < d; ++k) {
+        tmp += delta[k] * mm[rd * (r + k) + j];
+      }
+      Pnew[rd * r + j] = tmp;
+    }
+    for (int i = 1; i < d; ++i) {
+      for (int j = 0; j < rd; ++j) {
+        Pnew[rd * (r + i) + j] = mm[rd * (r + i - 1) + j];
+      }
+    }
+    for (int i = 0; i < q + 1; ++i) {
+      double vi;
+      if (i == 0) {
+        vi = 1.0;
+      } else {
+        vi = theta[i - 1];
+      }
+      for (int j = 0; j < q + 1; ++j) {
+        if (j == 0) {
+          Pnew[i + rd * j] += vi;
+        } else {
+          Pnew[i + rd * j] += vi * theta[j - 1];
         }
       }
     }
+  }
+}
+
+std::tuple<double, double, int>
+like(const double *y, int n, const double *phi, int p, const double *theta,
+     int q, const double *delta, int d, double *a, int rd, double *P,
+     double *Pnew, int up, bool use_resid, double *rsResid) {
+  double ssq = 0.0;
+  double sumlog = 0.0;
+  int nu = 0;
+  int r = rd - d;
+
+  std::vector<double> anew(rd);
+  std::vector<double> M(rd);
+  std::vector<double> mm;
+  if (d > 0) {
+    mm.resize(rd * rd);
+  }
+  double tmp;
+  for (int l = 0; l < n; ++l) {
+    predict_state(phi, p, delta, d, r, a, anew.data());
+    if (l > up) {
+      predict_cov(phi, p, theta, q, delta, d, r, P, Pnew, mm.data());
+    }
     if (!std::isnan(y[l])) {
       double resid = y[l] - anew[0];
       for (int i = 0; i < d; ++i) {
@@ -326,6 +346,84 @@ arima_like(const py::array_t<double> yv, const py::array_t<double> phiv,
   return {ssq, sumlog, nu};
 }
 
+std::tuple<double, double, int>
+arima_like(const py::array_t<double> yv, const py::array_t<double> phiv,
+           const py::array_t<double> thetav, const py::array_t<double> deltav,
+           py::array_t<double> av, py::array_t<double> Pv,
+           py::array_t<double> Pnewv, int up, bool use_resid,
+           py::array_t<double> rsResidv) {
+  auto y = yv.data();
+  auto phi = phiv.data();
+  auto theta = thetav.data();
+  auto delta = deltav.data();
+  auto a = av.mutable_data();
+  auto P = Pv.mutable_data();
+  auto Pnew = Pnewv.mutable_data();
+  auto rsResid = rsResidv.mutable_data();
+  py::gil_scoped_release release;
+  return like(y, static_cast<int>(yv.size()), phi,
+              static_cast<int>(phiv.size()), theta,
+              static_cast<int>(thetav.size()), delta,
+              static_cast<int>(deltav.size()), a, static_cast<int>(av.size()),
+              P, Pnew, up, use_resid, rsResid);
+}
+
+// Forecasts of the state space model and their variances (without sigma2),
+// the transition is applied with the sparse structure of T.
+void forecast(int n, const double *phi, int p, const double *theta, int q,
+              const double *delta, int d, const double *a0, int rd,
+              const double *P0, double h, double *forecasts, double *se) {
+  int r = rd - d;
+  std::vector<double> a(a0, a0 + rd);
+  std::vector<double> anew(rd);
+  std::vector<double> P(P0, P0 + rd * rd);
+  std::vector<double> Pnew(rd * rd);
+  std::vector<double> mm;
+  if (d > 0) {
+    mm.resize(rd * rd);
+  }
+  for (int l = 0; l < n; ++l) {
+    predict_state(phi, p, delta, d, r, a.data(), anew.data());
+    std::swap(a, anew);
+    double fcst = a[0];
+    for (int i = 0; i < d; ++i) {
+      fcst += delta[i] * a[r + i];
+    }
+    forecasts[l] = fcst;
+    predict_cov(phi, p, theta, q, delta, d, r, P.data(), Pnew.data(),
+                mm.data());
+    std::swap(P, Pnew);
+    // Z' P Z with Z = (1, 0, ..., 0, delta)
+    double var = P[0];
+    for (int i = 0; i < d; ++i) {
+      var += 2 * delta[i] * P[r + i];
+      for (int j = 0; j < d; ++j) {
+        var += delta[i] * delta[j] * P[(r + i) * rd + r + j];
+      }
+    }
+    se[l] = h + var;
+  }
+}
+
+std::tuple<py::array_t<double>, py::array_t<double>>
+kalman_forecast(int n, const py::array_t<double> phiv,
+                const py::array_t<double> thetav,
+                const py::array_t<double> deltav, const py::array_t<double> av,
+                const py::array_t<double> Pv, double h) {
+  py::array_t<double> forecastsv(n);
+  py::array_t<double> sev(n);
+  auto forecasts = forecastsv.mutable_data();
+  auto se = sev.mutable_data();
+  {
+    py::gil_scoped_release release;
+    forecast(n, phiv.data(), static_cast<int>(phiv.size()), thetav.data(),
+             static_cast<int>(thetav.size()), deltav.data(),
+             static_cast<int>(deltav.size()), av.data(),
+             static_cast<int>(av.size()), Pv.data(), h, forecasts, se);
+  }
+  return {forecastsv, sev};
+}
+
 void inclu2(int np, const double *xnext, double *xrow, double ynext, double *d,
             double *rbar, double *thetab) {
   std::copy(xnext, xnext + np, xrow);
@@ -362,13 +460,7 @@ void inclu2(int np, const double *xnext, double *xrow, double ynext, double *d,
   }
 }
 
-void getQ0(const py::array_t<double> phiv, const py::array_t<double> thetav,
-           py::array_t<double> resv) {
-  auto phi = phiv.data();
-  auto theta = thetav.data();
-  auto res = resv.mutable_data();
-  int p = static_cast<int>(phiv.size());
-  int q = static_cast<int>(thetav.size());
+void q0(const double *phi, int p, const double *theta, int q, double *res) {
   int r = std::max(p, q + 1);
   int np = r * (r + 1) / 2;
   int nrbar = np * (np - 1) / 2;
@@ -485,6 +577,66 @@ void getQ0(const py::array_t<double> phiv, const py::array_t<double> thetav,
   }
 }
 
+// Same covariance as q0, as the solution of the discrete Lyapunov equation
+// Q0 = T Q0 T' + R R' found with the doubling algorithm. Each step costs
+// O(r^3) and doubles the number of terms of the series that is summed,
+// while q0 needs O(r^4) time and memory, which dominates for long seasonal
+// periods.
+void q0_lyapunov(const double *phi, int p, const double *theta, int q,
+                 double *res) {
+  constexpr int max_iter = 64;
+  constexpr double tol = std::numeric_limits<double>::epsilon();
+  int r = std::max(p, q + 1);
+  Eigen::MatrixXd A = Eigen::MatrixXd::Zero(r, r);
+  for (int i = 0; i < p; ++i) {
+    A(i, 0) = phi[i];
+  }
+  for (int i = 0; i < r - 1; ++i) {
+    A(i, i + 1) = 1.0;
+  }
+  VectorXd R = VectorXd::Zero(r);
+  R(0) = 1.0;
+  for (int i = 0; i < q; ++i) {
+    R(i + 1) = theta[i];
+  }
+  Eigen::MatrixXd Q = R * R.transpose();
+  Eigen::MatrixXd AQ(r, r);
+  Eigen::MatrixXd increment(r, r);
+  for (int k = 0; k < max_iter; ++k) {
+    AQ.noalias() = A * Q;
+    increment.noalias() = AQ * A.transpose();
+    Q += increment;
+    double size = increment.cwiseAbs().maxCoeff();
+    if (!std::isfinite(size) || size <= tol * Q.cwiseAbs().maxCoeff()) {
+      break;
+    }
+    AQ.noalias() = A * A;
+    A.swap(AQ);
+  }
+  Eigen::Map<RowMajorMatrixXd>(res, r, r) = Q;
+}
+
+void getQ0_lyapunov(const py::array_t<double> phiv,
+                    const py::array_t<double> thetav,
+                    py::array_t<double> resv) {
+  auto phi = phiv.data();
+  auto theta = thetav.data();
+  auto res = resv.mutable_data();
+  py::gil_scoped_release release;
+  q0_lyapunov(phi, static_cast<int>(phiv.size()), theta,
+              static_cast<int>(thetav.size()), res);
+}
+
+void getQ0(const py::array_t<double> phiv, const py::array_t<double> thetav,
+           py::array_t<double> resv) {
+  auto phi = phiv.data();
+  auto theta = thetav.data();
+  auto res = resv.mutable_data();
+  py::gil_scoped_release release;
+  q0(phi, static_cast<int>(phiv.size()), theta,
+     static_cast<int>(thetav.size()), res);
+}
+
 py::array_t<double> arima_gradtrans(const py::array_t<double> xv,
                                     const py::array_t<int> armav) {
   constexpr double eps = 1e-3;
@@ -553,10 +705,7 @@ py::array_t<double> arima_undopars(const py::array_t<double> xv,
   return outv;
 }
 
-void invpartrans(int p, const py::array_t<double> phiv,
-                 py::array_t<double> outv) {
-  auto phi = phiv.data();
-  auto out = outv.mutable_data();
+void invpartrans(int p, const double *phi, double *out) {
   std::copy(phi, phi + p, out);
   std::vector<double> work(phi, phi + p);
   for (int j = p - 1; j > 0; --j) {
@@ -571,14 +720,545 @@ void invpartrans(int p, const py::array_t<double> phiv,
   }
 }
 
+void invpartrans(int p, const py::array_t<double> phiv,
+                 py::array_t<double> outv) {
+  invpartrans(p, phiv.data(), outv.mutable_data());
+}
+
+// Objective minimized by arima: half the log of the conditional sum of
+// squares (CSS) or the concentrated gaussian log-likelihood (ML).
+// With reset_state the filter starts from the initial covariance in every
+// evaluation, as in R. Otherwise only the stationary block is reset and the
+// rest of the covariance is kept from the previous evaluation. The stationary
+// block is computed with q0_lyapunov if lyapunov is true, q0 otherwise.
+class ArimaObjective {
+public:
+  ArimaObjective(const VectorXd &coef, const Eigen::VectorX<bool> &mask,
+                 const VectorXd &x, const RowMajorMatrixXd &xreg,
+                 const int *arma, const VectorXd &delta, double kappa,
+                 bool trans, bool use_css, bool reset_state, bool lyapunov)
+      : par_(coef), mask_(mask), x_(x), xreg_(xreg), arma_(arma, arma + 7),
+        delta_(delta), kappa_(kappa), trans_(trans), use_css_(use_css),
+        reset_state_(reset_state), lyapunov_(lyapunov) {
+    p_ = arma[0] + arma[4] * arma[2];
+    q_ = arma[1] + arma[4] * arma[3];
+    r_ = std::max(p_, q_ + 1);
+    rd_ = r_ + static_cast<int>(delta.size());
+    phi_.resize(p_);
+    theta_.resize(q_);
+    w_.resize(x.size());
+    if (use_css) {
+      resid_.resize(x.size());
+    } else {
+      a_.resize(rd_);
+      P_.resize(rd_ * rd_);
+      Pn_.resize(rd_ * rd_);
+      Q0_.resize(r_ * r_);
+    }
+  }
+
+  double operator()(const VectorXd &p) {
+    for (Eigen::Index i = 0, k = 0; i < par_.size(); ++i) {
+      if (mask_(i)) {
+        par_(i) = p(k++);
+      }
+    }
+    transpar(par_.data(), static_cast<int>(par_.size()), arma_.data(), trans_,
+             phi_.data(), theta_.data());
+    w_ = x_;
+    if (xreg_.cols() > 0) {
+      w_.noalias() -= xreg_ * par_.tail(xreg_.cols());
+    }
+    int n = static_cast<int>(w_.size());
+    if (use_css_) {
+      double res = css(w_.data(), n, arma_.data(), phi_.data(), p_,
+                       theta_.data(), q_, resid_.data());
+      if (std::isinf(res)) {
+        return std::numeric_limits<double>::max();
+      }
+      if (res <= 0.0) {
+        return -std::numeric_limits<double>::infinity();
+      }
+      return 0.5 * std::log(res);
+    }
+    std::fill(a_.begin(), a_.end(), 0.0);
+    if (reset_state_ || !initialized_) {
+      std::fill(P_.begin(), P_.end(), 0.0);
+      std::fill(Pn_.begin(), Pn_.end(), 0.0);
+      for (int i = r_; i < rd_; ++i) {
+        Pn_[i * rd_ + i] = kappa_;
+      }
+      initialized_ = true;
+    }
+    if (r_ > 1) {
+      std::fill(Q0_.begin(), Q0_.end(), 0.0);
+      if (lyapunov_) {
+        q0_lyapunov(phi_.data(), p_, theta_.data(), q_, Q0_.data());
+      } else {
+        q0(phi_.data(), p_, theta_.data(), q_, Q0_.data());
+      }
+      for (int i = 0; i < r_; ++i) {
+        std::copy(Q0_.begin() + i * r_, Q0_.begin() + (i + 1) * r_,
+                  Pn_.begin() + i * rd_);
+      }
+    } else {
+      Pn_[0] = p_ > 0 ? 1.0 / (1.0 - phi_[0] * phi_[0]) : 1.0;
+    }
+    auto [ssq, sumlog, nu] =
+        like(w_.data(), n, phi_.data(), p_, theta_.data(), q_, delta_.data(),
+             static_cast<int>(delta_.size()), a_.data(), rd_, P_.data(),
+             Pn_.data(), 0, false, nullptr);
+    if (nu == 0) {
+      return std::numeric_limits<double>::infinity();
+    }
+    double s2 = ssq / nu;
+    if (s2 <= 0) {
+      return std::numeric_limits<double>::quiet_NaN();
+    }
+    return 0.5 * (std::log(s2) + sumlog / nu);
+  }
+
+private:
+  VectorXd par_;
+  Eigen::VectorX<bool> mask_;
+  VectorXd x_;
+  RowMajorMatrixXd xreg_;
+  std::vector<int> arma_;
+  VectorXd delta_;
+  double kappa_;
+  bool trans_;
+  bool use_css_;
+  bool reset_state_;
+  bool lyapunov_;
+  bool initialized_ = false;
+  int p_, q_, r_, rd_;
+  VectorXd w_;
+  std::vector<double> phi_, theta_, resid_, a_, P_, Pn_, Q0_;
+};
+
+// Minimizes the CSS or ML objective with R's BFGS over the parameters divided
+// by parscale. If hessian is true the inverse of the numerical Hessian at the
+// optimum is returned, otherwise the BFGS approximation to it.
+std::tuple<VectorXd, double, int, RowMajorMatrixXd>
+optimize(const VectorXd &x0, const VectorXd &parscale, const VectorXd &coef,
+         const Eigen::VectorX<bool> &mask, const VectorXd &x,
+         const RowMajorMatrixXd &xreg, const int *arma, const VectorXd &delta,
+         double kappa, bool trans, bool use_css, int max_iter, double reltol,
+         bool hessian, bool lyapunov) {
+  constexpr double ndeps = 1e-3;
+  ArimaObjective objective(coef, mask, x, xreg, arma, delta, kappa, trans,
+                           use_css, true, lyapunov);
+  auto F = [&objective, &parscale](const VectorXd &z) {
+    return objective(z.cwiseProduct(parscale));
+  };
+  auto [z, fmin, status, B] =
+      bfgs::Minimize(F, x0.cwiseQuotient(parscale), max_iter, reltol, ndeps);
+  RowMajorMatrixXd hess_inv = B;
+  if (hessian) {
+    Eigen::MatrixXd H = bfgs::Hessian(F, z, ndeps);
+    Eigen::FullPivLU<Eigen::MatrixXd> lu(H);
+    if (H.allFinite() && lu.isInvertible()) {
+      hess_inv = lu.inverse();
+    }
+  }
+  hess_inv = parscale.asDiagonal() * hess_inv * parscale.asDiagonal();
+  return {z.cwiseProduct(parscale), fmin, status, hess_inv};
+}
+
+void difference(VectorXd &x, int lag, int differences) {
+  for (int _ = 0; _ < differences; ++_) {
+    Eigen::Index m = x.size() - lag;
+    x.head(m) = (x.tail(m) - x.head(m)).eval();
+    x.conservativeResize(m);
+  }
+}
+
+bool in_bounds(const std::vector<double> &phi) {
+  return std::all_of(phi.begin(), phi.end(), [](double v) {
+    return v > -M_PI / 2 && v < M_PI / 2;
+  });
+}
+
+// Fits the same specification to every serie of y (delimited by indptr) as
+// arima does with the native optimizer, with method CSS-ML (ML if use_css is
+// false) and no missing values, and forecasts h steps ahead. The only
+// regressor is an intercept (xreg_type=1) or a drift (xreg_type=2).
+// lyapunov selects the initial covariance as in ArimaObjective.
+// Returns the forecasts and their standard errors of shape (n_series, h),
+// the insample fitted values and sigma2 of each serie.
+std::tuple<RowMajorMatrixXd, RowMajorMatrixXd, VectorXd, VectorXd>
+fit_forecast_batch(const VectorXd &y, const Eigen::VectorXi &indptr,
+                   const std::vector<int> &arma, const VectorXd &delta,
+                   int xreg_type, bool use_css, int h, double kappa,
+                   int max_iter, double reltol, bool lyapunov) {
+  auto n_series = indptr.size() - 1;
+  int mp = arma[0];
+  int mq = arma[1];
+  int msp = arma[2];
+  int narma = mp + mq + msp + arma[3];
+  int ncxreg = xreg_type > 0 ? 1 : 0;
+  int npar = narma + ncxreg;
+  int p = mp + arma[4] * msp;
+  int q = mq + arma[4] * arma[3];
+  int r = std::max(p, q + 1);
+  int d = static_cast<int>(delta.size());
+  int rd = r + d;
+  int ndiff = arma[5] + arma[4] * arma[6];
+
+  RowMajorMatrixXd mean(n_series, h);
+  RowMajorMatrixXd se(n_series, h);
+  VectorXd fitted(y.size());
+  VectorXd sigma2(n_series);
+  // buffers shared by all the series
+  Eigen::VectorX<bool> mask = Eigen::VectorX<bool>::Constant(npar, true);
+  VectorXd coef = VectorXd::Constant(npar, std::numeric_limits<double>::quiet_NaN());
+  VectorXd parscale(npar);
+  VectorXd init(npar);
+  VectorXd candidate(npar);
+  std::vector<double> phi(p);
+  std::vector<double> theta(r - 1);
+  std::vector<double> a(rd);
+  std::vector<double> P(rd * rd);
+  std::vector<double> Pn(rd * rd);
+  std::vector<double> Q0(r * r);
+  std::vector<double> resid;
+  for (Eigen::Index i = 0; i < n_series; ++i) {
+    int n = indptr[i + 1] - indptr[i];
+    if (n <= ndiff) {
+      throw std::invalid_argument("Not enough data to fit the model");
+    }
+    VectorXd x = y.segment(indptr[i], n);
+    if ((x.array() == x(0)).all()) {
+      // the fit is degenerate, forecast_arima repeats the value
+      fitted.segment(indptr[i], n) = x;
+      sigma2(i) = 0.0;
+      mean.row(i).setConstant(x(0));
+      se.row(i).setZero();
+      continue;
+    }
+    RowMajorMatrixXd xreg(n, ncxreg);
+    init.setZero();
+    parscale.setOnes();
+    if (ncxreg > 0) {
+      for (int t = 0; t < n; ++t) {
+        xreg(t, 0) = xreg_type == 1 ? 1.0 : t + 1.0;
+      }
+      // least squares fit of the differenced series on the differenced regressor
+      VectorXd dx = x;
+      VectorXd dxreg = xreg.col(0);
+      difference(dx, 1, arma[5]);
+      difference(dxreg, 1, arma[5]);
+      if (arma[4] > 1) {
+        difference(dx, arma[4], arma[6]);
+        difference(dxreg, arma[4], arma[6]);
+      }
+      double sxx = dxreg.squaredNorm();
+      double beta = dxreg.dot(dx) / sxx;
+      double ssr = (dx - beta * dxreg).squaredNorm();
+      init(narma) = beta;
+      parscale(narma) = 10 * std::sqrt(ssr / (dx.size() - 1) / sxx);
+    }
+    if (use_css) {
+      auto [z, fmin, status, B] =
+          optimize(init, parscale, coef, mask, x, xreg, arma.data(), delta,
+                   kappa, false, true, max_iter, reltol, false, lyapunov);
+      transpar(z.data(), npar, arma.data(), true, phi.data(), theta.data());
+      if (in_bounds(phi)) {
+        init = z;
+      }
+    }
+    candidate = init;
+    if (mp > 0) {
+      invpartrans(mp, init.data(), candidate.data());
+    }
+    if (msp > 0) {
+      invpartrans(msp, init.data() + mp + mq, candidate.data() + mp + mq);
+    }
+    transpar(candidate.data(), npar, arma.data(), true, phi.data(),
+             theta.data());
+    if (in_bounds(phi)) {
+      init = candidate;
+    }
+    auto [z, fmin, status, B] =
+        optimize(init, parscale, coef, mask, x, xreg, arma.data(), delta,
+                 kappa, true, false, max_iter, reltol, false, lyapunov);
+    VectorXd par = z;
+    if (mp > 0) {
+      partrans(mp, z.data(), par.data());
+    }
+    if (msp > 0) {
+      partrans(msp, z.data() + mp + mq, par.data() + mp + mq);
+    }
+    std::fill(theta.begin(), theta.end(), 0.0);
+    transpar(par.data(), npar, arma.data(), false, phi.data(), theta.data());
+
+    // initial state of the fitted model, as in make_arima
+    std::fill(a.begin(), a.end(), 0.0);
+    std::fill(P.begin(), P.end(), 0.0);
+    std::fill(Pn.begin(), Pn.end(), 0.0);
+    if (r > 1) {
+      std::fill(Q0.begin(), Q0.end(), 0.0);
+      if (lyapunov) {
+        q0_lyapunov(phi.data(), p, theta.data(), r - 1, Q0.data());
+      } else {
+        q0(phi.data(), p, theta.data(), r - 1, Q0.data());
+      }
+      for (int j = 0; j < r; ++j) {
+        std::copy(Q0.begin() + j * r, Q0.begin() + (j + 1) * r,
+                  Pn.begin() + j * rd);
+      }
+    } else {
+      Pn[0] = p > 0 ? 1.0 / (1.0 - phi[0] * phi[0]) : 1.0;
+    }
+    for (int j = r; j < rd; ++j) {
+      Pn[j * rd + j] = kappa;
+    }
+    VectorXd w = x;
+    if (ncxreg > 0) {
+      w -= xreg.col(0) * par(narma);
+    }
+    resid.resize(n);
+    like(w.data(), n, phi.data(), p, theta.data(), r - 1, delta.data(), d,
+         a.data(), rd, P.data(), Pn.data(), 0, true, resid.data());
+    double ssq = 0.0;
+    for (int t = 0; t < n; ++t) {
+      fitted(indptr[i] + t) = x(t) - resid[t];
+      if (!std::isnan(resid[t])) {
+        ssq += resid[t] * resid[t];
+      }
+    }
+    sigma2(i) = ssq / (n - ndiff - npar);
+    forecast(h, phi.data(), p, theta.data(), r - 1, delta.data(), d, a.data(),
+             rd, P.data(), 0.0, mean.row(i).data(), se.row(i).data());
+    for (int l = 0; l < h; ++l) {
+      if (xreg_type == 1) {
+        mean(i, l) += par(narma);
+      } else if (xreg_type == 2) {
+        mean(i, l) += par(narma) * (n + l + 1);
+      }
+      se(i, l) = std::sqrt(se(i, l) * sigma2(i));
+    }
+  }
+  return {mean, se, fitted, sigma2};
+}
+
+// KPSS statistic for level stationarity with a Bartlett window of nlags,
+// as computed by statsmodels' kpss with regression='c'.
+double kpss(const py::array_t<double> xv, int nlags) {
+  auto x = xv.data();
+  int n = static_cast<int>(xv.size());
+  py::gil_scoped_release release;
+  double mean = 0.0;
+  for (int i = 0; i < n; ++i) {
+    mean += x[i];
+  }
+  mean /= n;
+  std::vector<double> resid(n);
+  double eta = 0.0;
+  double cumsum = 0.0;
+  double s_hat = 0.0;
+  for (int i = 0; i < n; ++i) {
+    resid[i] = x[i] - mean;
+    cumsum += resid[i];
+    eta += cumsum * cumsum;
+    s_hat += resid[i] * resid[i];
+  }
+  eta /= static_cast<double>(n) * n;
+  for (int i = 1; i <= nlags; ++i) {
+    double prod = 0.0;
+    for (int j = i; j < n; ++j) {
+      prod += resid[j] * resid[j - i];
+    }
+    s_hat += 2 * prod * (1.0 - i / (nlags + 1.0));
+  }
+  return eta / (s_hat / n);
+}
+
+// Non robust STL with all the jumps set to 1, ported from the NETLIB code.
+double stl_est(const double *y, int n, int len, int ideg, int xs, int nleft,
+               int nright, double *w) {
+  double rng = n - 1.0;
+  double h = std::max(xs - nleft, nright - xs);
+  if (len > n) {
+    h += (len - n) / 2;
+  }
+  double h9 = 0.999 * h;
+  double h1 = 0.001 * h;
+  double a = 0.0;
+  for (int j = nleft - 1; j < nright; ++j) {
+    w[j] = 0.0;
+    double r = std::fabs(j + 1.0 - xs);
+    if (r <= h9) {
+      if (r <= h1) {
+        w[j] = 1.0;
+      } else {
+        double u = r / h;
+        double v = 1.0 - u * u * u;
+        w[j] = v * v * v;
+      }
+      a += w[j];
+    }
+  }
+  if (a <= 0) {
+    return NAN;
+  }
+  for (int j = nleft - 1; j < nright; ++j) {
+    w[j] /= a;
+  }
+  if (h > 0 && ideg > 0) {
+    a = 0.0;
+    for (int j = nleft - 1; j < nright; ++j) {
+      a += w[j] * (j + 1);
+    }
+    double b = xs - a;
+    double c = 0.0;
+    for (int j = nleft - 1; j < nright; ++j) {
+      c += w[j] * (j + 1 - a) * (j + 1 - a);
+    }
+    if (std::sqrt(c) > 0.001 * rng) {
+      b /= c;
+      for (int j = nleft - 1; j < nright; ++j) {
+        w[j] *= b * (j + 1 - a) + 1.0;
+      }
+    }
+  }
+  double ys = 0.0;
+  for (int j = nleft - 1; j < nright; ++j) {
+    ys += w[j] * y[j];
+  }
+  return ys;
+}
+
+void stl_ess(const double *y, int n, int len, int ideg, double *ys,
+             double *res) {
+  if (n < 2) {
+    ys[0] = y[0];
+    return;
+  }
+  int nleft = 1;
+  int nright = std::min(len, n);
+  int nsh = (len + 2) / 2;
+  for (int i = 0; i < n; ++i) {
+    if (len < n && i + 1 > nsh && nright != n) {
+      nleft++;
+      nright++;
+    }
+    ys[i] = stl_est(y, n, len, ideg, i + 1, nleft, nright, res);
+    if (std::isnan(ys[i])) {
+      ys[i] = y[i];
+    }
+  }
+}
+
+void stl_ma(const double *x, int n, int len, double *ave) {
+  double v = 0.0;
+  for (int i = 0; i < len; ++i) {
+    v += x[i];
+  }
+  ave[0] = v / len;
+  for (int j = 1, k = len, m = 0; j < n - len + 1; ++j, ++k, ++m) {
+    v += x[k] - x[m];
+    ave[j] = v / len;
+  }
+}
+
+void stl_ss(const double *y, int n, int np, int ns, int isdeg, double *season,
+            double *work1, double *work2, double *work3) {
+  for (int j = 0; j < np; ++j) {
+    int k = (n - (j + 1)) / np + 1;
+    for (int i = 0; i < k; ++i) {
+      work1[i] = y[i * np + j];
+    }
+    stl_ess(work1, k, ns, isdeg, work2 + 1, work3);
+    int nright = std::min(ns, k);
+    work2[0] = stl_est(work1, k, ns, isdeg, 0, 1, nright, work3);
+    if (std::isnan(work2[0])) {
+      work2[0] = work2[1];
+    }
+    int nleft = std::max(1, k - ns + 1);
+    work2[k + 1] = stl_est(work1, k, ns, isdeg, k + 1, nleft, k, work3);
+    if (std::isnan(work2[k + 1])) {
+      work2[k + 1] = work2[k];
+    }
+    for (int m = 0; m < k + 2; ++m) {
+      season[m * np + j] = work2[m];
+    }
+  }
+}
+
+std::tuple<py::array_t<double>, py::array_t<double>>
+stl(const py::array_t<double> yv, int np, int ns, int nt, int nl, int isdeg,
+    int itdeg, int ildeg, int inner_iter) {
+  auto y = yv.data();
+  int n = static_cast<int>(yv.size());
+  py::array_t<double> seasonv(n);
+  py::array_t<double> trendv(n);
+  auto season = seasonv.mutable_data();
+  auto trend = trendv.mutable_data();
+  py::gil_scoped_release release;
+  std::fill(trend, trend + n, 0.0);
+  std::vector<double> work(5 * (n + 2 * np));
+  std::array<double *, 5> w;
+  for (int i = 0; i < 5; ++i) {
+    w[i] = work.data() + i * (n + 2 * np);
+  }
+  for (int it = 0; it < inner_iter; ++it) {
+    for (int i = 0; i < n; ++i) {
+      w[0][i] = y[i] - trend[i];
+    }
+    stl_ss(w[0], n, np, ns, isdeg, w[1], w[2], w[3], season);
+    stl_ma(w[1], n + 2 * np, np, w[2]);
+    stl_ma(w[2], n + np + 1, np, w[0]);
+    stl_ma(w[0], n + 2, 3, w[2]);
+    stl_ess(w[2], n, nl, ildeg, w[0], w[4]);
+    for (int i = 0; i < n; ++i) {
+      season[i] = w[1][np + i] - w[0][i];
+      w[0][i] = y[i] - season[i];
+    }
+    stl_ess(w[0], n, nt, itdeg, trend, w[2]);
+  }
+  return {seasonv, trendv};
+}
+
 void init(py::module_ &m) {
   py::module_ arima = m.def_submodule("arima");
   arima.def("arima_css", &arima_css);
   arima.def("arima_like", &arima_like);
+  arima.def("kalman_forecast", &kalman_forecast);
   arima.def("getQ0", &getQ0);
+  arima.def("getQ0_lyapunov", &getQ0_lyapunov);
   arima.def("arima_gradtrans", &arima_gradtrans);
   arima.def("arima_undopars", &arima_undopars);
-  arima.def("invpartrans", &invpartrans);
+  arima.def("invpartrans",
+            py::overload_cast<int, const py::array_t<double>,
+                              py::array_t<double>>(&invpartrans));
   arima.def("arima_transpar", &arima_transpar);
+  arima.def("kpss", &kpss);
+  arima.def("stl", &stl);
+  arima.def("fit_forecast_batch", &fit_forecast_batch,
+            py::call_guard<py::gil_scoped_release>());
+  py::class_<ArimaObjective>(arima, "ArimaObjective")
+      .def(py::init([](const VectorXd &coef, const Eigen::VectorX<bool> &mask,
+                       const VectorXd &x, const RowMajorMatrixXd &xreg,
+                       const py::array_t<int> armav, const VectorXd &delta,
+                       double kappa, bool trans, bool use_css, bool reset_state,
+                       bool lyapunov) {
+        return ArimaObjective(coef, mask, x, xreg, armav.data(), delta, kappa,
+                              trans, use_css, reset_state, lyapunov);
+      }))
+      .def("__call__", &ArimaObjective::operator(),
+           py::call_guard<py::gil_scoped_release>());
+  arima.def(
+      "optimize",
+      [](const VectorXd &x0, const VectorXd &parscale, const VectorXd &coef,
+         const Eigen::VectorX<bool> &mask, const VectorXd &x,
+         const RowMajorMatrixXd &xreg, const py::array_t<int> armav,
+         const VectorXd &delta, double kappa, bool trans, bool use_css,
+         int max_iter, double reltol, bool hessian, bool lyapunov) {
+        return optimize(x0, parscale, coef, mask, x, xreg, armav.data(), delta,
+                        kappa, trans, use_css, max_iter, reltol, hessian,
+                        lyapunov);
+      },
+      py::call_guard<py::gil_scoped_release>());
 }
 } // namespace arima
@@ -5,6 +5,10 @@
 namespace ets {
 namespace py = pybind11;
 using Eigen::VectorXd;
+using RowMajorMatrixXd =
+    Eigen::Matrix<double, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
+using RowMajorMatrixXi =
+    Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
 
 enum class Component {
   Nothing = 0,
@@ -18,6 +22,11 @@ enum class Criterion {
   Sigma = 3,
   MAE = 4,
 };
+enum class InformationCriterion {
+  AIC = 0,
+  BIC = 1,
+  AICC = 2,
+};
 constexpr double HUGE_N = 1e10;
 constexpr double NA = -99999.0;
 constexpr double TOL = 1e-10;
@@ -301,6 +310,170 @@ Optimize(const Eigen::Ref<const VectorXd> &x0,
                         opt_gamma, opt_phi, alpha, beta, gamma, phi);
 }
 
+// Simulates sample paths of the model starting from the state x, the errors
+// of each path are the rows of e. Returns the simulated values with one path
+// per row. If the forecast of a step can't be computed the path stops and its
+// first value is set to NA.
+RowMajorMatrixXd Simulate(const Eigen::Ref<const VectorXd> &x, int m,
+                          Component error, Component trend, Component season,
+                          double alpha, double beta, double gamma, double phi,
+                          const Eigen::Ref<const RowMajorMatrixXd> &e) {
+  m = std::max(m, 1);
+  auto n_paths = e.rows();
+  auto h = e.cols();
+  bool has_trend = trend != Component::Nothing;
+  bool has_season = season != Component::Nothing;
+  RowMajorMatrixXd y = RowMajorMatrixXd::Zero(n_paths, h);
+  std::vector<double> s(m);
+  std::vector<double> old_s(m);
+  std::vector<double> f(1);
+  for (Eigen::Index k = 0; k < n_paths; ++k) {
+    // copy initial state components
+    double l = x[0];
+    double b = has_trend ? x[1] : 0.0;
+    double old_l;
+    double old_b = 0.0;
+    if (has_season) {
+      std::copy(x.data() + 1 + has_trend, x.data() + 1 + has_trend + m,
+                s.begin());
+    }
+    for (Eigen::Index i = 0; i < h; ++i) {
+      // copy previous state
+      old_l = l;
+      if (has_trend) {
+        old_b = b;
+      }
+      if (has_season) {
+        std::copy(s.begin(), s.end(), old_s.begin());
+      }
+      // one step forecast
+      Forecast<std::vector<double> &, const std::vector<double> &>(
+          f, old_l, old_b, old_s, m, trend, season, phi, 1);
+      if (std::abs(f[0] - NA) < TOL) {
+        y(k, 0) = NA;
+        break;
+      }
+      if (error == Component::Additive) {
+        y(k, i) = f[0] + e(k, i);
+      } else {
+        y(k, i) = f[0] * (1.0 + e(k, i));
+      }
+      // update state
+      std::tie(l, b) =
+          Update<std::vector<double> &, const std::vector<double> &>(
+              s, l, b, old_l, old_b, old_s, m, trend, season, alpha, beta,
+              gamma, phi, y(k, i));
+    }
+  }
+  return y;
+}
+
+// Fits the candidate models of ets_f on the same series, as etsmodel does for
+// each of them, and selects the one with the lowest information criterion.
+// The starting point and bounds of the i-th candidate are in
+// [indptr[i], indptr[i + 1]) of x0, lower and upper, its components are the
+// i-th row of components (error, trend, season, damped) and its optimized
+// smoothing parameters and fixed values the i-th rows of opt and fixed, in
+// the order alpha, beta, gamma, phi. Candidates with too many parameters for
+// the size of the series are not fitted.
+// Returns the optimized parameters (with the layout of x0), the objective
+// value and number of iterations of each candidate, their loglik, aic, bic,
+// aicc, mse and amse, and the index of the best candidate (-1 if none).
+std::tuple<VectorXd, VectorXd, Eigen::VectorXi, RowMajorMatrixXd, int>
+Select(const Eigen::Ref<const VectorXd> &y,
+       const Eigen::Ref<const Eigen::VectorXi> &indptr,
+       const Eigen::Ref<const VectorXd> &x0,
+       const Eigen::Ref<const VectorXd> &lower,
+       const Eigen::Ref<const VectorXd> &upper,
+       const Eigen::Ref<const RowMajorMatrixXi> &components,
+       const Eigen::Ref<const Eigen::VectorXi> &n_states,
+       const Eigen::Ref<const Eigen::VectorXi> &ms,
+       const Eigen::Ref<const RowMajorMatrixXi> &opt,
+       const Eigen::Ref<const RowMajorMatrixXd> &fixed, Criterion opt_crit,
+       int n_mse, InformationCriterion ic, double tol_std, int max_iter,
+       bool adaptive) {
+  constexpr double inf = std::numeric_limits<double>::infinity();
+  constexpr double nan = std::numeric_limits<double>::quiet_NaN();
+  auto n = y.size();
+  auto n_candidates = indptr.size() - 1;
+  VectorXd x = x0;
+  VectorXd fn = VectorXd::Constant(n_candidates, inf);
+  Eigen::VectorXi nit = Eigen::VectorXi::Zero(n_candidates);
+  RowMajorMatrixXd ics(n_candidates, 6);
+  VectorXd a_mse(30);
+  VectorXd e(n);
+  VectorXd state;
+  int best = -1;
+  double best_ic = inf;
+  for (Eigen::Index i = 0; i < n_candidates; ++i) {
+    int start = indptr[i];
+    int n_params = indptr[i + 1] - start;
+    if (n_params >= n - 1) {
+      ics.row(i) << nan, inf, inf, inf, inf, inf;
+      continue;
+    }
+    auto error = static_cast<Component>(components(i, 0));
+    auto trend = static_cast<Component>(components(i, 1));
+    auto season = static_cast<Component>(components(i, 2));
+    bool damped = components(i, 3);
+    int n_state = n_states[i];
+    int m = ms[i];
+    auto [par, fmin, iters] =
+        Optimize(x0.segment(start, n_params), y, n_state, error, trend,
+                 season, opt_crit, n_mse, m, opt(i, 0), opt(i, 1), opt(i, 2),
+                 opt(i, 3), fixed(i, 0), fixed(i, 1), fixed(i, 2), fixed(i, 3),
+                 lower.segment(start, n_params),
+                 upper.segment(start, n_params), tol_std, max_iter, adaptive);
+    x.segment(start, n_params) = par;
+    fn[i] = fmin;
+    nit[i] = iters;
+
+    // smoothing parameters in the order of etsmodel
+    int j = 0;
+    double alpha = par[j++];
+    double beta = 0.0;
+    double gamma = 0.0;
+    double phi = 1.0;
+    if (trend != Component::Nothing) {
+      beta = par[j++];
+    }
+    if (season != Component::Nothing) {
+      gamma = par[j++];
+    }
+    if (damped) {
+      phi = par[j];
+    }
+    int p = n_state + (season != Component::Nothing);
+    state.setZero(p * (n + 1));
+    state.head(n_state) = par.tail(n_state);
+    if (season != Component::Nothing) {
+      int first = 1 + (trend != Component::Nothing);
+      state[n_state] =
+          static_cast<double>(m * (season == Component::Multiplicative)) -
+          state.segment(first, n_state - first).sum();
+    }
+    double lik = Calc<VectorXd &, const Eigen::Ref<const VectorXd> &>(
+        state, e, a_mse, n_mse, y, error, trend, season, alpha, beta, gamma,
+        phi, m);
+    if (std::abs(lik - NA) < 1e-7) {
+      lik = nan;
+    }
+    double np = n_params + 1;
+    double aic = lik + 2 * np;
+    double bic = lik + std::log(static_cast<double>(n)) * np;
+    double aicc = n - np - 1 != 0.0 ? aic + 2 * np * (np + 1) / (n - np - 1)
+                                    : inf;
+    ics.row(i) << -0.5 * lik, aic, bic, aicc, a_mse[0],
+        a_mse.head(n_mse).mean();
+    double value = ics(i, 1 + static_cast<int>(ic));
+    if (!std::isnan(value) && value < best_ic) {
+      best = static_cast<int>(i);
+      best_ic = value;
+    }
+  }
+  return {x, fn, nit, ics, best};
+}
+
 void init(py::module_ &m) {
   py::module_ ets = m.def_submodule("ets");
   ets.attr("HUGE_N") = HUGE_N;
@@ -316,12 +489,23 @@ void init(py::module_ &m) {
       .value("AMSE", Criterion::AMSE)
       .value("Sigma", Criterion::Sigma)
       .value("MAE", Criterion::MAE);
+  py::enum_<InformationCriterion>(ets, "InformationCriterion")
+      .value("AIC", InformationCriterion::AIC)
+      .value("BIC", InformationCriterion::BIC)
+      .value("AICC", InformationCriterion::AICC);
+  // the arguments are converted before releasing the GIL and the results
+  // after acquiring it again, the computations only touch native buffers
   ets.def("update",
-          &Update<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>);
+          &Update<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>,
+          py::call_guard<py::gil_scoped_release>());
   ets.def("forecast",
-          &Forecast<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>);
+          &Forecast<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>,
+          py::call_guard<py::gil_scoped_release>());
   ets.def("calc",
-          &Calc<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>);
-  ets.def("optimize", &Optimize);
+          &Calc<Eigen::Ref<VectorXd>, const Eigen::Ref<const VectorXd> &>,
+          py::call_guard<py::gil_scoped_release>());
+  ets.def("optimize", &Optimize, py::call_guard<py::gil_scoped_release>());
+  ets.def("simulate", &Simulate, py::call_guard<py::gil_scoped_release>());
+  ets.def("select", &Select, py::call_guard<py::gil_scoped_release>());
 }
 } // namespace ets